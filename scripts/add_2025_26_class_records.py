@@ -4,64 +4,44 @@ Add 2025-26 class records to class_records_history.json
 """
 
 import json
-import re
 from pathlib import Path
 
+from ranked_entries import load_entries
+from time_parser import parse_hundredths
+
 # Project root (parent of scripts/ directory)
 PROJECT_ROOT = Path(__file__).parent.parent
 
+GRADE_ABBREVIATIONS = {
+    'Freshman': 'FR',
+    'Sophomore': 'SO',
+    'Junior': 'JR',
+    'Senior': 'SR'
+}
+
 
 def parse_records_file(filepath, gender):
-    """Parse a records markdown file and extract all 2025-26 class records"""
+    """Get all 2025-26 class records from a records file's entries"""
     records = []
     
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    # Find all event sections
-    event_pattern = r'### (.+?)\n\n\|.*?\|\n\|[-:\|\s]+\|\n((?:\|[^\n]+\n?)+)'
-    
-    for match in re.finditer(event_pattern, content, re.MULTILINE):
-        event_name = match.group(1).strip()
-        table_rows = match.group(2).strip()
+    for entry in load_entries(filepath):
+        if entry['grade_group'] not in GRADE_ABBREVIATIONS:
+            continue
         
-        for row in table_rows.split('\n'):
-            if not row.strip() or row.startswith('|--') or '**Open**' in row:
-                continue
-            
-            # Parse: | Grade | Time | Athlete | Date | Meet |
-            parts = [p.strip() for p in row.split('|')[1:-1]]
-            if len(parts) < 5:
-                continue
-            
-            grade = parts[0].strip()
-            time = parts[1].strip()
-            athlete = parts[2].strip()
-            date = parts[3].strip()
-            meet = parts[4].strip()
-            
-            # Only include 2025 records
-            if '2025' in date:
-                # Map grade to abbreviation
-                grade_map = {
-                    'Freshman': 'FR',
-                    'Sophomore': 'SO',
-                    'Junior': 'JR',
-                    'Senior': 'SR'
-                }
-                grade_abbr = grade_map.get(grade, grade)
-                
-                records.append({
-                    'season': '2025-26',
-                    'gender': gender,
-                    'event': event_name,
-                    'grade': grade_abbr,
-                    'time': time,
-                    'name': athlete,
-                    'date': date,
-                    'meet': meet,
-                    'previous': None  # Will be populated by looking up previous holder
-                })
+        # Only include 2025 records
+        if '2025' in entry['date_display']:
+            records.append({
+                'season': '2025-26',
+                'gender': gender,
+                'event': entry['event'],
+                'grade': GRADE_ABBREVIATIONS[entry['grade_group']],
+                'time': entry['time'],
+                'time_hundredths': entry['time_hundredths'],
+                'name': entry['athlete'],
+                'date': entry['date_display'],
+                'meet': entry['meet'],
+                'previous': None  # Will be populated by looking up previous holder
+            })
     
     return records
 
@@ -87,6 +67,7 @@ def find_previous_record(class_records, gender, event, grade, new_time, new_name
     prev = candidates[0]
     return {
         'time': prev.get('time'),
+        'time_hundredths': parse_hundredths(prev.get('time')),
         'name': prev.get('name'),
         'date': prev.get('date'),
         'season': prev.get('season'),
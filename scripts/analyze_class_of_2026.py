@@ -5,13 +5,25 @@ Analyze Class of 2026 seniors' complete swimming history
 - Get first and last times in each event
 - Calculate time drops
 - Identify all records they hold
+
+Each swimmer's season bests come from their precomputed profile
+(swimmer_profiles.py) instead of scanning every season's top 10 list.
 """
 
-import re
 import json
 from pathlib import Path
 from datetime import datetime
 
+from ranked_entries import EVENT_CODES, load_entries
+from swimmer_profiles import SwimmerProfiles
+from time_formatter import format_date_display, format_time_display
+from time_parser import NO_TIME_HUNDREDTHS
+
+# High school events are short course yards
+EVENT_NAMES = {(event_code, 'scy'): event for event, event_code in EVENT_CODES.items()}
+GRADE_LABELS = {9: "FR", 10: "SO", 11: "JR", 12: "SR"}
+GENDER_CODES = {"boys": "M", "girls": "F"}
+
 # Class of 2026 Seniors
 SENIORS_2026 = [
     "Zachary Duerkop",
@@ -23,79 +35,36 @@ SENIORS_2026 = [
     "Brooklyn Johnson"
 ]
 
-def parse_time(time_str):
-    """Convert time string to seconds for comparison"""
-    if not time_str:
-        return None
-    
-    # Remove any whitespace
-    time_str = time_str.strip()
-    
-    # Handle formats: 1:23.45 or 23.45
-    if ':' in time_str:
-        parts = time_str.split(':')
-        minutes = int(parts[0])
-        seconds = float(parts[1])
-        return minutes * 60 + seconds
-    else:
-        return float(time_str)
-
-def parse_date(date_str):
-    """Parse date string to datetime for sorting"""
-    # Formats: "Nov 08, 2025" or "Nov 8, 2025"
-    try:
-        return datetime.strptime(date_str, "%b %d, %Y")
-    except:
-        try:
-            return datetime.strptime(date_str, "%b %d, %Y")
-        except:
-            return None
-
 def analyze_swimmer_history(swimmer_name, gender):
     """Analyze complete swimming history for a swimmer"""
     
-    records_dir = Path("records")
+    profile = SwimmerProfiles.open().get(swimmer_name, GENDER_CODES[gender])
+    progression = profile['progression'] if profile else {}
+    
+    # Season best in each high school event (what the season top 10 lists
+    # show); profile progression covers the team's short course swims
+    season_bests = {}
+    for season_list in progression.values():
+        for best in season_list:
+            event = EVENT_NAMES.get((best['event_code'], best['event_course']))
+            key = (event, best['season'])
+            if event and (key not in season_bests or best['time_hundredths'] < season_bests[key]['time_hundredths']):
+                season_bests[key] = best
     
     # Dictionary to store all swims by event
     swims_by_event = {}
     
-    # Search through all Top 10 files for this swimmer
-    pattern = rf"\|\s*\d+\s*\|\s*([\d:\.]+)\s*\|\s*{re.escape(swimmer_name)}\s*\|([^|]*)\|([^|]*)\|([^|]*)\|"
-    
-    for md_file in records_dir.glob(f"top10-{gender}-*.md"):
-        season = md_file.stem.replace(f"top10-{gender}-", "")
-        
-        with open(md_file, 'r') as f:
-            content = f.read()
-        
-        # Find current event section
-        current_event = None
-        for line in content.split('\n'):
-            # Check if this is an event header
-            if line.startswith('##') and not line.startswith('###'):
-                current_event = line.replace('##', '').strip()
-            
-            # Check if this line has the swimmer
-            if swimmer_name in line and '|' in line:
-                match = re.search(pattern, line)
-                if match and current_event:
-                    time_str = match.group(1).strip()
-                    year = match.group(2).strip()
-                    date_str = match.group(3).strip()
-                    meet = match.group(4).strip()
-                    
-                    if current_event not in swims_by_event:
-                        swims_by_event[current_event] = []
-                    
-                    swims_by_event[current_event].append({
-                        'time': time_str,
-                        'time_seconds': parse_time(time_str),
-                        'year': year,
-                        'date': date_str,
-                        'date_parsed': parse_date(date_str),
-                        'meet': meet,
-                        'season': season
-                    })
+    for (event, season), best in season_bests.items():
+        grade = best['grade']
+        swims_by_event.setdefault(event, []).append({
+            'time': format_time_display(best['SwimTime']),
+            'time_hundredths': best['time_hundredths'],
+            'year': GRADE_LABELS.get(int(grade), "") if grade is not None else "",
+            'date': format_date_display(best['SwimDate']) if best['SwimDate'] else "",
+            'date_parsed': datetime.fromisoformat(best['SwimDate']) if best['SwimDate'] else None,
+            'meet': best['MeetName'],
+            'season': season
+        })
     
     # For each event, sort by date and calculate improvement
     results = {}
@@ -108,8 +77,8 @@ def analyze_swimmer_history(swimmer_name, gender):
             last_swim = swims_sorted[-1]
             
             # Calculate time drop
-            if first_swim['time_seconds'] and last_swim['time_seconds']:
-                time_drop = first_swim['time_seconds'] - last_swim['time_seconds']
+            if first_swim['time_hundredths'] != NO_TIME_HUNDREDTHS and last_swim['time_hundredths'] != NO_TIME_HUNDREDTHS:
+                time_drop = (first_swim['time_hundredths'] - last_swim['time_hundredths']) / 100
                 
                 results[event] = {
                     'first_swim': first_swim,
@@ -134,27 +103,14 @@ def get_swimmer_records(swimmer_name, gender):
     records = []
     
     records_file = Path(f"records/records-{gender}.md")
-    if not records_file.exists():
-        return records
     
-    with open(records_file, 'r') as f:
-        content = f.read()
-    
-    # Find lines with this swimmer that are bolded (indicating a record)
-    pattern = rf"\|\s*\*\*([^*]+)\*\*\s*\|\s*\*\*([^*]+)\*\*\s*\|\s*\*\*{re.escape(swimmer_name)}\*\*"
-    
-    current_event = None
-    for line in content.split('\n'):
-        if line.startswith('##') and not line.startswith('###'):
-            current_event = line.replace('##', '').strip()
-        
-        if match := re.search(pattern, line):
-            grade = match.group(1).strip()
-            time = match.group(2).strip()
+    # Bolded rows are the overall records
+    for entry in load_entries(records_file):
+        if entry['is_record'] and entry['athlete'] == swimmer_name:
             records.append({
-                'event': current_event,
-                'grade': grade,
-                'time': time
+                'event': entry['event'],
+                'grade': entry['grade_group'],
+                'time': entry['time']
             })
     
     return records
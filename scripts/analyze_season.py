@@ -9,78 +9,44 @@ Compares current season records to previous season to identify:
 
 Outputs formatted markdown for use in annual summary and landing page.
 
+Records are indexed queries against the swim database (swim_db.py): the
+fastest swim ever in each event versus the fastest from before the season.
+
 Usage:
     python analyze_season.py --season 25-26 --year 2025
 """
 
 import argparse
-import re
 from pathlib import Path
-from datetime import datetime
 
-def parse_time(time_str):
-    """Convert time string to seconds for comparison"""
-    time_str = time_str.strip().replace('**', '')
-    if ':' in time_str:
-        parts = time_str.split(':')
-        return float(parts[0]) * 60 + float(parts[1])
-    return float(time_str)
+from ranked_entries import EVENT_CODES
+from swim_db import SwimDB
+from time_formatter import format_date_display, format_time_display
+from time_parser import parse_hundredths
+
+GENDER_CODES = {'boys': 'M', 'girls': 'F'}
+
+RELAY_EVENTS = ['200 Medley Relay', '200 Free Relay', '400 Free Relay']
 
 def time_diff(old_time, new_time):
     """Calculate improvement in seconds"""
-    return parse_time(old_time) - parse_time(new_time)
+    return (parse_hundredths(old_time) - parse_hundredths(new_time)) / 100
 
-def find_pre_season_record(records_content, event_name, current_year):
-    """Find the record holder from before current season"""
-    lines = records_content.split('\n')
-    in_event = False
-    found_header = False
-    
-    for line in lines:
-        if f'### {event_name}' in line or f'## {event_name}' in line:
-            in_event = True
-            continue
-        
-        if in_event and '|-----:|-----:|' in line:
-            found_header = True
-            continue
-            
-        if in_event and found_header and '|' in line:
-            parts = [p.strip() for p in line.split('|')]
-            if len(parts) >= 6:
-                rank = parts[1]
-                time = parts[2]
-                athlete = parts[3]
-                date = parts[4]
-                meet = parts[5]
-                
-                # Skip lines with **Open** or grade labels
-                if 'Open' in rank or 'Freshman' in rank or 'Sophomore' in rank:
-                    continue
-                    
-                # Check if this is from before current year
-                if str(current_year) not in date:
-                    return {
-                        'time': time,
-                        'athlete': athlete,
-                        'date': date,
-                        'meet': meet
-                    }
-        
-        if in_event and line.startswith('###') and event_name not in line:
-            break
-    
-    return None
+def season_start(year):
+    """First day of the season starting in year (Aug 1 cutoff)"""
+    return f"{year}-08-01"
 
-def analyze_records(season, year):
-    """Analyze all records to find what was broken"""
-    records_dir = Path('records')
+def analyze_records(season, year, db=None):
+    """
+    Analyze all records to find what was broken
     
-    # Read current records
-    boys_records = (records_dir / 'records-boys.md').read_text()
-    girls_records = (records_dir / 'records-girls.md').read_text()
-    boys_relays = (records_dir / 'relay-records-boys.md').read_text()
-    girls_relays = (records_dir / 'relay-records-girls.md').read_text()
+    A record was broken this season when the fastest swim (or relay) ever
+    is from this season; the record before it is the fastest from before
+    the season started. Grade records come from the class records history.
+    """
+    db = db or SwimDB.open()
+    start = season_start(year)
+    season_label = f"{year}-{(year + 1) % 100:02d}"
     
     broken_records = {
         'individual': {'boys': [], 'girls': []},
@@ -88,33 +54,59 @@ def analyze_records(season, year):
         'grade': {'boys': [], 'girls': []}
     }
     
-    # Individual events to check
-    events = [
-        '50 Freestyle', '100 Freestyle', '200 Freestyle', '500 Freestyle',
-        '100 Backstroke', '100 Breaststroke', '100 Butterfly', '200 Individual Medley'
-    ]
-    
-    # Check boys individual records
-    for event in events:
-        # Check overall record
-        pattern = rf'\|\s*\*\*Open\*\*\s*\|\s*\*\*([^*]+)\*\*\s*\|\s*\*\*([^*]+)\*\*\s*\|\s*\*\*([^*]+)\*\*'
-        match = re.search(pattern, boys_records)
-        if match and str(year) in boys_records[match.start():match.end()]:
-            old_record = find_pre_season_record(boys_records, event, year)
+    for gender, gender_code in GENDER_CODES.items():
+        # Overall individual records (same swims as the records pages)
+        for event, event_code in EVENT_CODES.items():
+            filters = dict(gender=gender_code, event_code=event_code, team='Tanque Verde',
+                           course='scy', kind='individual')
+            new_record = db.best_swim(**filters)
+            if new_record is None or not new_record['SwimDate'] or new_record['SwimDate'] < start:
+                continue
+            old_record = db.best_swim(before=start, **filters)
+            if old_record:
+                broken_records['individual'][gender].append({
+                    'event': event,
+                    'new_time': format_time_display(new_record['SwimTime']),
+                    'new_athlete': new_record['Name'],
+                    'new_date': format_date_display(new_record['SwimDate']),
+                    'old_time': format_time_display(old_record['SwimTime']),
+                    'old_athlete': old_record['Name'],
+                    'old_date': format_date_display(old_record['SwimDate']),
+                    'old_meet': old_record['MeetName']
+                })
+        
+        # Relay records
+        for event in RELAY_EVENTS:
+            new_record = db.best_relay(gender, event)
+            if new_record is None or not new_record['date'] or new_record['date'] < start:
+                continue
+            old_record = db.best_relay(gender, event, before=start)
             if old_record:
-                broken_records['individual']['boys'].append({
+                broken_records['relays'][gender].append({
                     'event': event,
-                    'new_time': match.group(1).strip(),
-                    'new_athlete': match.group(2).strip(),
-                    'new_date': match.group(3).strip(),
-                    'old_time': old_record['time'],
-                    'old_athlete': old_record['athlete'],
-                    'old_date': old_record['date'],
+                    'new_time': format_time_display(new_record['time']),
+                    'new_athletes': ', '.join(new_record['swimmers']),
+                    'new_date': format_date_display(new_record['date']),
+                    'old_time': format_time_display(old_record['time']),
+                    'old_athletes': ', '.join(old_record['swimmers']),
+                    'old_date': format_date_display(old_record['date']),
                     'old_meet': old_record['meet']
                 })
-    
-    # Similar for girls...
-    # Similar for relays...
+        
+        # Grade records set this season that replaced an earlier one
+        for record in db.class_records(gender=gender, season=season_label).to_dict('records'):
+            if record['previous_time']:
+                broken_records['grade'][gender].append({
+                    'event': record['event'],
+                    'grade': record['grade'],
+                    'new_time': record['time'],
+                    'new_athlete': record['name'],
+                    'new_date': record['date'],
+                    'old_time': record['previous_time'],
+                    'old_athlete': record['previous_name'],
+                    'old_date': record['previous_date'],
+                    'old_meet': record['previous_meet']
+                })
     
     return broken_records
 
@@ -144,6 +136,18 @@ def generate_markdown_output(broken_records, season):
                 output += f"- OLD: {record['old_time']} - {record['old_athletes']} ({record['old_date']})\n"
                 output += f"- Improvement: {improvement:.2f} seconds\n\n"
     
+    output += "## Grade Records\n\n"
+    
+    for gender in ['boys', 'girls']:
+        if broken_records['grade'][gender]:
+            output += f"### {gender.capitalize()}\n\n"
+            for record in broken_records['grade'][gender]:
+                improvement = time_diff(record['old_time'], record['new_time'])
+                output += f"**{record['event']} ({record['grade']})**\n"
+                output += f"- NEW: {record['new_time']} - {record['new_athlete']}\n"
+                output += f"- OLD: {record['old_time']} - {record['old_athlete']} ({record['old_date']})\n"
+                output += f"- Improvement: {improvement:.2f} seconds\n\n"
+    
     return output
 
 def main():
@@ -166,6 +170,8 @@ def main():
     print(f"  Girls Individual: {len(broken_records['individual']['girls'])}")
     print(f"  Boys Relays: {len(broken_records['relays']['boys'])}")
     print(f"  Girls Relays: {len(broken_records['relays']['girls'])}")
+    print(f"  Boys Grade: {len(broken_records['grade']['boys'])}")
+    print(f"  Girls Grade: {len(broken_records['grade']['girls'])}")
 
 if __name__ == '__main__':
     main()
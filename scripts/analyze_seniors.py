@@ -2,15 +2,19 @@
 """
 Analyze senior swimmers' careers for the Class of 2026
 Generate career retrospectives with best times, state appearances, and progression
+
+Each senior's summary, personal bests, season-best progression and state
+history are read from their precomputed profile (swimmer_profiles.py).
 """
 
 import pandas as pd
 from pathlib import Path
 import sys
-from collections import defaultdict
 
 sys.path.insert(0, str(Path(__file__).parent))
 from time_formatter import format_time_display
+from time_parser import NO_TIME_HUNDREDTHS
+from swimmer_profiles import SwimmerProfiles
 
 
 # Seniors for 2025-26
@@ -25,131 +29,65 @@ SENIORS = [
 ]
 
 
-def find_swimmer_file(name):
-    """Find the CSV file for a swimmer"""
-    data_dir = Path('data/raw/swimmers')
-    for file in data_dir.glob('*.csv'):
-        # Check if name matches (case insensitive, handle variations)
-        if name.lower().replace(' ', '-') in file.stem.lower():
-            return file
-    return None
-
-
-def parse_time_to_seconds(time_str):
-    """Convert time string to seconds"""
-    if pd.isna(time_str) or time_str == '':
-        return None
-    
-    parts = str(time_str).split(':')
-    if len(parts) == 2:
-        minutes, seconds = parts
-        return float(minutes) * 60 + float(seconds)
-    else:
-        return float(parts[0])
-
-
 def analyze_swimmer(name):
     """Analyze a single swimmer's career"""
-    file_path = find_swimmer_file(name)
+    profile = SwimmerProfiles.open().get(name)
     
-    if not file_path:
-        print(f"⚠️  No data file found for {name}")
+    if not profile:
+        print(f"⚠️  No swims found for {name}")
         return None
     
-    df = pd.read_csv(file_path)
-    
-    # Filter out relays
-    df = df[~df['Event'].str.contains('RELAY', case=False, na=False)].copy()
-    
-    # Convert times
-    df['time_seconds'] = df['SwimTime'].apply(parse_time_to_seconds)
-    
-    # Parse dates
-    df['SwimDate'] = pd.to_datetime(df['SwimDate'], errors='coerce')
-    df['year'] = df['SwimDate'].dt.year
-    
-    # Identify state meets
-    df['is_state'] = df['MeetName'].str.contains('State|AIA', case=False, na=False)
-    
     return {
         'name': name,
-        'file': file_path.name,
-        'df': df,
-        'total_swims': len(df),
-        'state_swims': len(df[df['is_state']]),
-        'years_active': sorted(df['year'].dropna().unique().tolist())
+        'file': profile['source_file'],
+        'profile': profile,
+        'total_swims': profile['swims'],
+        'state_swims': profile['state_swims'],
+        'years_active': profile['years_active']
     }
 
 
 def get_best_times(swimmer_data):
     """Get best times by event"""
-    df = swimmer_data['df']
-    
-    best_times = {}
-    for event in df['Event'].unique():
-        event_df = df[df['Event'] == event]
-        if not event_df.empty:
-            best = event_df.nsmallest(1, 'time_seconds').iloc[0]
-            best_times[event] = {
-                'time': best['SwimTime'],
-                'time_seconds': best['time_seconds'],
-                'date': best['SwimDate'],
-                'meet': best['MeetName'],
-                'year': best['year']
-            }
-    
-    return best_times
+    return {
+        event: {
+            'time': best['SwimTime'],
+            'time_hundredths': best['time_hundredths'],
+            'date': pd.to_datetime(best['SwimDate']),
+            'meet': best['MeetName'],
+            'season': best['season'],
+            'alltime_rank': best['alltime_rank']
+        }
+        for event, best in swimmer_data['profile']['bests'].items()
+    }
 
 
 def get_state_history(swimmer_data):
     """Get state meet history"""
-    df = swimmer_data['df']
-    state_df = df[df['is_state']].copy()
-    
-    if state_df.empty:
-        return []
-    
-    # Group by year and event
-    state_meets = []
-    for year in sorted(state_df['year'].unique()):
-        year_df = state_df[state_df['year'] == year]
-        events = []
-        for _, swim in year_df.iterrows():
-            events.append({
-                'event': swim['Event'],
-                'time': swim['SwimTime'],
-                'meet': swim['MeetName']
-            })
-        state_meets.append({
-            'year': int(year),
-            'events': events,
-            'count': len(events)
-        })
-    
-    return state_meets
+    return [
+        {
+            'year': year_data['year'],
+            'events': [
+                {'event': swim['Event'], 'time': swim['SwimTime'], 'meet': swim['MeetName']}
+                for swim in year_data['events']
+            ],
+            'count': len(year_data['events'])
+        }
+        for year_data in swimmer_data['profile']['state_history']
+    ]
 
 
 def get_progression(swimmer_data, event):
-    """Get year-by-year progression for an event"""
-    df = swimmer_data['df']
-    event_df = df[df['Event'] == event].copy()
-    
-    if event_df.empty:
-        return []
-    
-    # Get best time by year
-    progression = []
-    for year in sorted(event_df['year'].dropna().unique()):
-        year_df = event_df[event_df['year'] == year]
-        best = year_df.nsmallest(1, 'time_seconds').iloc[0]
-        progression.append({
-            'year': int(year),
+    """Get season-by-season progression for an event"""
+    return [
+        {
+            'season': best['season'],
             'time': best['SwimTime'],
-            'time_seconds': best['time_seconds'],
+            'time_hundredths': best['time_hundredths'],
             'meet': best['MeetName']
-        })
-    
-    return progression
+        }
+        for best in swimmer_data['profile']['progression'].get(event, [])
+    ]
 
 
 def main():
@@ -197,7 +135,8 @@ def main():
         for event, times in sorted_events:
             time_display = format_time_display(times['time'])
             date_str = times['date'].strftime('%b %d, %Y') if pd.notna(times['date']) else 'Unknown'
-            print(f"  {event:20s} | {time_display:>8s} | {date_str} | {times['meet'][:40]}")
+            rank = f"#{times['alltime_rank']}" if times['alltime_rank'] else '–'
+            print(f"  {event:20s} | {time_display:>8s} | {rank:>4s} all-time | {date_str} | {times['meet'][:40]}")
         
         # State meet history
         state_history = get_state_history(data)
@@ -210,36 +149,31 @@ def main():
                     time_display = format_time_display(event['time'])
                     print(f"    - {event['event']:20s} | {time_display:>8s}")
         
-        # Show progression in signature events (events with 3+ years)
+        # Show progression in signature events (events with 3+ seasons)
         print(f"\nCareer Progression (Signature Events):")
         print("-" * 80)
         
-        # Find events with multiple years
-        df = data['df']
-        event_years = {}
-        for event in df['Event'].unique():
-            years = df[df['Event'] == event]['year'].dropna().nunique()
-            if years >= 3:
-                event_years[event] = years
+        # Find events with multiple seasons
+        signature_events = sorted(
+            event for event, seasons in data['profile']['progression'].items() if len(seasons) >= 3
+        )
         
-        if event_years:
-            for event in sorted(event_years.keys()):
+        if signature_events:
+            for event in signature_events:
                 progression = get_progression(data, event)
-                if len(progression) >= 3:
-                    print(f"  {event}:")
-                    for prog in progression:
-                        time_display = format_time_display(prog['time'])
-                        print(f"    {prog['year']}: {time_display:>8s}")
-                    
-                    # Calculate improvement
-                    if len(progression) >= 2:
-                        first_time = progression[0]['time_seconds']
-                        last_time = progression[-1]['time_seconds']
-                        improvement = first_time - last_time
-                        if improvement > 0:
-                            print(f"    Improvement: -{improvement:.2f}s ({progression[0]['year']}-{progression[-1]['year']})")
+                print(f"  {event}:")
+                for prog in progression:
+                    time_display = format_time_display(prog['time'])
+                    print(f"    {prog['season']}: {time_display:>8s}")
+                
+                # Calculate improvement
+                first_time = progression[0]['time_hundredths']
+                last_time = progression[-1]['time_hundredths']
+                improvement = (first_time - last_time) / 100
+                if improvement > 0 and first_time != NO_TIME_HUNDREDTHS:
+                    print(f"    Improvement: -{improvement:.2f}s ({progression[0]['season']} to {progression[-1]['season']})")
         else:
-            print("  (Less than 3 years of data for any single event)")
+            print("  (Less than 3 seasons of data for any single event)")
     
     print(f"\n\n{'=' * 80}")
     print(f"SENIOR CLASS SUMMARY")
@@ -2,6 +2,8 @@
 """
 Analyze 2025 AIA D3 State Championship results for Tanque Verde
 Extract highlights, top finishers, and improvements
+
+Pre-state PRs are looked up in the swim database (swim_db.py).
 """
 
 import pandas as pd
@@ -10,58 +12,23 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent))
 from time_formatter import format_time_display
-
-
-def parse_time_to_seconds(time_str):
-    """Convert time string to seconds"""
-    if pd.isna(time_str) or time_str == '':
-        return None
-    
-    parts = time_str.split(':')
-    if len(parts) == 2:
-        # MM:SS.mm format
-        minutes, seconds = parts
-        return float(minutes) * 60 + float(seconds)
-    else:
-        # SS.mm format
-        return float(parts[0])
+from time_parser import parse_times, NO_TIME_HUNDREDTHS
+from swim_db import SwimDB
 
 
 def get_pre_state_pr(swimmer_name, event, state_date='2025-11-08'):
     """Get swimmer's PR before the state meet"""
-    # Find the swimmer's CSV file
-    swimmers_dir = Path('data/raw/swimmers')
-    
-    # Search for the swimmer's file
-    for swimmer_file in swimmers_dir.glob('*.csv'):
-        df_swimmer = pd.read_csv(swimmer_file)
-        if df_swimmer.empty:
-            continue
-            
-        # Check if this is the right swimmer
-        if df_swimmer.iloc[0]['Name'] == swimmer_name:
-            # Filter for the same event and before state date
-            df_event = df_swimmer[
-                (df_swimmer['Event'] == event) &
-                (pd.to_datetime(df_swimmer['SwimDate']) < pd.to_datetime(state_date))
-            ].copy()
-            
-            if df_event.empty:
-                return None
-            
-            # Convert times and find best
-            df_event['time_seconds'] = df_event['SwimTime'].apply(parse_time_to_seconds)
-            best_time = df_event['time_seconds'].min()
-            best_row = df_event[df_event['time_seconds'] == best_time].iloc[0]
-            
-            return {
-                'time': best_row['SwimTime'],
-                'time_seconds': best_time,
-                'date': best_row['SwimDate'],
-                'meet': best_row['MeetName']
-            }
+    # Fastest swim in the same event before the state date
+    best = SwimDB.open().best_swim(name=swimmer_name, event=event, before=state_date)
+    if best is None:
+        return None
     
-    return None
+    return {
+        'time': best['SwimTime'],
+        'time_hundredths': int(best['time_hundredths']),
+        'date': best['SwimDate'],
+        'meet': best['MeetName']
+    }
 
 
 def main():
@@ -69,8 +36,8 @@ def main():
     state_file = Path('data/raw/aia-state/tvhs-state-2025.csv')
     df = pd.read_csv(state_file)
     
-    # Convert times to seconds for comparison
-    df['time_seconds'] = df['SwimTime'].apply(parse_time_to_seconds)
+    # Convert times to integer hundredths for exact comparison
+    df['time_hundredths'] = parse_times(df['SwimTime'], unit='hundredths')
     
     # Identify prelims (has 'q' in splits) vs finals (has numeric place or empty splits)
     df['is_prelim'] = df['splits'].fillna('').str.contains('q', case=False, na=False)
@@ -112,11 +79,12 @@ def main():
             final = group[group['is_final']]
             
             if not prelim.empty and not final.empty:
-                prelim_time = prelim.iloc[0]['time_seconds']
-                final_time = final.iloc[0]['time_seconds']
-                improvement = prelim_time - final_time
+                prelim_time = prelim.iloc[0]['time_hundredths']
+                final_time = final.iloc[0]['time_hundredths']
+                improvement = (prelim_time - final_time) / 100
                 
-                if improvement > 0:  # Only show improvements (drops in time)
+                # Only show improvements (drops in time) between two real times
+                if improvement > 0 and prelim_time != NO_TIME_HUNDREDTHS and final_time != NO_TIME_HUNDREDTHS:
                     improvements.append({
                         'name': name,
                         'event': event,
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Grouped best-time reductions shared by the record generators.
+
+Each function is a single groupby/idxmin pass over the whole frame instead
+of filtering, copying and sorting once per event and grade, so record
+generation stays fast as the swim history grows.
+
+Usage:
+    from best_times import best_per_group, best_per_swimmer, top_per_group
+    best_per_group(df, ['event_code', 'grade_group'])   # one row per record
+    best_per_swimmer(df, ['season', 'event_code'])      # each swimmer's PR
+    top_per_group(df, ['season', 'event_code'], n=10)   # ranked top 10s
+"""
+
+import pandas as pd
+
+TIME_COL = 'time_hundredths'
+SWIMMER_COL = 'Name'
+
+
+def best_per_group(df: pd.DataFrame, keys: list[str], time_col: str = TIME_COL) -> pd.DataFrame:
+    """
+    Fastest row for each combination of keys.
+
+    Rows with a missing key are ignored. Ties keep the first row in frame
+    order. Returns the selected rows (original columns) with a fresh index.
+    """
+    if df.empty:
+        return df.copy()
+    idx = df.groupby(keys, sort=False)[time_col].idxmin()
+    return df.loc[idx.values].reset_index(drop=True)
+
+
+def best_per_swimmer(df: pd.DataFrame, keys: list[str], time_col: str = TIME_COL,
+                     swimmer_col: str = SWIMMER_COL) -> pd.DataFrame:
+    """Each swimmer's fastest row within each combination of keys"""
+    return best_per_group(df, keys + [swimmer_col], time_col=time_col)
+
+
+def top_per_group(df: pd.DataFrame, keys: list[str], n: int = 10, time_col: str = TIME_COL,
+                  swimmer_col: str = SWIMMER_COL) -> pd.DataFrame:
+    """
+    Top n swimmers for each combination of keys, one swim per swimmer.
+
+    Returns the selected rows sorted by keys and time, with a 1-based 'rank'
+    column. Ties keep frame order, as nsmallest does.
+    """
+    best = best_per_swimmer(df, keys, time_col=time_col, swimmer_col=swimmer_col)
+    if best.empty:
+        return best.assign(rank=pd.Series(dtype='int64'))
+    best['rank'] = best.groupby(keys, sort=False)[time_col].rank(method='first').astype('int64')
+    top = best[best['rank'] <= n]
+    return top.sort_values(keys + ['rank'], kind='stable').reset_index(drop=True)
@@ -6,108 +6,39 @@ Collects all swims from every season file, applies aliases, deduplicates,
 and outputs the true all-time top 10 for each event.
 """
 
-import json
-import re
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 
+from name_resolver import NameResolver
+from ranked_entries import load_entries, make_entry, write_entries
 
-def load_aliases(aliases_path: Path) -> dict:
-    """Load swimmer aliases from JSON file."""
-    if aliases_path.exists():
-        with open(aliases_path) as f:
-            return json.load(f)
-    return {}
 
+def parse_date(entry: dict) -> datetime:
+    """Entry date as datetime for comparison (datetime.max if unknown)."""
+    if entry['date']:
+        return datetime.fromisoformat(entry['date'])
+    return datetime.max
 
-def parse_time_to_seconds(time_str: str) -> float:
-    """Convert swim time string to seconds for comparison."""
-    time_str = time_str.strip()
-    if ':' in time_str:
-        parts = time_str.split(':')
-        if len(parts) == 2:
-            return float(parts[0]) * 60 + float(parts[1])
-        elif len(parts) == 3:
-            return float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2])
-    try:
-        return float(time_str)
-    except ValueError:
-        return float('inf')
 
-
-def parse_date(date_str: str) -> datetime:
-    """Parse date string to datetime for comparison."""
-    date_str = date_str.strip()
-    try:
-        return datetime.strptime(date_str, "%b %d, %Y")
-    except ValueError:
-        return datetime.max
-
-
-def extract_events_from_file(filepath: Path, aliases: dict) -> dict:
+def extract_events_from_file(filepath: Path, resolver: NameResolver) -> dict:
     """Extract all events and their entries from a top10 file."""
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
     events = defaultdict(list)
-    lines = content.split('\n')
-    
-    current_event = None
-    in_table = False
     
-    for line in lines:
-        # Detect event header
-        match = re.match(r'^##+ (.+)$', line)
-        if match:
-            event_name = match.group(1).strip()
-            if event_name and not event_name.startswith('Tanque'):
-                current_event = event_name
-                in_table = False
-            continue
-        
-        # Detect table start
-        if '| Rank |' in line:
-            in_table = True
-            continue
-        
-        # Skip separator
-        if line.strip().startswith('|--'):
-            continue
-        
-        # Parse data row
-        if in_table and current_event and line.strip().startswith('|'):
-            parts = [p.strip() for p in line.split('|')]
-            if len(parts) >= 7:
-                # parts: ['', rank, time, athlete, year, date, meet, ...]
-                time_str = parts[2]
-                athlete = parts[3]
-                year = parts[4]
-                date = parts[5]
-                meet = parts[6]
-                
-                # Skip empty rows
-                if not athlete or not time_str:
-                    continue
-                
-                # Apply alias
-                if athlete in aliases:
-                    athlete = aliases[athlete]
-                
-                events[current_event].append({
-                    'time': time_str,
-                    'time_seconds': parse_time_to_seconds(time_str),
-                    'athlete': athlete,
-                    'year': year,
-                    'date': date,
-                    'date_parsed': parse_date(date),
-                    'meet': meet,
-                    'source': filepath.name
-                })
+    for entry in load_entries(filepath):
+        athlete = resolver.canonical(entry['athlete'])
         
-        # Table end
-        if in_table and (line.strip() == '' or line.startswith('---')):
-            in_table = False
+        events[entry['event']].append({
+            'time': entry['time'],
+            'time_hundredths': entry['time_hundredths'],
+            'athlete': athlete,
+            'year': entry['year'],
+            'date': entry['date_display'],
+            'date_parsed': parse_date(entry),
+            'meet': entry['meet'],
+            'is_record': entry['is_record'],
+            'source': filepath.name
+        })
     
     return events
 
@@ -115,7 +46,7 @@ def extract_events_from_file(filepath: Path, aliases: dict) -> dict:
 def build_alltime_top10(all_entries: list, limit: int = 10) -> list:
     """Build top 10 from all entries, deduplicating by athlete."""
     # Sort by time (fastest first), then by date (earliest first)
-    sorted_entries = sorted(all_entries, key=lambda x: (x['time_seconds'], x['date_parsed']))
+    sorted_entries = sorted(all_entries, key=lambda x: (x['time_hundredths'], x['date_parsed']))
     
     # Deduplicate by athlete
     seen = set()
@@ -137,9 +68,10 @@ def format_top10_table(entries: list) -> list:
         "|-----:|-----:|---------|------|------|------|"
     ]
     for rank, entry in enumerate(entries, 1):
-        lines.append(
-            f"| {rank} | {entry['time']} | {entry['athlete']} | {entry['year']} | {entry['date']} | {entry['meet']} |"
-        )
+        cells = [rank, entry['time'], entry['athlete'], entry['year'], entry['date'], entry['meet']]
+        if entry['is_record']:
+            cells = [f"**{cell}**" for cell in cells]
+        lines.append('| ' + ' | '.join(str(cell) for cell in cells) + ' |')
     return lines
 
 
@@ -154,8 +86,8 @@ def main():
     print("=" * 70)
     
     # Load aliases
-    aliases = load_aliases(aliases_path)
-    print(f"\n📋 Loaded {len(aliases)} swimmer aliases")
+    resolver = NameResolver.load(aliases_path)
+    print(f"\n📋 Loaded {len(resolver.aliases)} swimmer aliases")
     
     # Process boys and girls separately
     for gender in ['boys', 'girls']:
@@ -171,7 +103,7 @@ def main():
         # Collect all entries from all seasons
         all_events = defaultdict(list)
         for filepath in season_files:
-            events = extract_events_from_file(filepath, aliases)
+            events = extract_events_from_file(filepath, resolver)
             for event, entries in events.items():
                 all_events[event].extend(entries)
         
@@ -180,7 +112,7 @@ def main():
         # Also include existing alltime file
         alltime_file = source_dir / f"top10-{gender}-alltime.md"
         if alltime_file.exists():
-            events = extract_events_from_file(alltime_file, aliases)
+            events = extract_events_from_file(alltime_file, resolver)
             for event, entries in events.items():
                 all_events[event].extend(entries)
             print(f"📊 Merged existing all-time data")
@@ -202,6 +134,7 @@ def main():
             "100 Backstroke", "100 Breaststroke", "100 Butterfly", "200 Individual Medley"
         ]
         
+        ranked = []
         for event in event_order:
             if event in all_events:
                 entries = all_events[event]
@@ -213,11 +146,17 @@ def main():
                 output_lines.append("")
                 output_lines.extend(format_top10_table(top10))
                 output_lines.append("")
+                ranked.extend(
+                    make_entry(event, e['time'], e['athlete'], e['date'], e['meet'], rank=rank, year=e['year'],
+                               is_record=e['is_record'])
+                    for rank, e in enumerate(top10, 1)
+                )
         
         # Write output
         output_path = dest_dir / f"top10-{gender}-alltime.md"
         with open(output_path, 'w') as f:
             f.write('\n'.join(output_lines))
+        write_entries(output_path, ranked)
         print(f"\n✅ Wrote: {output_path}")
     
     print("\n" + "=" * 70)
@@ -9,59 +9,25 @@ import re
 from pathlib import Path
 from datetime import datetime
 
-def parse_time_to_seconds(time_str):
-    """Convert time string to seconds for comparison"""
-    time_str = time_str.strip().replace('**', '')
-    try:
-        if ':' in time_str:
-            parts = time_str.split(':')
-            if len(parts) == 2:
-                mins, secs = parts
-                return float(mins) * 60 + float(secs)
-        return float(time_str)
-    except:
-        return float('inf')
+from ranked_entries import load_entries
 
 def parse_top10_file(filepath):
-    """Parse a Top 10 markdown file and extract times with grades"""
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
+    """Get the Top 10 entries for a season file, with grades"""
     entries = []
-    current_event = None
     
-    for line in content.split('\n'):
-        # Match event headings
-        event_match = re.match(r'^###?\s+(.+)$', line)
-        if event_match:
-            current_event = event_match.group(1).strip()
-            continue
-        
-        # Match table rows
-        if current_event and line.startswith('|') and not line.startswith('| Rank') and not line.startswith('|--') and not line.startswith('|:'):
-            parts = [p.strip().replace('**', '') for p in line.split('|') if p.strip()]
-            if len(parts) >= 5:
-                try:
-                    rank = int(parts[0]) if parts[0].isdigit() else None
-                    time = parts[1].replace('(r)', '').rstrip('r').strip()
-                    name = parts[2]
-                    year = parts[3].upper()  # FR, SO, JR, SR
-                    date = parts[4]
-                    meet = parts[5] if len(parts) > 5 else ''
-                    
-                    if year in ['FR', 'SO', 'JR', 'SR']:
-                        entries.append({
-                            'event': current_event,
-                            'time': time,
-                            'time_seconds': parse_time_to_seconds(time),
-                            'name': name,
-                            'year': year,
-                            'date': date,
-                            'meet': meet,
-                            'rank': rank
-                        })
-                except:
-                    pass
+    for entry in load_entries(filepath):
+        year = entry['year'].upper()  # FR, SO, JR, SR
+        if year in ['FR', 'SO', 'JR', 'SR']:
+            entries.append({
+                'event': entry['event'],
+                'time': entry['time'].replace('(r)', '').rstrip('r').strip(),
+                'time_hundredths': entry['time_hundredths'],
+                'name': entry['athlete'],
+                'year': year,
+                'date': entry['date_display'],
+                'meet': entry['meet'],
+                'rank': entry['rank']
+            })
     
     return entries
 
@@ -89,7 +55,7 @@ def main():
     }
     
     # History of when records were set
-    # Structure: [{season, gender, event, grade, time, name, date, meet, previous_time, previous_holder}]
+    # Structure: [{season, gender, event, grade, time, time_hundredths, name, date, meet, previous}]
     records_history = []
     
     seasons = get_season_range()
@@ -110,7 +76,7 @@ def main():
             for entry in entries:
                 event = entry['event']
                 grade = entry['year']
-                time_secs = entry['time_seconds']
+                time_hundredths = entry['time_hundredths']
                 
                 if event not in class_records[gender]:
                     class_records[gender][event] = {}
@@ -118,11 +84,12 @@ def main():
                 current_record = class_records[gender][event].get(grade)
                 
                 # Check if this is a new record
-                if current_record is None or time_secs < current_record['time_seconds']:
+                if current_record is None or time_hundredths < current_record['time_hundredths']:
                     previous = None
                     if current_record:
                         previous = {
                             'time': current_record['time'],
+                            'time_hundredths': current_record['time_hundredths'],
                             'name': current_record['name'],
                             'date': current_record['date'],
                             'season': current_record['season']
@@ -131,7 +98,7 @@ def main():
                     # Update the record
                     class_records[gender][event][grade] = {
                         'time': entry['time'],
-                        'time_seconds': time_secs,
+                        'time_hundredths': time_hundredths,
                         'name': entry['name'],
                         'date': entry['date'],
                         'meet': entry['meet'],
@@ -145,6 +112,7 @@ def main():
                         'event': event,
                         'grade': grade,
                         'time': entry['time'],
+                        'time_hundredths': time_hundredths,
                         'name': entry['name'],
                         'date': entry['date'],
                         'meet': entry['meet'],
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Propose swimmer_aliases.json entries for swimmers recorded under two names.
+
+Each (name, gender) in the swim store becomes one profile with its swim
+count and graduating class (from grade and season). Names are resolved with
+name_resolver first, so swimmers already covered by an alias are not
+proposed again.
+
+Instead of comparing every pair of names, profiles are blocked by gender,
+last name and first initial (name_resolver.index_last_initial, the same
+blocking as the resolver's own index), or nickname group, and graduating
+class, and first names are compared only within a block and its
+neighbouring classes (grades are sometimes off by a year). Sub-blocking by
+initial keeps common surnames from being compared all against all, at the
+cost of missing first names misspelled in their first letter. A
+sorted-neighbourhood pass over (gender, last name, first name) catches last
+names one typo apart by comparing each profile with the next few in sort
+order.
+
+Usage:
+    python3 scripts/detect_duplicate_swimmers.py            # print proposals
+    python3 scripts/detect_duplicate_swimmers.py --output data/reports/alias_proposals.json
+    python3 scripts/detect_duplicate_swimmers.py --apply    # add them to swimmer_aliases.json
+"""
+
+import argparse
+import json
+from collections import defaultdict
+from difflib import SequenceMatcher
+from pathlib import Path
+
+import pandas as pd
+
+from name_resolver import ALIASES_FILE, NameResolver, index_last_initial, last_initial, normalize_name
+from swim_store import load_swims
+
+# Profiles compared with the next WINDOW profiles in the sorted-neighbourhood pass
+WINDOW = 4
+
+FIRST_NAME_SIMILARITY = 0.8
+
+# Last names this many edits apart (insert, delete, substitute, swap) may be typos
+MAX_LAST_NAME_EDITS = 1
+
+# Nickname groups (first names that refer to the same person)
+NICKNAMES = [
+    {'nicholas', 'nick', 'nicolas'},
+    {'samuel', 'sam', 'sammy'},
+    {'zachary', 'zach', 'zack'},
+    {'william', 'will', 'bill', 'billy'},
+    {'robert', 'rob', 'bob', 'bobby'},
+    {'benjamin', 'ben', 'benji'},
+    {'michael', 'mike', 'mikey'},
+    {'christopher', 'chris'},
+    {'joseph', 'joe', 'joey'},
+    {'jonathan', 'jon', 'jonny'},
+    {'daniel', 'dan', 'danny'},
+    {'matthew', 'matt'},
+    {'alexander', 'alex'},
+    {'elizabeth', 'liz', 'beth', 'lizzy'},
+    {'katherine', 'kate', 'katie', 'kathy'},
+    {'margaret', 'maggie', 'meg'},
+]
+NICKNAME_GROUP = {name: i for i, group in enumerate(NICKNAMES) for name in group}
+
+
+def build_profiles(swims: pd.DataFrame, resolver: NameResolver) -> pd.DataFrame:
+    """One row per (resolved name, gender): swim count, class, name keys"""
+    df = swims[['Name', 'Gender', 'season', 'grade']].dropna(subset=['Name']).copy()
+    df['Name'] = resolver.resolve_series(df['Name'])
+
+    # Graduating class: 2024-25 season in grade 12 -> 2025
+    start_year = pd.to_numeric(df['season'].str[:4], errors='coerce')
+    grade = pd.to_numeric(df['grade'], errors='coerce')
+    df['class_of'] = start_year + 1 + (12 - grade)
+
+    profiles = df.groupby(['Name', 'Gender'], sort=False).size().reset_index(name='swims')
+
+    # Most common class per profile (earliest on ties)
+    classes = (df.dropna(subset=['class_of'])
+               .groupby(['Name', 'Gender', 'class_of']).size().reset_index(name='n')
+               .sort_values(['n', 'class_of'], ascending=[False, True])
+               .drop_duplicates(['Name', 'Gender']))
+    profiles = profiles.merge(classes[['Name', 'Gender', 'class_of']], on=['Name', 'Gender'], how='left')
+
+    profiles['first'] = profiles['Name'].str.split().str[0].map(normalize_name)
+    profiles['last'] = profiles['Name'].map(lambda name: last_initial(name)[0])
+    profiles = profiles[(profiles['last'] != '') & (profiles['Name'].str.split().str.len() > 1)]
+    profiles['class_of'] = profiles['class_of'].astype('Int64')
+    return profiles.reset_index(drop=True)
+
+
+def first_names_match(first: str, other: str) -> str | None:
+    """'high'/'medium' if two first names look like the same person, else None"""
+    if first == other:
+        return 'high'
+    group = NICKNAME_GROUP.get(first)
+    if group is not None and group == NICKNAME_GROUP.get(other):
+        return 'high'
+    shorter, longer = sorted((first, other), key=len)
+    if len(shorter) >= 3 and longer.startswith(shorter):
+        return 'medium'
+    if SequenceMatcher(None, first, other).ratio() >= FIRST_NAME_SIMILARITY:
+        return 'medium'
+    return None
+
+
+def within_edits(a: str, b: str, limit: int) -> bool:
+    """True if a and b are at most limit edits apart (adjacent swaps count as one)"""
+    if abs(len(a) - len(b)) > limit:
+        return False
+    previous, current = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous, current = previous, current, [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], before[j - 2] + 1)
+        if min(current) > limit:
+            return False
+    return current[-1] <= limit
+
+
+def classes_compatible(class_of, other) -> bool:
+    """Same graduating class, one year apart, or unknown"""
+    return pd.isna(class_of) or pd.isna(other) or abs(int(class_of) - int(other)) <= 1
+
+
+def candidate_pairs(profiles: pd.DataFrame):
+    """Yield (i, j, confidence) for profiles that may be the same swimmer"""
+    seen = set()
+
+    def pair(i, j, confidence):
+        key = (min(i, j), max(i, j))
+        if key not in seen:
+            seen.add(key)
+            return (key[0], key[1], confidence)
+        return None
+
+    rows = profiles[['Gender', 'last', 'first', 'class_of']].to_numpy(dtype=object)
+
+    # Blocks: (gender, last name, first initial or nickname group) split by
+    # class; compare within neighbouring classes
+    blocks = defaultdict(lambda: defaultdict(list))
+
+    def add(block, i):
+        class_of = rows[i][3]
+        blocks[block][None if pd.isna(class_of) else int(class_of)].append(i)
+
+    for key, members in index_last_initial(profiles['Name']).items():
+        for i in members:
+            add((rows[i][0], key), i)
+    for i, (gender, last, first, _) in enumerate(rows):
+        group = NICKNAME_GROUP.get(first)
+        if group is not None:
+            add((gender, last, group), i)
+
+    for by_class in blocks.values():
+        for class_of, members in by_class.items():
+            others = []
+            if class_of is None:
+                others = [i for c, m in by_class.items() for i in m]
+            else:
+                for c in (class_of, class_of + 1, None):
+                    others.extend(by_class.get(c, []))
+            for i in members:
+                for j in others:
+                    if i == j:
+                        continue
+                    confidence = first_names_match(rows[i][2], rows[j][2])
+                    if confidence:
+                        result = pair(i, j, confidence)
+                        if result:
+                            yield result
+
+    # Sorted neighbourhood: misspelled last names sort next to each other
+    order = sorted(range(len(rows)), key=lambda i: (rows[i][0], rows[i][1], rows[i][2]))
+    for pos, i in enumerate(order):
+        for j in order[pos + 1:pos + 1 + WINDOW]:
+            if rows[i][0] != rows[j][0] or rows[i][1] == rows[j][1]:
+                continue
+            if not classes_compatible(rows[i][3], rows[j][3]):
+                continue
+            if not within_edits(rows[i][1], rows[j][1], MAX_LAST_NAME_EDITS):
+                continue
+            if first_names_match(rows[i][2], rows[j][2]):
+                result = pair(i, j, 'medium')
+                if result:
+                    yield result
+
+
+def propose_aliases(profiles: pd.DataFrame) -> list[dict]:
+    """Alias proposals: the name with fewer swims maps to the one with more"""
+    proposals = []
+    for i, j, confidence in candidate_pairs(profiles):
+        a, b = profiles.iloc[i], profiles.iloc[j]
+        # Prefer the name with more swims, then the longer (formal) first name
+        preferred, alias = sorted((a, b), key=lambda p: (p['swims'], len(p['Name'])), reverse=True)
+        proposals.append({
+            'alias': alias['Name'],
+            'preferred': preferred['Name'],
+            'gender': preferred['Gender'],
+            'class_of': None if pd.isna(preferred['class_of']) else int(preferred['class_of']),
+            'swims': [int(preferred['swims']), int(alias['swims'])],
+            'confidence': confidence,
+        })
+    proposals.sort(key=lambda p: (p['confidence'] != 'high', p['preferred']))
+    return proposals
+
+
+def apply_proposals(proposals: list[dict], aliases_file: Path = ALIASES_FILE) -> int:
+    """
+    Add proposals to the aliases file; returns how many names were added or re-pointed.
+
+    Proposals that share a name (Nick -> Nic, Nic -> Nicholas) and the existing
+    aliases they touch are merged into one cluster with union-find, and every
+    name in the cluster maps to one preferred name, so no alias chains are left
+    for NameResolver to follow.
+    """
+    aliases = {}
+    if aliases_file.exists():
+        with open(aliases_file) as f:
+            aliases = json.load(f)
+
+    parent = {}
+
+    def find(name):
+        parent.setdefault(name, name)
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    def union(name, other):
+        parent[find(name)] = find(other)
+
+    for alias, preferred in aliases.items():
+        union(alias, preferred)
+    swims = defaultdict(int)
+    for proposal in proposals:
+        union(proposal['alias'], proposal['preferred'])
+        swims[proposal['preferred']] = max(swims[proposal['preferred']], proposal['swims'][0])
+        swims[proposal['alias']] = max(swims[proposal['alias']], proposal['swims'][1])
+
+    clusters = defaultdict(set)
+    for name in parent:
+        clusters[find(name)].add(name)
+
+    changed = 0
+    for members in clusters.values():
+        if not members & swims.keys():
+            continue
+        # Same preference as propose_aliases: most swims, then the longer name
+        preferred = max(members, key=lambda name: (swims[name], len(name), name))
+        for name in sorted(members):
+            if aliases.get(name) != preferred:
+                aliases[name] = preferred
+                changed += 1
+    with open(aliases_file, 'w') as f:
+        json.dump(aliases, f, indent=2)
+        f.write('\n')
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Propose aliases for duplicate swimmer names')
+    parser.add_argument('--output', type=Path, help='Write proposals to this JSON file')
+    parser.add_argument('--apply', action='store_true', help='Add proposals to swimmer_aliases.json')
+    args = parser.parse_args()
+
+    print("🔍 Detecting Duplicate Swimmers\n")
+    resolver = NameResolver.load()
+    swims = load_swims()
+    if swims.empty:
+        print("❌ No swims in the swim store")
+        return
+
+    profiles = build_profiles(swims, resolver)
+    print(f"📊 {len(profiles)} distinct swimmers")
+
+    proposals = propose_aliases(profiles)
+    if not proposals:
+        print("\n✓ No potential duplicates found!")
+        return
+
+    print(f"\n📋 {len(proposals)} proposed alias(es):\n")
+    for p in proposals:
+        class_of = f"class of {p['class_of']}" if p['class_of'] else 'class unknown'
+        print(f"  [{p['confidence']:>6}] {p['alias']!r} -> {p['preferred']!r} "
+              f"({p['gender']}, {class_of}, swims {p['swims'][0]}/{p['swims'][1]})")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(proposals, f, indent=2)
+        print(f"\n✓ Saved proposals to {args.output}")
+
+    if args.apply:
+        changed = apply_proposals(proposals)
+        print(f"\n✓ Added or re-pointed {changed} names in {ALIASES_FILE}")
+
+
+if __name__ == '__main__':
+    main()
@@ -8,14 +8,9 @@ import json
 import re
 from pathlib import Path
 
-def load_aliases():
-    with open('data/swimmer_aliases.json', 'r') as f:
-        return json.load(f)
+from name_resolver import NameResolver
 
-def normalize_name(name, aliases):
-    return aliases.get(name, name)
-
-def parse_relay_records(filepath, aliases):
+def parse_relay_records(filepath, resolver):
     """Parse relay records markdown file to get actual dates/meets"""
     relays = []
     
@@ -36,7 +31,7 @@ def parse_relay_records(filepath, aliases):
                 # Get first swimmer (leadoff)
                 swimmers = [s.strip() for s in participants.split(',')]
                 if swimmers:
-                    leadoff = normalize_name(swimmers[0], aliases)
+                    leadoff = resolver.canonical(swimmers[0])
                     relays.append({
                         'type': '200FR',
                         'event': '50_free',
@@ -59,7 +54,7 @@ def parse_relay_records(filepath, aliases):
                 
                 swimmers = [s.strip() for s in participants.split(',')]
                 if swimmers:
-                    leadoff = normalize_name(swimmers[0], aliases)
+                    leadoff = resolver.canonical(swimmers[0])
                     relays.append({
                         'type': '400FR',
                         'event': '100_free',
@@ -71,11 +66,12 @@ def parse_relay_records(filepath, aliases):
     
     return relays
 
-def match_leadoff_to_relay(leadoff, relays, event_type):
+def match_leadoff_to_relay(leadoff, relays, event_type, resolver):
     """Find the best matching relay for a leadoff time"""
     
     # Filter relays by event type
-    matching_relays = [r for r in relays if r['event'] == event_type and r['leadoff'] == leadoff['name']]
+    name = resolver.canonical(leadoff['name'])
+    matching_relays = [r for r in relays if r['event'] == event_type and r['leadoff'] == name]
     
     if not matching_relays:
         return None
@@ -84,15 +80,15 @@ def match_leadoff_to_relay(leadoff, relays, event_type):
     return matching_relays[0]
 
 def main():
-    aliases = load_aliases()
+    resolver = NameResolver.load()
     
     # Load leadoff times
     with open('data/relay_leadoff_times.json', 'r') as f:
         leadoffs = json.load(f)
     
     # Parse relay records
-    boys_relays = parse_relay_records('records/relay-records-boys.md', aliases)
-    girls_relays = parse_relay_records('records/relay-records-girls.md', aliases)
+    boys_relays = parse_relay_records('records/relay-records-boys.md', resolver)
+    girls_relays = parse_relay_records('records/relay-records-girls.md', resolver)
     
     print(f"Loaded {len(boys_relays)} boys relay records")
     print(f"Loaded {len(girls_relays)} girls relay records")
@@ -106,7 +102,7 @@ def main():
         
         for event in ['50_free', '100_free']:
             for leadoff in leadoffs[gender][event]:
-                match = match_leadoff_to_relay(leadoff, relays, event)
+                match = match_leadoff_to_relay(leadoff, relays, event, resolver)
                 
                 if match:
                     leadoff['date'] = match['date']
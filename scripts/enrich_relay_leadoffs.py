@@ -2,26 +2,22 @@
 """
 Enrich relay_leadoff_times.json with actual meet names and dates
 by matching split totals to harvested relay data.
+
+Historical splits (only the seasons with pending entries) are bucketed by
+(year, leadoff split, leadoff last name) and harvested relays by (season,
+total time), so each leadoff is resolved with two dictionary lookups
+instead of scanning every split and relay. Swimmer names are resolved
+through swimmer_aliases.json (name_resolver.py) before they are compared.
 """
 
 import json
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
 
-
-def parse_time_to_seconds(time_str):
-    """Convert time string to total seconds"""
-    time_str = str(time_str).strip()
-    if ':' in time_str:
-        # Format: MM:SS.ss or HH:MM:SS.ss
-        parts = time_str.split(':')
-        if len(parts) == 2:
-            mins, secs = parts
-            return float(mins) * 60 + float(secs)
-        elif len(parts) == 3:
-            hours, mins, secs = parts
-            return float(hours) * 3600 + float(mins) * 60 + float(secs)
-    return float(time_str)
+from name_resolver import NameResolver
+from relay_splits import load_splits
+from time_parser import parse_hundredths, NO_TIME_HUNDREDTHS
 
 
 def format_date(date_str):
@@ -92,106 +88,78 @@ def load_harvested_relays():
     return all_relays
 
 
-def load_historical_splits():
-    """Load all historical splits with calculated totals"""
-    splits_data = []
-    splits_dir = Path('/Users/aaryn/workspaces/swimming/tanque-verde-swim/data/historical_splits')
-    
-    for filepath in splits_dir.glob('splits_*.json'):
-        try:
-            with open(filepath) as f:
-                data = json.load(f)
-                for gender in ['boys', 'girls']:
-                    if gender in data:
-                        for relay in data[gender]:
-                            # Calculate total time from splits
-                            total_secs = 0
-                            for split in relay.get('splits', []):
-                                try:
-                                    total_secs += parse_time_to_seconds(split)
-                                except:
-                                    pass
-                            relay['_total_seconds'] = total_secs
-                            relay['_source'] = filepath.name
-                            relay['_gender'] = gender
-                            splits_data.append(relay)
-        except Exception as e:
-            print(f"  Warning: Could not load {filepath}: {e}")
-    
-    return splits_data
+def swimmer_name(name):
+    """'Andrew Lam - Jr.' -> 'Andrew Lam'"""
+    return name.split(' - ')[0] if ' - ' in name else name
 
 
-def find_matching_relay(leadoff_entry, harvested_relays, historical_splits):
-    """Try to find matching relay with meet info"""
-    swimmer = leadoff_entry.get('name', '')
-    split_time = leadoff_entry.get('time', 0)
-    year = leadoff_entry.get('year', '')
-    from_relay = leadoff_entry.get('from_relay', '')
-    
-    # Map relay type
-    relay_type_map = {
-        '200FR': '200 Free Relay',
-        '400FR': '400 Free Relay',
-        '200MR': '200 Medley Relay',
-    }
-    expected_relay_type = relay_type_map.get(from_relay, from_relay)
-    
-    # First, find in historical splits
+def last_name(name, resolver):
+    """Lowercased last name of the preferred name, the join key for relay swimmers"""
+    parts = resolver.canonical(name).split()
+    return parts[-1].lower() if parts else ''
+
+
+def names_match(swimmer, other, resolver):
+    """Same swimmer by alias, if either name contains the other, or if last names agree"""
+    if resolver.same_swimmer(swimmer, other):
+        return True
+    lower, other_lower = swimmer.lower(), other.lower()
+    return (lower in other_lower or other_lower in lower
+            or last_name(swimmer, resolver) == last_name(other, resolver))
+
+
+def season_key(season):
+    """'12-13' for '12-13' or '2012-13' style seasons"""
+    return season[-5:]
+
+
+def index_historical_splits(historical_splits, resolver):
+    """Bucket split entries by (year, leadoff hundredths, leadoff last name)"""
+    index = defaultdict(list)
     for split_data in historical_splits:
-        if split_data.get('year') != year:
+        hundredths = split_data.split_hundredths
+        swimmers = split_data.swimmers
+        if not hundredths or not swimmers or hundredths[0] == NO_TIME_HUNDREDTHS:
             continue
-        
-        splits = split_data.get('splits', [])
-        swimmers = split_data.get('swimmers', [])
-        
-        if not splits or not swimmers:
+        leadoff = swimmer_name(swimmers[0])
+        key = (split_data.year, hundredths[0], last_name(leadoff, resolver))
+        index[key].append(split_data)
+    return index
+
+
+def index_harvested_relays(harvested_relays):
+    """Bucket harvested relays with swimmers by (season, total hundredths)"""
+    index = defaultdict(list)
+    for relay in harvested_relays:
+        swimmers = relay.get('swimmers', [])
+        total = parse_hundredths(relay.get('time'))
+        if not swimmers or total == NO_TIME_HUNDREDTHS:
             continue
-        
-                # Check if first split matches (leadoff)
-        try:
-            first_split = parse_time_to_seconds(splits[0])
-            if abs(first_split - split_time) < 0.01:
-                # Check if swimmer name matches first swimmer (use last name matching)
-                first_swimmer = swimmers[0].split(' - ')[0] if ' - ' in swimmers[0] else swimmers[0]
-                swimmer_last = swimmer.split()[-1].lower() if swimmer else ''
-                first_swimmer_last = first_swimmer.split()[-1].lower() if first_swimmer else ''
-                names_match = (swimmer.lower() in first_swimmer.lower() or 
-                               first_swimmer.lower() in swimmer.lower() or
-                               swimmer_last == first_swimmer_last)
-                if names_match:
-                    # Found a match in historical splits, now find the meet
-                    total_time = split_data.get('_total_seconds', 0)
-                    
-                    # Search harvested relays for matching total time
-                    season = year if '-' in year else f"20{year}" if len(year) == 2 else year
-                    for relay in harvested_relays:
-                        relay_season = relay.get('season', '')
-                        if relay_season != year and not relay_season.endswith(year):
-                            continue
-                        
-                        try:
-                            relay_time = parse_time_to_seconds(relay.get('time', '0'))
-                            if abs(relay_time - total_time) < 0.5:  # Within 0.5 sec
-                                # Check swimmers match (use last name matching)
-                                relay_swimmers = relay.get('swimmers', [])
-                                if relay_swimmers:
-                                    first_relay_swimmer = relay_swimmers[0].split(' - ')[0] if ' - ' in relay_swimmers[0] else relay_swimmers[0]
-                                    first_relay_last = first_relay_swimmer.split()[-1].lower() if first_relay_swimmer else ''
-                                    relay_names_match = (swimmer.lower() in first_relay_swimmer.lower() or 
-                                                         first_relay_swimmer.lower() in swimmer.lower() or
-                                                         swimmer_last == first_relay_last)
-                                    if relay_names_match:
-                                        return {
-                                            'date': format_date(relay.get('date', '')),
-                                            'meet': clean_meet_name(relay.get('meet', '')),
-                                            'relay_time': relay.get('time', ''),
-                                            'match_type': 'exact_split_match'
-                                        }
-                        except:
-                            pass
-        except:
-            pass
-    
+        index[(season_key(relay.get('season', '')), total)].append(relay)
+    return index
+
+
+def find_matching_relay(leadoff_entry, relays_by_total, splits_by_leadoff, resolver):
+    """Try to find matching relay with meet info"""
+    swimmer = leadoff_entry.get('name', '')
+    split_hundredths = leadoff_entry.get('time_hundredths') or parse_hundredths(
+        leadoff_entry.get('raw_split') or leadoff_entry.get('time_str')
+    )
+    year = leadoff_entry.get('year', '')
+
+    # Historical split with this leadoff split, then the harvested relay
+    # (which carries the meet) with the same total time
+    for split_data in splits_by_leadoff.get((year, split_hundredths, last_name(swimmer, resolver)), []):
+        total_hundredths = split_data.total_hundredths
+        for relay in relays_by_total.get((season_key(year), total_hundredths), []):
+            if names_match(swimmer, swimmer_name(relay['swimmers'][0]), resolver):
+                return {
+                    'date': format_date(relay.get('date', '')),
+                    'meet': clean_meet_name(relay.get('meet', '')),
+                    'relay_time': relay.get('time', ''),
+                    'match_type': 'exact_split_match'
+                }
+
     return None
 
 
@@ -209,42 +177,53 @@ def main():
     harvested = load_harvested_relays()
     print(f"   Loaded {len(harvested)} harvested relay records")
     
-    splits = load_historical_splits()
-    print(f"   Loaded {len(splits)} historical split records")
-    
-    # Process each gender
+    # Entries that still need enrichment
+    pending = [
+        (event, entry)
+        for gender in ['boys', 'girls']
+        for event, entries in leadoff_data.get(gender, {}).items()
+        for entry in entries
+        if 'Leadoff' in entry.get('meet', '') or entry.get('date', '') == entry.get('year', '')
+    ]
+
+    # Splits only for the seasons of those entries
+    seasons = {entry.get('year', '') for _, entry in pending}
+    splits = [split for gender_splits in load_splits(seasons=seasons).values() for split in gender_splits]
+    print(f"   Loaded {len(splits)} historical split records from {len(seasons)} seasons")
+
+    resolver = NameResolver.load()
+    relays_by_total = index_harvested_relays(harvested)
+    splits_by_leadoff = index_historical_splits(splits, resolver)
+
+    # Resolve every pending entry in one pass
     updates = 0
-    checked = 0
-    
-    for gender in ['boys', 'girls']:
-        if gender not in leadoff_data:
+    checked = len(pending)
+    unmatched = []
+
+    for event, entry in pending:
+        current_meet = entry.get('meet', '')
+        current_date = entry.get('date', '')
+
+        match = find_matching_relay(entry, relays_by_total, splits_by_leadoff, resolver)
+        if not (match and match['date'] and match['meet']):
+            unmatched.append((event, entry))
             continue
-        
-        for event, entries in leadoff_data[gender].items():
-            for entry in entries:
-                current_meet = entry.get('meet', '')
-                current_date = entry.get('date', '')
-                
-                # Check if this entry needs enrichment
-                if 'Leadoff' in current_meet or current_date == entry.get('year', ''):
-                    checked += 1
-                    match = find_matching_relay(entry, harvested, splits)
-                    
-                    if match and match['date'] and match['meet']:
-                        print(f"\n✅ Found match for {entry['name']} ({entry.get('year', '')})")
-                        print(f"   Old: {current_date} / {current_meet}")
-                        print(f"   New: {match['date']} / {match['meet']}")
-                        
-                        entry['date'] = match['date']
-                        entry['meet'] = match['meet']
-                        if match.get('relay_time'):
-                            entry['relay_time'] = match['relay_time']
-                        updates += 1
-    
+
+        print(f"\n✅ Found match for {entry['name']} ({entry.get('year', '')})")
+        print(f"   Old: {current_date} / {current_meet}")
+        print(f"   New: {match['date']} / {match['meet']}")
+
+        entry['date'] = match['date']
+        entry['meet'] = match['meet']
+        if match.get('relay_time'):
+            entry['relay_time'] = match['relay_time']
+        updates += 1
+
     print(f"\n" + "=" * 60)
     print(f"Checked {checked} entries needing enrichment")
     print(f"Updated {updates} entries with meet information")
-    
+    print(f"Unmatched: {len(unmatched)}")
+
     if updates > 0:
         # Save updated data
         with open(leadoff_path, 'w') as f:
@@ -252,15 +231,11 @@ def main():
         print(f"✅ Saved to {leadoff_path}")
     else:
         print("ℹ️  No updates made - meet matching data may be incomplete")
-        print("\nEntries that still need enrichment:")
-        for gender in ['boys', 'girls']:
-            if gender not in leadoff_data:
-                continue
-            for event, entries in leadoff_data[gender].items():
-                for entry in entries:
-                    if 'Leadoff' in entry.get('meet', ''):
-                        print(f"   - {entry['name']} ({entry.get('year', '')}) {entry.get('time_str', '')} - {event}")
 
+    if unmatched:
+        print("\nEntries that still need enrichment:")
+        for event, entry in unmatched:
+            print(f"   - {entry['name']} ({entry.get('year', '')}) {entry.get('time_str', '')} - {event}")
 
 if __name__ == '__main__':
     main()
@@ -11,6 +11,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent))
 from time_formatter import format_time_display, format_date_display
 from swim_data_tool.services.record_generator import RecordGenerator
+from swim_store import load_swims
 
 
 # Seasons to generate (excluding 2025-26 as it's not complete)
@@ -42,7 +43,7 @@ def check_records_broken(df_season: pd.DataFrame, df_all_time: pd.DataFrame, sea
         for event_code in ['50-free', '100-free', '200-free', '500-free', '100-back', '100-breast', '100-fly', '200-im']:
             df_event = df_gender[df_gender['event_code'] == event_code]
             if not df_event.empty:
-                best = df_event.nsmallest(1, 'time_seconds').iloc[0]
+                best = df_event.nsmallest(1, 'time_hundredths').iloc[0]
                 season_bests[(gender, event_code)] = best
     
     # Compare with previous records
@@ -51,9 +52,9 @@ def check_records_broken(df_season: pd.DataFrame, df_all_time: pd.DataFrame, sea
         df_event_hist = df_gender_hist[df_gender_hist['event_code'] == event_code]
         
         if not df_event_hist.empty:
-            previous_best = df_event_hist.nsmallest(1, 'time_seconds').iloc[0]
+            previous_best = df_event_hist.nsmallest(1, 'time_hundredths').iloc[0]
             
-            if season_best['time_seconds'] < previous_best['time_seconds']:
+            if season_best['time_hundredths'] < previous_best['time_hundredths']:
                 records_broken.append({
                     'gender': gender,
                     'event': season_best['Event'],
@@ -213,7 +214,7 @@ def generate_annual_summary(output_path: Path, df_season: pd.DataFrame, df_all_t
         df_boys = df_season[df_season['Gender'] == 'M']
         df_boys_event = df_boys[df_boys['event_code'] == event_code]
         if not df_boys_event.empty:
-            fastest_boys = df_boys_event.nsmallest(1, 'time_seconds').iloc[0]
+            fastest_boys = df_boys_event.nsmallest(1, 'time_hundredths').iloc[0]
             boys_time = format_time_display(fastest_boys['SwimTime'])
             boys_year = grade_labels.get(int(fastest_boys['grade']), "") if not pd.isna(fastest_boys['grade']) else ""
             boys_swimmer = f"{fastest_boys['Name']} ({boys_year})" if boys_year else fastest_boys['Name']
@@ -225,7 +226,7 @@ def generate_annual_summary(output_path: Path, df_season: pd.DataFrame, df_all_t
         df_girls = df_season[df_season['Gender'] == 'F']
         df_girls_event = df_girls[df_girls['event_code'] == event_code]
         if not df_girls_event.empty:
-            fastest_girls = df_girls_event.nsmallest(1, 'time_seconds').iloc[0]
+            fastest_girls = df_girls_event.nsmallest(1, 'time_hundredths').iloc[0]
             girls_time = format_time_display(fastest_girls['SwimTime'])
             girls_year = grade_labels.get(int(fastest_girls['grade']), "") if not pd.isna(fastest_girls['grade']) else ""
             girls_swimmer = f"{fastest_girls['Name']} ({girls_year})" if girls_year else fastest_girls['Name']
@@ -254,21 +255,13 @@ def generate_annual_summary(output_path: Path, df_season: pd.DataFrame, df_all_t
 def main():
     print("\n🏊 Generating All Annual Summaries\n")
     
-    # Load data
+    # Load data (individual swims; relays should not count as individual times)
     print("📂 Loading swimmer data...")
     gen = RecordGenerator(Path('data'))
-    df_all = gen.load_all_swimmer_data()
+    df_all = load_swims(kind='individual')
     
     # Filter for team
-    df_team = gen.filter_team_swims(df_all, ['Tanque Verde'])
-    
-    # Parse events
-    df_normalized = gen.parse_and_normalize_events(df_team)
-    
-    # Filter out relay events (they should not count as individual times)
-    print("🔍 Filtering out relay events...")
-    df_individual = df_normalized[~df_normalized['Event'].str.contains('RELAY', case=False, na=False)].copy()
-    print(f"   Filtered out {len(df_normalized) - len(df_individual)} relay swims")
+    df_individual = gen.filter_team_swims(df_all, ['Tanque Verde'])
     print(f"✓ Loaded {len(df_individual):,} individual swims\n")
     
     output_dir = Path('data/records')
@@ -277,8 +270,7 @@ def main():
         print(f"📊 Generating {season} summary...")
         start_date, end_date = get_season_dates(season)
         
-        # Filter for this season
-        df_individual['SwimDate'] = pd.to_datetime(df_individual['SwimDate'], errors='coerce')
+        # Filter for this season (SwimDate is already typed in the swim store)
         df_season = df_individual[
             (df_individual['SwimDate'] >= start_date) &
             (df_individual['SwimDate'] < end_date)
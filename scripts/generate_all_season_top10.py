@@ -7,10 +7,14 @@ import pandas as pd
 from pathlib import Path
 from datetime import datetime
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, str(Path(__file__).parent))
 from time_formatter import format_time_display, format_date_display
 from swim_data_tool.services.record_generator import RecordGenerator
+from swim_store import load_swims
+from best_times import top_per_group
+from ranked_entries import make_entry, write_entries
 
 
 # Seasons to generate
@@ -32,19 +36,14 @@ HS_EVENTS = {
 }
 
 
-def get_season_dates(season: str):
-    """Get date range for a season"""
-    start_year = int(season.split('-')[0])
-    return (f"{start_year}-08-01", f"{start_year+1}-08-01")
+TOP_N = 10
 
 
-def generate_top10(output_path: Path, df: pd.DataFrame, gender: str, season: str):
-    """Generate top 10 list for a season"""
+def generate_top10(output_path: Path, df_top: pd.DataFrame, gender: str, season: str):
+    """Write the top 10 list for one season/gender from its ranked rows"""
     gender_label = "Boys" if gender == "M" else "Girls"
     
-    df_gender = df[df['Gender'] == gender].copy()
-    
-    if df_gender.empty:
+    if df_top.empty:
         print(f"    ⚠️  No {gender_label.lower()} data for {season}")
         return
     
@@ -59,18 +58,13 @@ def generate_top10(output_path: Path, df: pd.DataFrame, gender: str, season: str
     ]
     
     grade_labels = {9: "FR", 10: "SO", 11: "JR", 12: "SR"}
+    entries = []
+    events = dict(tuple(df_top.groupby('event_code', sort=False)))
     
     for event_code, event_name in HS_EVENTS.items():
-        df_event = df_gender[df_gender['event_code'] == event_code].copy()
-        
-        if df_event.empty:
-            continue
+        df_event = events.get(event_code)
         
-        # Get best time per swimmer
-        df_best = df_event.loc[df_event.groupby('Name')['time_seconds'].idxmin()]
-        df_top10 = df_best.nsmallest(10, 'time_seconds')
-        
-        if df_top10.empty:
+        if df_event is None:
             continue
         
         lines.extend([
@@ -80,14 +74,16 @@ def generate_top10(output_path: Path, df: pd.DataFrame, gender: str, season: str
             "|-----:|-----:|---------|------|------|------|",
         ])
         
-        for rank, (_, row) in enumerate(df_top10.iterrows(), 1):
+        for row in df_event.to_dict('records'):
             time = format_time_display(row['SwimTime'])
             date_str = format_date_display(row['SwimDate'])
             year = grade_labels.get(int(row['grade']), "") if not pd.isna(row['grade']) else ""
             
             lines.append(
-                f"| {rank} | {time} | {row['Name']} | {year} | {date_str} | {row['MeetName']} |"
+                f"| {row['rank']} | {time} | {row['Name']} | {year} | {date_str} | {row['MeetName']} |"
             )
+            entries.append(make_entry(event_name, time, row['Name'], date_str, row['MeetName'],
+                                      rank=int(row['rank']), year=year))
         
         lines.extend(["", "---", ""])
     
@@ -95,6 +91,7 @@ def generate_top10(output_path: Path, df: pd.DataFrame, gender: str, season: str
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, 'w') as f:
         f.write('\n'.join(lines))
+    write_entries(output_path, entries)
     
     print(f"    ✓ Generated: {output_path.name}")
 
@@ -102,49 +99,39 @@ def generate_top10(output_path: Path, df: pd.DataFrame, gender: str, season: str
 def main():
     print("\n🏊 Generating All Season Top 10 Lists\n")
     
-    # Load data
+    # Load data (individual swims; relays have their own records)
     print("📂 Loading swimmer data...")
     gen = RecordGenerator(Path('data'))
-    df_all = gen.load_all_swimmer_data()
+    df_all = load_swims(kind='individual', seasons=SEASONS)
     
     # Filter for team
-    df_team = gen.filter_team_swims(df_all, ['Tanque Verde'])
-    
-    # Parse events
-    df_normalized = gen.parse_and_normalize_events(df_team)
+    df_normalized = gen.filter_team_swims(df_all, ['Tanque Verde'])
     
-    # Filter out relay events (they have their own records)
-    df_individual = df_normalized[~df_normalized['Event'].str.contains('RELAY', case=False, na=False)].copy()
-    relay_count = len(df_normalized) - len(df_individual)
-    df_normalized = df_individual
+    print(f"✓ Loaded {len(df_normalized):,} individual swims\n")
     
-    print(f"✓ Loaded {len(df_normalized):,} individual swims ({relay_count:,} relay swims filtered out)\n")
+    # Every season/gender/event top 10 in one grouped pass. The store's season
+    # column uses the same Aug 1 cutoff the per-season date filters used.
+    df_events = df_normalized[df_normalized['event_code'].isin(list(HS_EVENTS))]
+    top = top_per_group(df_events, ['season', 'Gender', 'event_code'], n=TOP_N)
+    lists = dict(tuple(top.groupby(['season', 'Gender'], sort=False)))
+    empty = top.iloc[0:0]
     
     output_dir = Path('data/records')
-    
+    jobs = []
     for season in SEASONS:
-        print(f"📊 Generating top 10 for {season}...")
-        start_date, end_date = get_season_dates(season)
-        
-        # Filter for this season
-        df_normalized['SwimDate'] = pd.to_datetime(df_normalized['SwimDate'], errors='coerce')
-        df_season = df_normalized[
-            (df_normalized['SwimDate'] >= start_date) &
-            (df_normalized['SwimDate'] < end_date)
-        ].copy()
-        
-        if df_season.empty:
-            print(f"  ⚠️  No swims found for {season}, skipping...\n")
+        if not any(key[0] == season for key in lists):
+            print(f"  ⚠️  No swims found for {season}, skipping...")
             continue
-        
-        # Generate boys and girls
-        generate_top10(output_dir / f'top10-boys-{season}.md', df_season, 'M', season)
-        generate_top10(output_dir / f'top10-girls-{season}.md', df_season, 'F', season)
-        print("")
+        for gender, label in (('M', 'boys'), ('F', 'girls')):
+            jobs.append((output_dir / f'top10-{label}-{season}.md', lists.get((season, gender), empty), gender, season))
     
-    print("✓ All Season Top 10 Lists Complete!\n")
+    print(f"📊 Writing {len(jobs)} top 10 lists...")
+    with ThreadPoolExecutor() as pool:
+        for future in [pool.submit(generate_top10, *job) for job in jobs]:
+            future.result()
+    
+    print("\n✓ All Season Top 10 Lists Complete!\n")
 
 
 if __name__ == '__main__':
     main()
-
@@ -3,6 +3,9 @@
 Generate enhanced annual summary pages with index.html-style formatting.
 Generates pages oldest to newest to properly track class records.
 
+Pages whose sources are unchanged since the last run are reused from the
+render cache (render_cache.py) without being rewritten.
+
 Usage:
     python generate_annual_pages.py           # Generate all years
     python generate_annual_pages.py 2024-25   # Generate single year
@@ -14,6 +17,11 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent))
+from ranked_entries import load_entries
+from render_cache import RenderCache, write_page
+from time_parser import parse_hundredths, parse_time, NO_TIME
+
 
 # Seasons in order (oldest to newest)
 SEASONS = [
@@ -23,6 +31,9 @@ SEASONS = [
     "2022-23", "2023-24", "2024-25", "2025-26"
 ]
 
+# Bump when the page template changes in a way the render cache can't see
+TEMPLATE_VERSION = 1
+
 # Years with incomplete data (only state meet results available)
 INCOMPLETE_DATA_YEARS = ["2007-08", "2008-09", "2009-10", "2010-11", "2011-12"]
 
@@ -33,12 +44,30 @@ TOP10_SEASONS = [s for s in SEASONS if s != "2025-26"]
 # Project root (parent of scripts/ directory)
 PROJECT_ROOT = Path(__file__).parent.parent
 
-# Global cache for class records history
+# Global cache for class records history, plus lookup indexes built on first load:
+# (time hundredths, last name) -> records, and (event, time hundredths, last name) -> records
 _class_records_cache = None
+_class_records_by_time = None
+_class_records_by_event = None
+
+# Stroke abbreviations used in records-broken headings ('Boys 100 BR SCY')
+STROKE_NAMES = {
+    'fr': 'Freestyle', 'free': 'Freestyle', 'freestyle': 'Freestyle',
+    'bk': 'Backstroke', 'back': 'Backstroke', 'backstroke': 'Backstroke',
+    'br': 'Breaststroke', 'breast': 'Breaststroke', 'breaststroke': 'Breaststroke',
+    'fl': 'Butterfly', 'fly': 'Butterfly', 'butterfly': 'Butterfly',
+    'im': 'Individual Medley',
+}
+
+
+def _last_name(name):
+    parts = name.lower().split()
+    return parts[-1] if parts else ''
+
 
 def get_class_records_history():
     """Load class records history and cache it"""
-    global _class_records_cache
+    global _class_records_cache, _class_records_by_time, _class_records_by_event
     if _class_records_cache is None:
         history_file = PROJECT_ROOT / 'data/class_records_history.json'
         if history_file.exists():
@@ -46,54 +75,58 @@ def get_class_records_history():
                 _class_records_cache = json.load(f)
         else:
             _class_records_cache = []
+
+        _class_records_by_time = {}
+        _class_records_by_event = {}
+        for record in _class_records_cache:
+            hundredths = record.get('time_hundredths') or parse_hundredths(record.get('time', ''))
+            last = _last_name(record.get('name', ''))
+            _class_records_by_time.setdefault((hundredths, last), []).append(record)
+            _class_records_by_event.setdefault((record.get('event', ''), hundredths, last), []).append(record)
     return _class_records_cache
 
 
+def parse_event_hint(event_hint):
+    """'Boys 100 BR' -> ('boys', '100 Breaststroke'); None for parts not recognized"""
+    words = event_hint.replace('SCY', '').split()
+    gender = None
+    if words and words[0].lower() in ('boys', 'girls'):
+        gender = words.pop(0).lower()
+    if len(words) < 2 or not words[0].isdigit():
+        return gender, None
+    stroke = STROKE_NAMES.get(' '.join(words[1:]).lower())
+    return gender, f"{words[0]} {stroke}" if stroke else None
+
+
 def lookup_previous_record_meet(prev_time, prev_swimmer, event_hint=''):
     """Look up the meet location for a previous record from class records history.
     
     Args:
         prev_time: The time of the previous record
         prev_swimmer: The swimmer who held the previous record
-        event_hint: Optional hint about the event (e.g., '100 BR' or '100 Breaststroke')
+        event_hint: Optional hint about the event (e.g., 'Boys 100 BR' or '100 Breaststroke');
+            when recognized, only records in that event (and gender) match
     
     Returns:
         (meet, date, grade) tuple, or ('', '', '') if not found
     """
-    records = get_class_records_history()
-    
-    # Normalize event hint (handle abbreviations)
-    event_lower = event_hint.lower().replace('scy', '').strip()
-    event_words = {
-        'fr': 'freestyle', 'free': 'freestyle',
-        'bk': 'backstroke', 'back': 'backstroke',
-        'br': 'breaststroke', 'breast': 'breaststroke',
-        'fl': 'butterfly', 'fly': 'butterfly',
-        'im': 'individual medley', 'medley': 'individual medley'
-    }
-    
-    # Normalize swimmer name for comparison
-    prev_swimmer_lower = prev_swimmer.lower().strip()
-    prev_swimmer_last = prev_swimmer_lower.split()[-1] if prev_swimmer_lower else ''
-    
-    for record in records:
-        record_time = record.get('time', '')
-        record_name = record.get('name', '').lower()
-        record_name_last = record_name.split()[-1] if record_name else ''
-        
-        # Check if time matches
-        if record_time != prev_time:
-            continue
-        
-        # Check if name matches (full name or last name)
-        if prev_swimmer_lower not in record_name and record_name not in prev_swimmer_lower:
-            if prev_swimmer_last != record_name_last:
-                continue
-        
-        # Found a match
-        return (record.get('meet', ''), record.get('date', ''), record.get('grade', ''))
-    
-    return ('', '', '')
+    get_class_records_history()
+    hundredths = parse_hundredths(prev_time)
+    last = _last_name(prev_swimmer)
+
+    gender, event = parse_event_hint(event_hint)
+    if event:
+        candidates = [
+            r for r in _class_records_by_event.get((event, hundredths, last), [])
+            if gender is None or r.get('gender') == gender
+        ]
+    else:
+        candidates = _class_records_by_time.get((hundredths, last), [])
+
+    if not candidates:
+        return ('', '', '')
+    record = candidates[0]
+    return (record.get('meet', ''), record.get('date', ''), record.get('grade', ''))
 
 
 def grade_to_badge(grade_text):
@@ -109,37 +142,14 @@ def grade_to_badge(grade_text):
 
 
 def parse_top10_for_meets(records_dir, season, gender):
-    """Parse top10 file to get meet locations for #1 times"""
-    top10_file = records_dir / f'top10-{gender}-{season}.md'
+    """Get meet locations for #1 times from the top10 entries"""
     meets = {}
     
-    if not top10_file.exists():
-        return meets
-    
-    with open(top10_file, 'r') as f:
-        content = f.read()
-    
-    current_event = None
-    for line in content.split('\n'):
-        # Event header
-        if line.startswith('## ') and 'Freestyle' in line or 'Backstroke' in line or 'Breaststroke' in line or 'Butterfly' in line or 'Individual Medley' in line:
-            current_event = line.replace('## ', '').strip()
-        elif line.startswith('## '):
-            # Check for event names in ## headers
-            event_check = line.replace('## ', '').strip()
-            if any(e in event_check for e in ['Free', 'Back', 'Breast', 'Fly', 'IM']):
-                current_event = event_check
-        
-        # Parse rank 1 row
-        if current_event and '| 1 |' in line:
-            parts = [p.strip() for p in line.split('|') if p.strip()]
-            if len(parts) >= 6:
-                time = parts[1]
-                athlete = parts[2]
-                meet = parts[5] if len(parts) > 5 else ''
-                # Normalize event name for lookup
-                event_key = current_event.lower().replace('freestyle', 'free').replace('backstroke', 'back').replace('breaststroke', 'breast').replace('butterfly', 'fly').replace('individual medley', 'im')
-                meets[event_key] = {'time': time, 'athlete': athlete, 'meet': meet}
+    for entry in load_entries(records_dir / f'top10-{gender}-{season}.md'):
+        if entry['rank'] == 1:
+            # Normalize event name for lookup
+            event_key = entry['event'].lower().replace('freestyle', 'free').replace('backstroke', 'back').replace('breaststroke', 'breast').replace('butterfly', 'fly').replace('individual medley', 'im')
+            meets[event_key] = {'time': entry['time'], 'athlete': entry['athlete'], 'meet': entry['meet']}
     
     return meets
 
@@ -530,13 +540,9 @@ def generate_records_broken_html(data):
         improvement_html = ''
         if prev_time and prev_time != 'None' and new_time:
             try:
-                def time_to_seconds(t):
-                    if ':' in t:
-                        parts = t.split(':')
-                        return float(parts[0]) * 60 + float(parts[1])
-                    return float(t)
-                diff = time_to_seconds(prev_time) - time_to_seconds(new_time)
-                if diff > 0:
+                prev_seconds, new_seconds = parse_time(prev_time), parse_time(new_time)
+                diff = prev_seconds - new_seconds
+                if prev_seconds < NO_TIME and new_seconds < NO_TIME and diff > 0:
                     improvement_html = f'''
                             <div class="record-improvement">
                                 <span class="text-success"><strong>⬆ Improvement: {diff:.2f} seconds</strong></span>
@@ -919,7 +925,9 @@ def main():
     seasons_to_generate = [single_season] if single_season else SEASONS
     
     # Generate pages oldest to newest
+    cache = RenderCache(TEMPLATE_VERSION, 'annual_pages')
     generated = 0
+    rebuilt = 0
     for season in seasons_to_generate:
         md_file = records_dir / f'annual-summary-{season}.md'
         if not md_file.exists():
@@ -928,6 +936,16 @@ def main():
         
         print(f"  📄 {season}...", end=' ')
         
+        output_file = annual_dir / f'{season}.html'
+        key = cache.key([
+            md_file, class_records_file, Path(__file__),
+            records_dir / f'top10-boys-{season}.md', records_dir / f'top10-girls-{season}.md',
+        ])
+        if cache.is_fresh(output_file, key):
+            print("✓ (unchanged)")
+            generated += 1
+            continue
+        
         # Parse the markdown
         data = parse_annual_summary(md_file, records_dir)
         
@@ -935,17 +953,19 @@ def main():
         html = generate_page_html(data, class_records)
         
         # Write output
-        output_file = annual_dir / f'{season}.html'
-        with open(output_file, 'w') as f:
-            f.write(html)
+        if write_page(output_file, html):
+            rebuilt += 1
+        cache.record(output_file, key)
         
         records_count = len(data['records_broken'])
         class_count = len([r for r in class_records if r.get('season') == season])
         print(f"✓ ({records_count} records, {class_count} class records)")
         generated += 1
     
+    cache.save()
+    
     print("=" * 50)
-    print(f"✅ Generated {generated} annual summary pages")
+    print(f"✅ Generated {generated} annual summary pages ({rebuilt} rebuilt, {generated - rebuilt} reused)")
 
 
 if __name__ == '__main__':
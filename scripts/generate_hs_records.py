@@ -7,6 +7,9 @@ from dataclasses import dataclass
 from swim_data_tool.services.record_generator import RecordGenerator
 from swim_data_tool.models.events import convert_time_to_seconds, format_event_name
 from time_formatter import format_time_display, format_date_display
+from swim_store import load_swims
+from best_times import best_per_group
+from ranked_entries import make_entry, write_entries
 
 # High school grade groups
 GRADE_GROUPS = ["Freshman", "Sophomore", "Junior", "Senior", "Open"]
@@ -34,85 +37,54 @@ class HSRecordEntry:
     grade: str
     date: str
     meet: str
-    time_seconds: float = 0.0
+    time_hundredths: int = 0
+
+
+GRADE_GROUP_BY_GRADE = {9: "Freshman", 10: "Sophomore", 11: "Junior", 12: "Senior"}
 
 
 def determine_grade_group(grade):
     """Convert numeric grade to grade group label."""
     if pd.isna(grade):
         return None
-    grade = int(grade)
-    if grade == 9:
-        return "Freshman"
-    elif grade == 10:
-        return "Sophomore"
-    elif grade == 11:
-        return "Junior"
-    elif grade == 12:
-        return "Senior"
-    else:
-        return None
+    return GRADE_GROUP_BY_GRADE.get(int(grade))
 
 
 def get_best_times_by_grade(df: pd.DataFrame) -> dict[str, dict[str, HSRecordEntry]]:
-    """Get best times for each event/grade group combination."""
-    records: dict[str, dict[str, HSRecordEntry]] = {}
+    """
+    Get best times for each event/grade group combination.
     
-    # Make a copy and add grade groups
-    df = df.copy()
-    df['grade_group'] = df['grade'].apply(determine_grade_group)
+    Every record comes out of one grouped reduction over (event_code,
+    grade_group); the Open group is the same swims stacked with a
+    grade_group of "Open".
+    """
+    records: dict[str, dict[str, HSRecordEntry]] = {event_code: {} for event_code in HS_EVENTS}
     
-    # event_code and time_seconds are already added by parse_and_normalize_events
+    # event_code and time_hundredths are already typed in the swim store
     # Just filter for SCY events (event_course == 'scy')
-    df_scy = df[df['event_course'] == 'scy'].copy()
-    
-    # Process each event
-    for event_code, event_name in HS_EVENTS.items():
-        records[event_code] = {}
-        
-        # Filter for this event
-        df_event = df_scy[df_scy['event_code'] == event_code]
-        
-        if df_event.empty:
-            continue
-        
-        # Process each grade group
-        for grade_group in GRADE_GROUPS:
-            if grade_group == "Open":
-                # Open includes everyone
-                df_grade = df_event.copy()
-            else:
-                # Specific grade group
-                df_grade = df_event[df_event['grade_group'] == grade_group]
-            
-            if df_grade.empty:
-                continue
-            
-            # Sort by time and get best
-            df_grade = df_grade.sort_values('time_seconds')
-            
-            # Get best time per swimmer, then overall best
-            df_best_per_swimmer = df_grade.drop_duplicates(subset=['Name'], keep='first')
-            
-            if df_best_per_swimmer.empty:
-                continue
-            
-            # Get overall best
-            best = df_best_per_swimmer.iloc[0]
-            
-            # Create record entry with formatted time
-            record = HSRecordEntry(
-                event_code=event_code,
-                grade_group=grade_group,
-                swimmer_name=best.get('Name', ''),
-                time=format_time_display(best.get('SwimTime', '')),
-                grade=str(int(best.get('grade', 0))) if not pd.isna(best.get('grade')) else '',
-                date=best.get('SwimDate', ''),
-                meet=best.get('MeetName', ''),
-                time_seconds=best.get('time_seconds', 0.0),
-            )
-            
-            records[event_code][grade_group] = record
+    df_scy = df[(df['event_course'] == 'scy') & df['event_code'].isin(list(HS_EVENTS))]
+    if df_scy.empty:
+        return records
+    
+    grade_groups = pd.to_numeric(df_scy['grade'], errors='coerce').map(GRADE_GROUP_BY_GRADE)
+    df_grouped = pd.concat(
+        [df_scy.assign(grade_group=grade_groups), df_scy.assign(grade_group="Open")],
+        ignore_index=True,
+    )
+    
+    best = best_per_group(df_grouped, ['event_code', 'grade_group'])
+    
+    for row in best.to_dict('records'):
+        records[row['event_code']][row['grade_group']] = HSRecordEntry(
+            event_code=row['event_code'],
+            grade_group=row['grade_group'],
+            swimmer_name=row.get('Name', ''),
+            time=format_time_display(row.get('SwimTime', '')),
+            grade=str(int(row['grade'])) if not pd.isna(row.get('grade')) else '',
+            date=row.get('SwimDate', ''),
+            meet=row.get('MeetName', ''),
+            time_hundredths=int(row.get('time_hundredths', 0)),
+        )
     
     return records
 
@@ -130,6 +102,7 @@ def generate_hs_markdown(records: dict, gender: str, team_name: str, output_path
         "---",
         "",
     ]
+    entries = []
     
     # Generate tables for each event
     for event_code, event_name in HS_EVENTS.items():
@@ -151,6 +124,8 @@ def generate_hs_markdown(records: dict, gender: str, team_name: str, output_path
                     lines.append(
                         f"| {grade_group} | {record.time} | {record.swimmer_name} | {date_str} | {record.meet} |"
                     )
+                entries.append(make_entry(event_name, record.time, record.swimmer_name, date_str, record.meet,
+                                          grade_group=grade_group, is_record=grade_group == "Open"))
             else:
                 lines.append(f"| {grade_group} | — | — | — | — |")
         
@@ -165,6 +140,7 @@ def generate_hs_markdown(records: dict, gender: str, team_name: str, output_path
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, 'w') as f:
         f.write('\n'.join(lines))
+    write_entries(output_path, entries)
     
     print(f"  ✓ Generated: {output_path}")
 
@@ -173,28 +149,16 @@ def main():
     """Main entry point."""
     print("\n🏊 Generating High School Records\n")
     
-    # Load data
+    # Load data (individual swims with events already parsed)
     print("📂 Loading swimmer data...")
     gen = RecordGenerator(Path('data'))
-    df_all = gen.load_all_swimmer_data()
-    print(f"✓ Loaded {len(df_all):,} swims\n")
+    df_all = load_swims(kind='individual')
+    print(f"✓ Loaded {len(df_all):,} individual swims (relays have separate records)\n")
     
     # Filter for team
     print("🔍 Filtering team swims...")
-    df_team = gen.filter_team_swims(df_all, ['Tanque Verde'])
-    print(f"✓ Found {len(df_team):,} team swims\n")
-    
-    # Parse events
-    print("⚙️  Parsing events...")
-    df_normalized = gen.parse_and_normalize_events(df_team)
-    print(f"✓ Parsed events\n")
-    
-    # Filter out relay events (they should not count as individual records)
-    print("🔍 Filtering out relay events...")
-    df_individual = df_normalized[~df_normalized['Event'].str.contains('RELAY', case=False, na=False)].copy()
-    relay_count = len(df_normalized) - len(df_individual)
-    print(f"✓ Filtered out {relay_count:,} relay swims (relays have separate records)\n")
-    df_normalized = df_individual
+    df_normalized = gen.filter_team_swims(df_all, ['Tanque Verde'])
+    print(f"✓ Found {len(df_normalized):,} team swims\n")
     
     # Check gender split
     has_gender = 'Gender' in df_normalized.columns and df_normalized['Gender'].notna().any()
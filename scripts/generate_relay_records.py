@@ -14,6 +14,7 @@ import sys
 # Add time_formatter to path
 sys.path.insert(0, str(Path(__file__).parent))
 from time_formatter import format_time_display, format_date_display
+from swim_store import load_swims, normalize_relay_event_code
 
 
 # High school relay events
@@ -45,64 +46,22 @@ def determine_grade_group(grade: float | None) -> str:
 
 def normalize_event_code(event: str) -> str:
     """Convert event name to event code"""
-    event_lower = event.lower()
-    if "200" in event_lower and "medley" in event_lower:
-        return "200-medley-relay"
-    if "200" in event_lower and ("free" in event_lower or "fr" in event_lower):
-        return "200-free-relay"
-    if "400" in event_lower and ("free" in event_lower or "fr" in event_lower):
-        return "400-free-relay"
-    return None
+    return normalize_relay_event_code(event)
 
 
 def load_relay_data() -> pd.DataFrame:
-    """Load all relay data from swimmer CSVs"""
-    data_dir = Path('data/raw/swimmers')
-    all_relays = []
-    
-    for csv_file in data_dir.glob('*.csv'):
-        try:
-            df = pd.read_csv(csv_file)
-            # Filter for relay events
-            relay_df = df[df['Event'].str.contains('RELAY', na=False, case=False)]
-            if not relay_df.empty:
-                all_relays.append(relay_df)
-        except Exception as e:
-            print(f"Warning: Could not read {csv_file}: {e}")
-            continue
+    """Load all relay swims from the consolidated swim store"""
+    combined = load_swims(kind='relay')
     
-    if not all_relays:
+    if combined.empty:
         return pd.DataFrame()
     
-    combined = pd.concat(all_relays, ignore_index=True)
-    
-    # Parse times to seconds for comparison
-    combined['time_seconds'] = combined['SwimTime'].apply(parse_time_to_seconds)
-    combined['SwimDate'] = pd.to_datetime(combined['SwimDate'], errors='coerce')
-    combined['event_code'] = combined['Event'].apply(normalize_event_code)
+    # SwimDate, time_hundredths and event_code are already typed in the store
     combined['grade_group'] = combined['grade'].apply(determine_grade_group)
     
     return combined
 
 
-def parse_time_to_seconds(time_str: str) -> float:
-    """Convert time string to seconds"""
-    if not time_str or pd.isna(time_str):
-        return float('inf')
-    
-    try:
-        time_str = str(time_str).strip()
-        if ':' in time_str:
-            parts = time_str.split(':')
-            minutes = int(parts[0])
-            seconds = float(parts[1])
-            return minutes * 60 + seconds
-        else:
-            return float(time_str)
-    except (ValueError, IndexError):
-        return float('inf')
-
-
 def get_relay_participants(df: pd.DataFrame, event_code: str, gender: str, 
                            swim_date: str, meet_name: str, time: str) -> list:
     """Get list of swimmers who participated in a specific relay"""
@@ -170,7 +129,7 @@ def generate_relay_records_markdown(df: pd.DataFrame, gender: str, output_path:
         
         # Get top 10 unique relay times (deduplicate by date, meet, and time)
         df_unique = df_event.drop_duplicates(subset=['SwimDate', 'MeetName', 'SwimTime'])
-        df_top10 = df_unique.nsmallest(10, 'time_seconds')
+        df_top10 = df_unique.nsmallest(10, 'time_hundredths')
         
         lines.append("| Rank | Time | Participants | Date | Meet |")
         lines.append("|-----:|-----:|--------------|------|------|")
@@ -10,6 +10,8 @@ from pathlib import Path
 from datetime import datetime
 from swim_data_tool.services.record_generator import RecordGenerator
 from time_formatter import format_time_display, format_date_display
+from swim_store import load_swims
+from ranked_entries import make_entry, write_entries
 
 
 # High school events (8 events)
@@ -30,16 +32,16 @@ def get_current_season_dates():
     return ("2024-08-01", "2025-08-01")
 
 
-def generate_top10_for_event(df: pd.DataFrame, event_code: str, event_name: str) -> list:
-    """Generate top 10 list for a single event"""
+def generate_top10_for_event(df: pd.DataFrame, event_code: str, event_name: str) -> tuple[list, list]:
+    """Generate top 10 list for a single event (markdown lines and ranked entries)"""
     # Filter for this event
     df_event = df[df['event_code'] == event_code].copy()
     
     if df_event.empty:
-        return []
+        return [], []
     
     # Sort by time
-    df_event = df_event.sort_values('time_seconds')
+    df_event = df_event.sort_values('time_hundredths', kind='stable')
     
     # Get best time per swimmer
     df_best = df_event.drop_duplicates(subset=['Name'], keep='first')
@@ -53,6 +55,7 @@ def generate_top10_for_event(df: pd.DataFrame, event_code: str, event_name: str)
     lines = [f"### {event_name}", ""]
     lines.append("| Rank | Time | Athlete | Year | Date | Meet |")
     lines.append("|-----:|-----:|---------|------|------|------|")
+    entries = []
     
     for rank, (_, row) in enumerate(df_top10.iterrows(), 1):
         if not pd.isna(row['grade']):
@@ -65,9 +68,10 @@ def generate_top10_for_event(df: pd.DataFrame, event_code: str, event_name: str)
         lines.append(
             f"| {rank} | {time} | {row['Name']} | {year} | {date_str} | {row['MeetName']} |"
         )
+        entries.append(make_entry(event_name, time, row['Name'], date_str, row['MeetName'], rank=rank, year=year))
     
     lines.append("")
-    return lines
+    return lines, entries
 
 
 def generate_top10_markdown(df: pd.DataFrame, gender: str, output_path: Path, title: str):
@@ -85,9 +89,11 @@ def generate_top10_markdown(df: pd.DataFrame, gender: str, output_path: Path, ti
     ]
     
     # Generate top 10 for each event
+    entries = []
     for event_code, event_name in HS_EVENTS.items():
-        event_lines = generate_top10_for_event(df, event_code, event_name)
+        event_lines, event_entries = generate_top10_for_event(df, event_code, event_name)
         lines.extend(event_lines)
+        entries.extend(event_entries)
     
     lines.extend([
         "---",
@@ -100,6 +106,7 @@ def generate_top10_markdown(df: pd.DataFrame, gender: str, output_path: Path, ti
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, 'w') as f:
         f.write('\n'.join(lines))
+    write_entries(output_path, entries)
     
     print(f"  ✓ Generated: {output_path}")
 
@@ -110,28 +117,16 @@ def main():
     
     print(f"\n🏊 Generating Top 10 Lists\n")
     
-    # Load data
+    # Load data (individual swims with events already parsed)
     print("📂 Loading swimmer data...")
     gen = RecordGenerator(Path('data'))
-    df_all = gen.load_all_swimmer_data()
-    print(f"✓ Loaded {len(df_all):,} swims\n")
+    df_all = load_swims(kind='individual')
+    print(f"✓ Loaded {len(df_all):,} individual swims (relays have separate records)\n")
     
     # Filter for team
     print("🔍 Filtering team swims...")
-    df_team = gen.filter_team_swims(df_all, ['Tanque Verde'])
-    print(f"✓ Found {len(df_team):,} team swims\n")
-    
-    # Parse events
-    print("⚙️  Parsing events...")
-    df_normalized = gen.parse_and_normalize_events(df_team)
-    print(f"✓ Parsed events\n")
-    
-    # Filter out relay events (they have their own records)
-    print("🔍 Filtering out relay events...")
-    df_individual = df_normalized[~df_normalized['Event'].str.contains('RELAY', case=False, na=False)].copy()
-    relay_count = len(df_normalized) - len(df_individual)
-    print(f"✓ Filtered out {relay_count:,} relay swims (relays have separate records)\n")
-    df_normalized = df_individual
+    df_normalized = gen.filter_team_swims(df_all, ['Tanque Verde'])
+    print(f"✓ Found {len(df_normalized):,} team swims\n")
     
     # Check gender split
     has_gender = 'Gender' in df_normalized.columns and df_normalized['Gender'].notna().any()
@@ -2,12 +2,31 @@
 """
 Generate GitHub Pages website from markdown records
 Converts all markdown files to HTML with Bootstrap styling and navigation
+
+Pages are independent, so they are rendered on a process pool and each is
+written atomically (temp file + rename). Pages whose sources and template
+are unchanged since the last run are reused from the render cache
+(render_cache.py) without being rewritten:
+
+    python generate_website.py            # one worker per core
+    python generate_website.py --jobs 1   # render serially
 """
 
+import argparse
+import os
 import re
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+from relay_splits import INDEX_SOURCES, RELAY_TYPES, SPLITS_DIR, SplitIndex, load_splits, season_of
+from render_cache import RenderCache, write_page
+from time_parser import parse_hundredths, format_hundredths_as_seconds, NO_TIME_HUNDREDTHS
+
+# Bump when the page templates change in a way the render cache can't see
+TEMPLATE_VERSION = 1
+
 
 def create_nav_html():
     """Create mobile-friendly navigation with Boys/Girls toggle and emoji shortcuts"""
@@ -535,18 +554,17 @@ def convert_top10_to_cards(md_file, output_file, title):
     full_html = create_html_page(title, html_content)
     
     # Write output
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, 'w') as f:
-        f.write(full_html)
+    return write_page(output_file, full_html)
 
 
-def convert_markdown_file(md_file, output_file, title=None):
-    """Convert a markdown file to HTML"""
+def convert_markdown_file(md_file, output_file, title=None, md_content=None):
+    """Convert a markdown file (or already-filtered content from it) to HTML"""
     print(f"Converting {md_file.name} → {output_file.name}")
     
     # Read markdown
-    with open(md_file, 'r') as f:
-        md_content = f.read()
+    if md_content is None:
+        with open(md_file, 'r') as f:
+            md_content = f.read()
     
     # Extract title from first heading if not provided
     if not title:
@@ -618,9 +636,7 @@ def convert_markdown_file(md_file, output_file, title=None):
     full_html = create_html_page(title, html_content)
     
     # Write output
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, 'w') as f:
-        f.write(full_html)
+    return write_page(output_file, full_html)
 
 
 def extract_open_records(md_file):
@@ -736,39 +752,24 @@ def generate_overall_records_page(records_dir, docs_dir):
     boys_relays = extract_top_relay_records(records_dir / 'relay-records-boys.md')
     girls_relays = extract_top_relay_records(records_dir / 'relay-records-girls.md')
     
-    # Load relay splits
-    splits_data = {}
-    splits_file = Path('data/historical_splits/all_relay_splits.json')
-    if splits_file.exists():
-        import json
-        with open(splits_file, 'r') as f:
-            splits_data = json.load(f)
+    # Load relay splits for the seasons of the relays shown
+    seasons = {season_of(relay['date']) for relay in boys_relays + girls_relays}
+    splits_data = load_splits(seasons=seasons)
     
     def get_last_names(participants):
         """Extract last names from participants string"""
         names = [n.strip() for n in participants.split(',')]
         return ', '.join(n.split()[-1] for n in names)
     
+    splits_index = SplitIndex(splits_data)
+    
     def find_relay_splits(relay, gender, event):
         """Find splits for a relay from the splits data"""
+        if event not in RELAY_TYPES:
+            return []
         swimmers = [s.strip() for s in relay['participants'].split(',')]
-        relay_set = set(s.lower() for s in swimmers)
-        
-        for split_entry in splits_data.get(gender, []):
-            entry_type = split_entry.get('type', '')
-            if entry_type != event:
-                continue
-            
-            entry_swimmers = []
-            for s in split_entry.get('swimmers', []):
-                import re
-                name = re.sub(r'\s*-\s*(Fr|So|Jr|Sr)\.$', '', s, flags=re.IGNORECASE)
-                entry_swimmers.append(name.strip())
-            
-            entry_set = set(s.lower() for s in entry_swimmers)
-            if len(relay_set & entry_set) >= 3:
-                return split_entry.get('splits', [])
-        return []
+        split_entry = splits_index.find(gender, event, swimmers)
+        return split_entry.splits if split_entry else []
     
     def get_stroke_for_position(event, pos):
         if 'Medley' in event:
@@ -829,12 +830,10 @@ def generate_overall_records_page(records_dir, docs_dir):
                         if relay['event'] == '400 Free Relay' and len(splits) == 8:
                             idx = i * 2
                             if idx + 1 < len(splits):
-                                try:
-                                    t1 = float(splits[idx].replace('00:', ''))
-                                    t2 = float(splits[idx + 1].replace('00:', ''))
-                                    split_time = f"{t1 + t2:.2f}"
-                                except:
-                                    pass
+                                t1 = parse_hundredths(splits[idx])
+                                t2 = parse_hundredths(splits[idx + 1])
+                                if NO_TIME_HUNDREDTHS not in (t1, t2):
+                                    split_time = format_hundredths_as_seconds(t1 + t2)
                         elif i < len(splits):
                             split_time = splits[i].replace('00:', '')
                     
@@ -876,11 +875,10 @@ def generate_overall_records_page(records_dir, docs_dir):
     
     # Write output
     output_file = docs_dir / 'records' / 'overall.html'
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, 'w') as f:
-        f.write(full_html)
+    written = write_page(output_file, full_html)
     
     print(f"  Created: {output_file}")
+    return written
 
 
 def filter_out_open_records(md_content):
@@ -894,7 +892,30 @@ def filter_out_open_records(md_content):
     return '\n'.join(filtered_lines)
 
 
+def cache_summary(output):
+    """'N rebuilt, M reused' from a page script's output"""
+    counts = re.findall(r'\d+ rebuilt, \d+ reused', output)
+    return counts[-1] if counts else 'no render cache summary'
+
+
+def render_pages(jobs, workers):
+    """
+    Run page jobs (function, args) on a process pool, or serially for one worker.
+    
+    Returns each job's result (True if its page was written).
+    """
+    if workers <= 1:
+        return [func(*args) for func, args in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [future.result() for future in [pool.submit(func, *args) for func, args in jobs]]
+
+
 def main():
+    parser = argparse.ArgumentParser(description='Generate the GitHub Pages website')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes for page rendering')
+    args = parser.parse_args()
+    
     print("=" * 80)
     print("GENERATING TANQUE VERDE SWIM WEBSITE")
     print("=" * 80)
@@ -904,13 +925,27 @@ def main():
     project_root = Path(__file__).parent.parent
     records_dir = project_root / 'records'
     docs_dir = project_root / 'docs'
+    script_dir = Path(__file__).parent
     
-    # Generate Overall Records page (OPEN records only)
-    generate_overall_records_page(records_dir, docs_dir)
+    # Relay pages (rebuild_relay_pages.py, expandable cards with splits data) and
+    # annual summaries (generate_annual_pages.py, styled format) come from their
+    # own scripts; run them alongside the page rendering below
+    scripts = ThreadPoolExecutor(max_workers=2)
+    relay_run = scripts.submit(subprocess.run, ['python3', str(script_dir / 'rebuild_relay_pages.py')],
+                               capture_output=True, text=True)
+    annual_run = scripts.submit(subprocess.run, ['python3', str(script_dir / 'generate_annual_pages.py')],
+                                capture_output=True, text=True)
+    
+    # (function, args, output page, source files)
+    jobs = [(
+        generate_overall_records_page, (records_dir, docs_dir),
+        docs_dir / 'records' / 'overall.html',
+        [*records_dir.glob('records-*.md'), *records_dir.glob('relay-records-*.md'),
+         *SPLITS_DIR.glob('splits_*.json'), *INDEX_SOURCES],
+    )]
     
     # Convert team records (By Grade - excludes OPEN)
-    print("\n📊 Converting By Grade Records...")
-    for record_file in records_dir.glob('records-*.md'):
+    for record_file in sorted(records_dir.glob('records-*.md')):
         if 'boys' in record_file.name:
             output = docs_dir / 'records' / 'boys-bygrade.html'
             title = "Boys Records by Grade"
@@ -925,28 +960,10 @@ def main():
             md_content = f.read()
         filtered_content = filter_out_open_records(md_content)
         
-        # Write to temp file and convert
-        temp_file = record_file.with_suffix('.filtered.md')
-        with open(temp_file, 'w') as f:
-            f.write(filtered_content)
-        
-        convert_markdown_file(temp_file, output, title)
-        temp_file.unlink()  # Clean up temp file
-    
-    # Relay pages are generated by rebuild_relay_pages.py (not from markdown)
-    # This provides expandable cards with splits data
-    print("\n🏃 Generating Relay Records (via rebuild_relay_pages.py)...")
-    import subprocess
-    script_dir = Path(__file__).parent
-    result = subprocess.run(['python3', str(script_dir / 'rebuild_relay_pages.py')], capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"  ⚠️ Warning: rebuild_relay_pages.py failed: {result.stderr}")
-    else:
-        print("  ✓ Relay pages generated with expandable cards")
+        jobs.append((convert_markdown_file, (record_file, output, title, filtered_content), output, [record_file]))
     
     # Convert top 10 lists (card format matching Overall Records)
-    print("\n🔟 Converting Top 10 Lists (Card Format)...")
-    for top10_file in records_dir.glob('top10-*.md'):
+    for top10_file in sorted(records_dir.glob('top10-*.md')):
         gender = 'boys' if 'boys' in top10_file.name else 'girls'
         season = top10_file.stem.replace(f'top10-{gender}-', '')
         
@@ -958,15 +975,40 @@ def main():
             output_name = f"{gender}-{season}.html"
         
         output = docs_dir / 'top10' / output_name
-        convert_top10_to_cards(top10_file, output, title)
+        jobs.append((convert_top10_to_cards, (top10_file, output, title), output, [top10_file]))
+    
+    # Skip pages whose sources are unchanged since they were last rendered
+    cache = RenderCache(TEMPLATE_VERSION, 'website')
+    keys = {}
+    stale = []
+    for func, func_args, output, sources in jobs:
+        keys[output] = cache.key([*sources, Path(__file__)])
+        if not cache.is_fresh(output, keys[output]):
+            stale.append((func, func_args, output))
+    
+    print(f"📊 Rendering {len(stale)} of {len(jobs)} pages ({args.jobs} workers)...")
+    written = render_pages([(func, func_args) for func, func_args, _ in stale], args.jobs)
+    for _, _, output in stale:
+        cache.record(output, keys[output])
+    cache.save()
+    
+    rebuilt = sum(written)
+    print(f"  ✓ {rebuilt} pages rebuilt, {len(jobs) - rebuilt} reused")
+    
+    print("\n🏃 Generating Relay Records (via rebuild_relay_pages.py)...")
+    result = relay_run.result()
+    if result.returncode != 0:
+        print(f"  ⚠️ Warning: rebuild_relay_pages.py failed: {result.stderr}")
+    else:
+        print(f"  ✓ Relay pages generated with expandable cards ({cache_summary(result.stdout)})")
     
-    # Generate annual summaries using dedicated script (maintains styled format)
     print("\n📅 Generating Annual Summaries (via generate_annual_pages.py)...")
-    result = subprocess.run(['python3', str(script_dir / 'generate_annual_pages.py')], capture_output=True, text=True)
+    result = annual_run.result()
+    scripts.shutdown()
     if result.returncode != 0:
         print(f"  ⚠️ Warning: generate_annual_pages.py failed: {result.stderr}")
     else:
-        print("  ✓ Annual pages generated with styled format")
+        print(f"  ✓ Annual pages generated with styled format ({cache_summary(result.stdout)})")
     
     print("\n" + "=" * 80)
     print("✅ Website generation complete!")
@@ -976,4 +1018,3 @@ def main():
 
 if __name__ == '__main__':
     main()
-
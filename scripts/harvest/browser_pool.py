@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Shared Playwright browser for the azpreps365 and SwimCloud harvesters.
+
+BrowserPool launches one Chromium and opens N pages in a single context.
+pool.map(task, items) runs an async task(page, item) for every item, each on
+whichever page is free, so up to N events or schools load at once; results
+come back in input order. The browser stays open across map() calls, so a
+harvest that scrapes leaderboards and then schools launches Chromium once.
+
+Instead of fixed sleeps after navigation, tasks wait for the elements they
+read: wait_for_rows() waits for the first result row, then briefly for the
+expected number of rows to render.
+
+Given a SnapshotStore (snapshots.py), tasks that load pages through
+pool.fetch(page, key, load) have every page recorded; with replay=True no
+browser is launched, tasks get page=None and pool.fetch returns the recorded
+snapshots, so the parsing can be re-run offline.
+
+Usage:
+    from browser_pool import BrowserPool, wait_for_rows
+
+    async def scrape(page, url):
+        await page.goto(url, wait_until="domcontentloaded")
+        await wait_for_rows(page, 'table tbody tr', 50)
+        return await page.eval_on_selector_all('table tbody tr', '...')
+
+    with BrowserPool(pages=4) as pool:
+        tables = pool.map(scrape, urls)
+
+    async def load(page):
+        await page.goto(url, wait_until="domcontentloaded")
+        return await page.content()
+
+    html = await pool.fetch(page, url, load)   # inside a task
+"""
+
+import asyncio
+
+INSTALL_HINT = "❌ Playwright not installed. Install with: pip install playwright && playwright install"
+
+# Default number of pages loading at once
+DEFAULT_PAGES = 4
+
+
+async def wait_for_rows(page, selector: str, count: int, timeout: float = 10000,
+                        settle: float = 2000) -> bool:
+    """
+    Wait for result rows to render.
+
+    Waits up to timeout ms for the first row matching selector, then up to
+    settle ms more for count rows (pages that have fewer rows than count
+    stop waiting at settle). Returns False if no row appeared.
+    """
+    from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+    try:
+        await page.wait_for_selector(selector, timeout=timeout)
+    except PlaywrightTimeout:
+        return False
+    try:
+        await page.wait_for_function(
+            '([selector, count]) => document.querySelectorAll(selector).length >= count',
+            arg=[selector, count], timeout=settle)
+    except PlaywrightTimeout:
+        pass
+    return True
+
+
+class BrowserPool:
+    """One Chromium with a fixed set of reusable pages"""
+
+    def __init__(self, pages: int = DEFAULT_PAGES, headless: bool = True,
+                 context_options: dict | None = None, snapshots=None,
+                 replay: bool = False):
+        self.size = max(1, pages)
+        self.headless = headless
+        self.context_options = context_options or {}
+        self.snapshots = snapshots
+        self.replay = replay
+        if replay and snapshots is None:
+            raise ValueError("replay needs a SnapshotStore")
+        self._loop = None
+        self._playwright = None
+        self._browser = None
+        self._pages = None
+
+    def __enter__(self) -> 'BrowserPool':
+        if self.replay:
+            self._loop = asyncio.new_event_loop()
+            self._pages = asyncio.Queue()
+            for _ in range(self.size):
+                self._pages.put_nowait(None)
+            return self
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError:
+            raise ImportError(INSTALL_HINT) from None
+
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(self._start(async_playwright))
+        except BaseException:
+            self.close()
+            raise
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    async def _start(self, async_playwright):
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        context = await self._browser.new_context(**self.context_options)
+        self._pages = asyncio.Queue()
+        for _ in range(self.size):
+            self._pages.put_nowait(await context.new_page())
+
+    async def _stop(self):
+        if self._browser:
+            await self._browser.close()
+        if self._playwright:
+            await self._playwright.stop()
+
+    def close(self):
+        """Close the browser (safe to call more than once)"""
+        if self._loop is None:
+            return
+        try:
+            self._loop.run_until_complete(self._stop())
+        finally:
+            self._loop.close()
+            self._loop = self._browser = self._playwright = self._pages = None
+
+    async def fetch(self, page, key: str, load) -> str:
+        """
+        Page body for key: await load(page) (recorded to the snapshot store,
+        if any), or the recorded snapshot when replaying.
+        """
+        if self.replay:
+            html = self.snapshots.get(key)
+            if html is None:
+                raise LookupError(f"no snapshot for {key}")
+            return html
+        html = await load(page)
+        if self.snapshots is not None:
+            self.snapshots.record(key, html)
+        return html
+
+    async def _run(self, task, item):
+        page = await self._pages.get()
+        try:
+            return await task(page, item)
+        except Exception as e:
+            print(f"      ⚠️  Error on {item}: {e}")
+            return None
+        finally:
+            self._pages.put_nowait(page)
+
+    def map(self, task, items) -> list:
+        """
+        Run task(page, item) for every item, up to `pages` at a time.
+
+        Returns the results in input order; an item whose task raised is
+        reported and gives None.
+        """
+        if self._loop is None:
+            raise RuntimeError("BrowserPool is not open (use it in a with block)")
+
+        async def run_all():
+            return await asyncio.gather(*(self._run(task, item) for item in items))
+
+        return self._loop.run_until_complete(run_all())
@@ -3,14 +3,28 @@
 Extract Tanque Verde swim times from historical AIA State Championship PDFs.
 
 Downloads PDFs from AZPreps365 archives and extracts swim data.
+
+Text is streamed out of pdftotext page by page and parsed in one pass: the
+current event is tracked from "Event N Boys/Girls ..." headers, recent
+"Last, First" name lines are kept in a short window, and each school line
+waits for the first time line after it. Memory stays flat and time is
+linear in the size of the PDF. Any school can be extracted (or every
+school, for full-division results), optionally limited to some events.
+
+Usage:
+    python3 extract_historical_state.py
+    python3 extract_historical_state.py --school "Salpointe Catholic"
+    python3 extract_historical_state.py --all-schools
 """
 
+import argparse
 import subprocess
 import re
 import os
+from collections import deque
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 
 @dataclass
@@ -22,6 +36,7 @@ class SwimResult:
     time: str
     year: int
     gender: str  # M or F
+    school: str = ''
     
     def to_dict(self):
         return {
@@ -30,7 +45,8 @@ class SwimResult:
             'grade': self.grade,
             'time': self.time,
             'year': self.year,
-            'gender': self.gender
+            'gender': self.gender,
+            'school': self.school
         }
 
 
@@ -49,6 +65,23 @@ MEET_IDS = {
     2011: 12611,
 }
 
+# Event header, e.g. "Event 3 Boys 200 Yard IM"
+EVENT_RE = re.compile(r'Event \d+ (Boys|Girls) (.+)')
+
+# Swimmer names are "Last, First" on a line of their own
+NAME_RE = re.compile(r'^([A-Z][a-z]+),\s*([A-Z][a-z]+)$')
+
+# Times are like "24.45" or "1:23.45" or "5:12.34", optionally with a letter suffix
+TIME_RE = re.compile(r'^(\d{1,2}:)?\d{1,2}\.\d{2}(\s*[A-Z])?$')
+
+# Grade and school, e.g. "SR Tanque Verde"
+SCHOOL_LINE_RE = re.compile(r'^(FR|SO|JR|SR)\s+(\S.*?)\s*$')
+
+# Names are looked for up to NAME_WINDOW lines before a school line, times
+# up to TIME_WINDOW lines from it
+NAME_WINDOW = 10
+TIME_WINDOW = 10
+
 
 def download_pdf(year: int, output_dir: Path) -> Optional[Path]:
     """Download state championship PDF for a given year."""
@@ -95,65 +128,145 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
         return ""
 
 
-def parse_tanque_verde_results(text: str, year: int) -> list[SwimResult]:
-    """Parse Tanque Verde results from PDF text."""
-    results = []
-    lines = text.split('\n')
+def iter_pdf_pages(pdf_path: Path) -> Iterator[list[str]]:
+    """
+    Lines of a PDF, one page at a time, streamed from pdftotext.
+    
+    Only the current page is held in memory. pdftotext is stopped if the
+    caller stops iterating early.
+    """
+    try:
+        proc = subprocess.Popen(['pdftotext', str(pdf_path), '-'], stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True)
+    except FileNotFoundError:
+        print("pdftotext not found. Install with: brew install poppler")
+        return
+    
+    page = []
+    try:
+        for line in proc.stdout:
+            line = line.rstrip('\n')
+            # Pages are separated by a form feed at the start of the next page's first line
+            while '\f' in line:
+                before, line = line.split('\f', 1)
+                if before:
+                    page.append(before)
+                if page:
+                    yield page
+                page = []
+            page.append(line)
+        if any(page):
+            yield page
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+    if proc.returncode:
+        print(f"Error extracting text from {pdf_path}: pdftotext exited with {proc.returncode}")
+
+
+def iter_pdf_lines(pdf_path: Path) -> Iterator[str]:
+    """Lines of a PDF in order, streamed page by page."""
+    for page in iter_pdf_pages(pdf_path):
+        yield from page
+
+
+def stream_school_results(lines: Iterable[str], year: int, school: Optional[str] = 'Tanque Verde',
+                          events: Optional[set[str]] = None) -> Iterator[SwimResult]:
+    """
+    Parse swim results for one school (or every school if school is None).
+    
+    A single pass over lines: event headers set the current event and
+    gender, name lines go into a NAME_WINDOW-line window, and a school line
+    is held until a time line turns up within TIME_WINDOW lines. Results
+    come out in the order of their school lines.
+    
+    Args:
+        lines: Text lines of the PDF (any iterable; read once)
+        year: Meet year
+        school: School to extract, or None for all schools
+        events: Only parse these events (as named in the headers)
+    """
+    school_re = (re.compile(r'(FR|SO|JR|SR)\s+' + re.escape(school)) if school else None)
     
     current_event = None
     current_gender = None
+    in_wanted_event = events is None
     
-    # Event pattern
-    event_pattern = re.compile(r'Event \d+ (Boys|Girls) (.+)')
+    names = deque()  # (line index, swimmer name), oldest first
+    pending = deque()  # (line index, school, grade, name, event, gender) waiting for a time
     
     for i, line in enumerate(lines):
         # Track current event
-        event_match = event_pattern.search(line)
-        if event_match:
-            current_gender = 'M' if event_match.group(1) == 'Boys' else 'F'
-            current_event = event_match.group(2).strip()
-            continue
+        if 'Event' in line:
+            event_match = EVENT_RE.search(line)
+            if event_match:
+                current_gender = 'M' if event_match.group(1) == 'Boys' else 'F'
+                current_event = event_match.group(2).strip()
+                in_wanted_event = events is None or current_event in events
+                continue
+        
+        stripped = line.strip()
         
-        # Look for Tanque Verde mentions
-        if 'Tanque Verde' in line:
-            # Extract grade (usually on same line as school)
-            grade_match = re.match(r'(FR|SO|JR|SR)\s+Tanque Verde', line)
-            grade = grade_match.group(1) if grade_match else ''
-            
-            # Look for swimmer name in nearby lines (usually 1-5 lines before)
-            swimmer_name = None
-            for j in range(max(0, i-10), i):
-                prev_line = lines[j].strip()
-                # Names are usually "Last, First" format
-                name_match = re.match(r'^([A-Z][a-z]+),\s*([A-Z][a-z]+)$', prev_line)
-                if name_match:
-                    swimmer_name = f"{name_match.group(2)} {name_match.group(1)}"
-                    break
-            
-            # Look for time in nearby lines (usually 1-5 lines after)
-            time_str = None
-            for j in range(i, min(len(lines), i+10)):
-                next_line = lines[j].strip()
-                # Times are like "24.45" or "1:23.45" or "5:12.34"
-                time_match = re.match(r'^(\d{1,2}:)?\d{1,2}\.\d{2}(\s*[A-Z])?$', next_line)
-                if time_match:
-                    time_str = next_line.split()[0]  # Remove any letter suffix
-                    break
-            
-            if swimmer_name and time_str and current_event:
-                results.append(SwimResult(
-                    event=current_event,
-                    swimmer_name=swimmer_name,
-                    grade=grade,
-                    time=time_str,
-                    year=year,
-                    gender=current_gender or 'M'
-                ))
-    
-    return results
+        # The first name within the window before a school line is the swimmer
+        while names and names[0][0] < i - NAME_WINDOW:
+            names.popleft()
+        name_match = NAME_RE.match(stripped)
+        
+        # A school line takes the first time from its own line onwards
+        if in_wanted_event and current_event:
+            if school_re is not None:
+                if school in line:
+                    grade_match = school_re.match(line)
+                    grade = grade_match.group(1) if grade_match else ''
+                    if names:
+                        pending.append((i, school, grade, names[0][1], current_event, current_gender))
+            else:
+                school_match = SCHOOL_LINE_RE.match(line)
+                if school_match and names:
+                    pending.append((i, school_match.group(2), school_match.group(1), names[0][1],
+                                    current_event, current_gender))
+        
+        if pending:
+            while pending and pending[0][0] <= i - TIME_WINDOW:
+                pending.popleft()
+            if TIME_RE.match(stripped):
+                time_str = stripped.split()[0]  # Remove any letter suffix
+                while pending:
+                    _, result_school, grade, swimmer_name, event, gender = pending.popleft()
+                    yield SwimResult(
+                        event=event,
+                        swimmer_name=swimmer_name,
+                        grade=grade,
+                        time=time_str,
+                        year=year,
+                        gender=gender or 'M',
+                        school=result_school
+                    )
+        
+        if name_match:
+            names.append((i, f"{name_match.group(2)} {name_match.group(1)}"))
+
+
+def parse_tanque_verde_results(text: str, year: int) -> list[SwimResult]:
+    """Parse Tanque Verde results from PDF text."""
+    return list(stream_school_results(text.split('\n'), year))
+
+
+def extract_school_results(pdf_path: Path, year: int, school: Optional[str] = 'Tanque Verde',
+                           events: Optional[set[str]] = None) -> Iterator[SwimResult]:
+    """Stream one school's (or every school's) results straight out of a PDF."""
+    return stream_school_results(iter_pdf_lines(pdf_path), year, school, events)
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Extract swim results from historical state PDFs')
+    parser.add_argument('--school', default='Tanque Verde', help='School to extract (default: Tanque Verde)')
+    parser.add_argument('--all-schools', action='store_true', help='Extract every school (full-division results)')
+    args = parser.parse_args()
+    school = None if args.all_schools else args.school
+    
     base_dir = Path(__file__).parent
     data_dir = base_dir / "historical_data"
     data_dir.mkdir(exist_ok=True)
@@ -175,19 +288,11 @@ def main():
             print(f"  PDF not found: {pdf_path}")
             continue
         
-        text = extract_text_from_pdf(pdf_path)
-        if not text:
-            continue
-        
-        # Count mentions
-        tv_count = text.lower().count('tanque verde')
-        print(f"  Found {tv_count} Tanque Verde mentions")
-        
-        results = parse_tanque_verde_results(text, year)
-        print(f"  Parsed {len(results)} results")
+        results = list(extract_school_results(pdf_path, year, school))
+        print(f"  Parsed {len(results)} {school or 'all-school'} results")
         
         for r in results[:5]:  # Show first 5
-            print(f"    - {r.event}: {r.swimmer_name} ({r.grade}) - {r.time}")
+            print(f"    - {r.event}: {r.swimmer_name} ({r.grade}, {r.school}) - {r.time}")
         
         if len(results) > 5:
             print(f"    ... and {len(results) - 5} more")
@@ -3,21 +3,61 @@
 Harvest 2025 AIA D3 State Championship results from SwimCloud
 
 Scrapes meet results from SwimCloud and filters for Tanque Verde swimmers.
+Event pages are loaded concurrently on a shared browser (browser_pool.py).
+
+--record saves every rendered event page to the snapshot store
+(snapshots.py); --replay parses those snapshots instead of opening a browser.
 
 Usage:
     python3 harvest_2025_state_swimcloud.py
+    python3 harvest_2025_state_swimcloud.py --record
+    python3 harvest_2025_state_swimcloud.py --replay
 """
 
 import sys
+import argparse
 from pathlib import Path
 from datetime import datetime
 import pandas as pd
-import time
 import re
+from bs4 import BeautifulSoup
+
+from browser_pool import BrowserPool, DEFAULT_PAGES, wait_for_rows
+from snapshots import SnapshotStore
 
 # Add swim-data-tool to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'swim-data-tool' / 'src'))
 
+EVENT_HEADER = '.c-result-event__header, h1.u-section-title, h1'
+
+# Result rows (only tbody rows, not headers)
+RESULT_ROWS = 'tbody tr'
+
+
+
+def _text(element) -> str | None:
+    """Element text with whitespace collapsed, as the browser renders it"""
+    return ' '.join(element.get_text(' ').split()) if element else None
+
+
+def parse_event_page(html: str) -> tuple[str | None, list[dict]]:
+    """
+    Event name and result rows from a rendered event page.
+    
+    Each row has its cell texts, swimmer name (first swimmer link), row text
+    and the first time link / time div; missing fields are None.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    rows = []
+    for row in soup.select(RESULT_ROWS):
+        rows.append({
+            'cells': [_text(cell) for cell in row.select('td')],
+            'name': _text(row.select_one('a[href*="/swimmer/"]')),
+            'text': _text(row),
+            'time': _text(row.select_one('td a[href*="/times/"], td div[id^="time"]')),
+        })
+    return _text(soup.select_one(EVENT_HEADER)), rows
+
 
 class SwimCloudStateScraper:
     """Scraper for SwimCloud state meet results."""
@@ -30,19 +70,36 @@ class SwimCloudStateScraper:
     # EVENT_IDS = list(range(301, 325)) + [408]
     EVENT_IDS = [303]  # Test with one event first
     
-    def __init__(self, output_dir: Path):
-        """Initialize scraper with output directory."""
+    # Event pages loading at once
+    PAGES = DEFAULT_PAGES
+    
+    def __init__(self, output_dir: Path, snapshots: SnapshotStore = None, replay: bool = False):
+        """
+        Initialize scraper with output directory.
+        
+        Pages are recorded to snapshots if given; replay=True parses them
+        from snapshots instead of the live site.
+        """
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.snapshots = snapshots
+        self.replay = replay
+        self.pool = None  # the BrowserPool of the scrape in progress
         
-    def scrape_event(self, event_id: int, browser, page) -> list:
+    async def _load_event_page(self, page, url: str) -> str:
+        """Event page HTML once the results table has rendered."""
+        print(f"   Loading {url}...")
+        await page.goto(url, wait_until="domcontentloaded", timeout=15000)
+        await wait_for_rows(page, RESULT_ROWS, 1, timeout=15000)
+        return await page.content()
+    
+    async def scrape_event(self, page, event_id: int) -> list:
         """
         Scrape results for a single event.
         
         Args:
+            page: Playwright page from the pool
             event_id: Event ID number
-            browser: Playwright browser instance
-            page: Playwright page instance
             
         Returns:
             List of swim dictionaries
@@ -51,18 +108,14 @@ class SwimCloudStateScraper:
         swims = []
         
         try:
-            # Navigate to event page
-            print(f"   Loading {url}...")
-            page.goto(url, wait_until="networkidle", timeout=15000)
-            time.sleep(1)
+            # Load the event page (or its snapshot) and read the event name and rows
+            html = await self.pool.fetch(page, url, lambda page: self._load_event_page(page, url))
+            event_name, result_rows = parse_event_page(html)
             
-            # Get event name
-            event_header = page.query_selector('.c-result-event__header, h1.u-section-title, h1')
-            if not event_header:
+            if not event_name:
                 print(f"      ⚠ No event header found")
                 return swims
             
-            event_name = event_header.inner_text().strip()
             print(f"   Found event: {event_name}")
             
             # Determine gender from event name
@@ -76,47 +129,32 @@ class SwimCloudStateScraper:
             clean_event = clean_event.replace(" - Prelims", "").replace(" - Finals", "")
             clean_event = clean_event.replace(" - A", "").replace(" - B", "")
             
-            # Get all result rows (only tbody rows, not headers)
-            result_rows = page.query_selector_all('tbody tr')
-            
-            if not result_rows:
-                return swims
-            
             print(f"   Event {event_id}: {event_name} ({len(result_rows)} rows)")
             
             for row in result_rows:
-                # Get all td elements in row
-                cells = row.query_selector_all('td')
+                cells = row['cells']
                 if len(cells) < 4:
                     continue
                 
                 # Get swimmer name (first column with swimmer link)
-                name_el = row.query_selector('a[href*="/swimmer/"]')
-                if not name_el:
+                if not row['name']:
                     continue
-                swimmer_name = name_el.inner_text().strip()
+                swimmer_name = row['name'].strip()
                 
                 # Check if this row has Tanque Verde (look in the row text)
-                row_text = row.inner_text()
+                row_text = row['text']
                 if "Tanque Verde" not in row_text and "TVHS" not in row_text:
                     continue
                 
                 # Get grade/year (column before time, usually 3rd or 4th column)
                 grade = ""
-                for cell in cells:
-                    cell_text = cell.inner_text().strip()
+                for cell_text in cells:
                     if cell_text in ['FR', 'SO', 'JR', 'SR', '9', '10', '11', '12']:
                         grade = cell_text
                         break
                 
-                # Get time (last numeric column with time format)
-                swim_time = ""
-                for cell in cells:
-                    # Look for time links or time divs
-                    time_link = cell.query_selector('a[href*="/times/"], div[id^="time"]')
-                    if time_link:
-                        swim_time = time_link.inner_text().strip()
-                        break
+                # Get time (first time link or time div)
+                swim_time = (row['time'] or "").strip()
                 
                 # Skip if not a valid time
                 if not swim_time or swim_time in ['DQ', 'NS', 'SCR', 'DNF', '--']:
@@ -149,35 +187,28 @@ class SwimCloudStateScraper:
         Returns:
             List of all swim dictionaries
         """
-        try:
-            from playwright.sync_api import sync_playwright
-        except ImportError:
-            print("❌ Playwright not installed. Install with: pip install playwright && playwright install")
-            sys.exit(1)
-        
         print(f"\n📊 Scraping 2025 State Championship from SwimCloud...")
         print(f"   Events: {len(self.EVENT_IDS)} total")
         
-        all_swims = []
-        
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False)  # Non-headless to avoid 403
-            context = browser.new_context(
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                viewport={'width': 1920, 'height': 1080}
-            )
-            page = context.new_page()
-            
-            try:
-                for event_id in self.EVENT_IDS:
-                    swims = self.scrape_event(event_id, browser, page)
-                    all_swims.extend(swims)
-                    time.sleep(1)  # Be polite to the server
-                
-            finally:
-                browser.close()
+        pool = BrowserPool(
+            self.PAGES,
+            headless=False,  # Non-headless to avoid 403
+            context_options={
+                'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                'viewport': {'width': 1920, 'height': 1080},
+            },
+            snapshots=self.snapshots,
+            replay=self.replay,
+        )
+        self.pool = pool
+        try:
+            with pool:
+                results = pool.map(self.scrape_event, self.EVENT_IDS)
+        except ImportError as e:
+            print(e)
+            sys.exit(1)
         
-        return all_swims
+        return [swim for swims in results for swim in swims or []]
     
     def scrape_all(self) -> pd.DataFrame:
         """Scrape all events and save results."""
@@ -201,13 +232,22 @@ class SwimCloudStateScraper:
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description='Harvest the 2025 D3 State Championship from SwimCloud')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--record', action='store_true',
+                      help='Save every event page to the snapshot store')
+    mode.add_argument('--replay', action='store_true',
+                      help='Parse recorded snapshots instead of the live site')
+    args = parser.parse_args()
+    
     output_dir = Path('data/raw/aia-state')
     
     print("=" * 80)
     print("🏊 2025 AIA D3 State Championship - SwimCloud Harvester")
     print("=" * 80)
     
-    scraper = SwimCloudStateScraper(output_dir)
+    snapshots = SnapshotStore() if args.record or args.replay else None
+    scraper = SwimCloudStateScraper(output_dir, snapshots, args.replay)
     df = scraper.scrape_all()
     
     # Print summary
@@ -6,14 +6,36 @@ URLs follow the pattern:
 - Girls: https://www.maxpreps.com/az/tucson/tanque-verde-hawks/swimming/girls/fall/{year}/stats/
 
 Year slugs: 24-25, 23-24, 22-23, 21-22, 20-21, 19-20, etc.
+
+Pages are fetched concurrently (rate-limited per host) through an on-disk
+HTTP cache, so a re-harvest only downloads stats pages that changed.
+--base-url points the harvester at another server, e.g. a local
+`python3 -m http.server` serving saved pages under the same paths.
+
+--record saves every stats page to the snapshot store (snapshots.py);
+--replay re-runs the parsing from those snapshots without the network and
+reports parse throughput.
+
+Usage:
+    python3 scripts/harvest/harvest_all_relay_splits.py [--jobs 4] [--refresh]
+    python3 scripts/harvest/harvest_all_relay_splits.py --base-url http://localhost:8000
+    python3 scripts/harvest/harvest_all_relay_splits.py --record
+    python3 scripts/harvest/harvest_all_relay_splits.py --replay --no-save
 """
 
+import argparse
 import re
 import json
 import time
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
 from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from http_cache import CachedFetcher
+from snapshots import SnapshotStore
+from time_parser import parse_hundredths, NO_TIME_HUNDREDTHS
+
+MAXPREPS_BASE = "https://www.maxpreps.com"
 
 # Years to harvest (most recent first)
 YEARS = [
@@ -33,28 +55,12 @@ YEARS = [
     '12-13',
 ]
 
-def get_url(gender, year):
+def get_url(gender, year, base=MAXPREPS_BASE):
     """Get MaxPreps stats URL for a given gender and year"""
     if gender == 'boys':
-        return f"https://www.maxpreps.com/az/tucson/tanque-verde-hawks/swimming/fall/{year}/stats/"
+        return f"{base}/az/tucson/tanque-verde-hawks/swimming/fall/{year}/stats/"
     else:
-        return f"https://www.maxpreps.com/az/tucson/tanque-verde-hawks/swimming/girls/fall/{year}/stats/"
-
-def fetch_page(url):
-    """Fetch a page with error handling"""
-    try:
-        req = Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urlopen(req, timeout=30) as response:
-            return response.read().decode('utf-8')
-    except HTTPError as e:
-        print(f"  HTTP Error {e.code}: {url}")
-        return None
-    except URLError as e:
-        print(f"  URL Error: {e.reason}")
-        return None
-    except Exception as e:
-        print(f"  Error: {e}")
-        return None
+        return f"{base}/az/tucson/tanque-verde-hawks/swimming/girls/fall/{year}/stats/"
 
 def classify_relay_type(legs, splits):
     """Classify relay type based on legs and number of splits"""
@@ -74,6 +80,12 @@ def classify_relay_type(legs, splits):
     else:
         return "unknown"
 
+def split_hundredths(splits):
+    """Integer hundredths for each split, plus their total (None if any split is invalid)"""
+    hundredths = [parse_hundredths(s) for s in splits]
+    total = None if NO_TIME_HUNDREDTHS in hundredths else sum(hundredths)
+    return hundredths, total
+
 def extract_splits_from_html(html, year, gender):
     """Extract relay split data from MaxPreps stats page HTML"""
     
@@ -94,6 +106,7 @@ def extract_splits_from_html(html, year, gender):
         
         # Classify relay type
         relay_type = classify_relay_type(legs, times)
+        hundredths, total = split_hundredths(times)
         
         relays.append({
             "type": relay_type,
@@ -102,6 +115,8 @@ def extract_splits_from_html(html, year, gender):
             "legs": legs,
             "swimmers": names,
             "splits": times,
+            "split_hundredths": hundredths,
+            "total_hundredths": total,
             "team": team
         })
     
@@ -112,6 +127,7 @@ def extract_splits_from_html(html, year, gender):
         
         names = [name.strip().strip("'\"") for name in names_str.split(',')]
         times = [time.strip().strip("'\"") for time in times_str.split(',')]
+        hundredths, total = split_hundredths(times)
         
         relays.append({
             "type": "free",
@@ -119,12 +135,14 @@ def extract_splits_from_html(html, year, gender):
             "gender": gender,
             "swimmers": names,
             "splits": times,
+            "split_hundredths": hundredths,
+            "total_hundredths": total,
             "team": team
         })
     
     return relays
 
-def harvest_all_seasons():
+def harvest_all_seasons(fetcher=None, jobs=4, base=MAXPREPS_BASE):
     """Harvest relay splits from all seasons"""
     
     all_relays = {
@@ -132,19 +150,32 @@ def harvest_all_seasons():
         'girls': []
     }
     
+    # Fetch every stats page up front (concurrently, through the cache)
+    fetcher = fetcher or CachedFetcher()
+    urls = {(year, gender): get_url(gender, year, base) for year in YEARS for gender in ['boys', 'girls']}
+    pages = fetcher.fetch_all(list(urls.values()), jobs=jobs)
+    
+    parse_seconds = 0.0
+    parsed_pages = 0
+    parsed_bytes = 0
+    
     for year in YEARS:
         print(f"\n{'='*50}")
         print(f"Harvesting {year} season...")
         print('='*50)
         
         for gender in ['boys', 'girls']:
-            url = get_url(gender, year)
+            url = urls[(year, gender)]
             print(f"\n{gender.upper()}: {url}")
             
-            html = fetch_page(url)
+            html = pages[url]
             
             if html:
+                start = time.perf_counter()
                 relays = extract_splits_from_html(html, year, gender)
+                parse_seconds += time.perf_counter() - start
+                parsed_pages += 1
+                parsed_bytes += len(html)
                 
                 if relays:
                     all_relays[gender].extend(relays)
@@ -159,10 +190,11 @@ def harvest_all_seasons():
                     print(f"  No relay splits found")
             else:
                 print(f"  Failed to fetch page")
-            
-            # Be nice to the server
-            time.sleep(0.5)
     
+    print(f"\n🌐 {fetcher.summary()}")
+    if parsed_pages:
+        print(f"🧪 Parsed {parsed_pages} pages ({parsed_bytes / 1e6:.1f} MB) in {parse_seconds:.3f}s "
+              f"({parsed_pages / max(parse_seconds, 1e-9):.0f} pages/s)")
     return all_relays
 
 def save_results(all_relays):
@@ -224,15 +256,31 @@ def print_summary(all_relays):
         print(f"  {year}: Boys={data['boys']}, Girls={data['girls']}")
 
 def main():
+    parser = argparse.ArgumentParser(description='Harvest relay splits from MaxPreps')
+    parser.add_argument('--jobs', type=int, default=4, help='Pages fetched at once (default: 4)')
+    parser.add_argument('--interval', type=float, default=0.5,
+                        help='Minimum seconds between requests to the same host (default: 0.5)')
+    parser.add_argument('--refresh', action='store_true', help='Ignore the HTTP cache and download every page')
+    parser.add_argument('--base-url', default=MAXPREPS_BASE, help='Server to harvest from (default: MaxPreps)')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--record', action='store_true', help='Save every page fetched to the snapshot store')
+    mode.add_argument('--replay', action='store_true', help='Parse recorded snapshots instead of fetching')
+    parser.add_argument('--no-save', action='store_true', help='Do not write data/historical_splits')
+    args = parser.parse_args()
+    
     print("MaxPreps Relay Splits Harvester")
     print("================================")
     print(f"Harvesting {len(YEARS)} seasons: {', '.join(YEARS)}")
     
-    all_relays = harvest_all_seasons()
+    snapshots = SnapshotStore() if args.record or args.replay else None
+    fetcher = CachedFetcher(min_interval=args.interval, refresh=args.refresh,
+                            snapshots=snapshots, replay=args.replay)
+    all_relays = harvest_all_seasons(fetcher, jobs=args.jobs, base=args.base_url.rstrip('/'))
     
     print_summary(all_relays)
     
-    save_results(all_relays)
+    if not args.no_save:
+        save_results(all_relays)
     
     print("\n✓ Harvest complete!")
 
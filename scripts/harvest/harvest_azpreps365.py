@@ -4,17 +4,30 @@ Harvest AzPreps365 D3 Leaderboards
 
 Scrapes Division III boys and girls swimming leaderboards from azpreps365.com.
 This is the main orchestration script for data collection.
+Event categories are loaded concurrently on a shared browser (browser_pool.py).
+
+--record saves every rendered page to the snapshot store (snapshots.py);
+--replay parses those snapshots instead of opening a browser.
+
+Usage:
+    python3 harvest_azpreps365.py
+    python3 harvest_azpreps365.py --record
+    python3 harvest_azpreps365.py --replay
 """
 
 import sys
+import argparse
 from pathlib import Path
 from datetime import datetime
 import pandas as pd
 from bs4 import BeautifulSoup
 import requests
-import time
 from typing import Optional
 
+from browser_pool import BrowserPool
+from parse_azpreps365_html import CATEGORY_SELECT, category_names, leaderboard_results, load_leaderboard
+from snapshots import SnapshotStore
+
 # Add swim-data-tool to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'swim-data-tool' / 'src'))
 
@@ -28,6 +41,7 @@ class AzPreps365Scraper:
         """Initialize scraper with output directory."""
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.pool = None  # the BrowserPool of the scrape in progress
         
     def scrape_division_leaderboard(self, division: str, gender: str) -> pd.DataFrame:
         """
@@ -72,75 +86,72 @@ class AzPreps365Scraper:
             print(f"❌ Error fetching {gender} {division}: {e}")
             return pd.DataFrame()
     
-    def scrape_with_playwright(self, division: str, gender: str) -> pd.DataFrame:
+    async def _load_categories(self, page, url: str) -> str:
+        """Leaderboard page HTML once its category dropdown is filled in."""
+        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        # The static "Select Category" placeholder is there before the events load
+        await page.wait_for_function(
+            '(select) => document.querySelectorAll(`${select} option`).length > 1',
+            arg=CATEGORY_SELECT, timeout=30000)
+        return await page.content()
+    
+    async def _list_categories(self, page, url: str) -> list[str]:
+        """Event category names from the leaderboard dropdown."""
+        html = await self.pool.fetch(page, url, lambda page: self._load_categories(page, url))
+        return category_names(html)
+    
+    async def _scrape_category(self, page, job: tuple[str, str, str]) -> list[dict]:
+        """
+        Load one event category on a pooled page and parse its results.
+        
+        Args:
+            page: Playwright page from the pool
+            job: (division, gender, category name)
+            
+        Returns:
+            List of result dictionaries
+        """
+        division, gender, category_name = job
+        url = f"{self.BASE_URL}/leaderboards/swimming-{gender}/{division}"
+        
+        html = await self.pool.fetch(page, f"{url}#{category_name}",
+                                     lambda page: load_leaderboard(page, url, label=category_name))
+        results = leaderboard_results(html, category_name, division, gender)
+        print(f"   {category_name}: {len(results)} results")
+        return results
+    
+    def scrape_with_playwright(self, division: str, gender: str,
+                               pool: BrowserPool = None) -> pd.DataFrame:
         """
         Scrape leaderboard using Playwright for JavaScript rendering.
         
         Args:
             division: Division code (d1, d2, d3, d4)
             gender: Gender (boys, girls)
+            pool: Shared browser pool (one is opened for this call if omitted)
             
         Returns:
             DataFrame with leaderboard data
         """
-        try:
-            from playwright.sync_api import sync_playwright
-        except ImportError:
-            print("❌ Playwright not installed. Install with: pip install playwright && playwright install chromium")
-            return pd.DataFrame()
+        if pool is None:
+            try:
+                with BrowserPool() as pool:
+                    return self.scrape_with_playwright(division, gender, pool)
+            except ImportError as e:
+                print(e)
+                return pd.DataFrame()
         
+        self.pool = pool
         url = f"{self.BASE_URL}/leaderboards/swimming-{gender}/{division}"
         print(f"\n📥 Fetching {gender.title()} {division.upper()} leaderboard (Playwright)...")
         print(f"   URL: {url}")
         
-        all_events = []
+        # Find all event categories in the dropdown
+        categories = pool.map(self._list_categories, [url])[0] or []
+        print(f"   Found {len(categories)} event categories")
         
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            
-            try:
-                # Navigate to the page
-                page.goto(url, wait_until="domcontentloaded", timeout=60000)
-                
-                # Wait for content to load
-                page.wait_for_timeout(5000)
-                
-                # Find all event categories in the dropdown
-                categories = page.query_selector_all('select option')
-                print(f"   Found {len(categories)} event categories")
-                
-                for category in categories:
-                    category_name = category.inner_text()
-                    if not category_name or category_name == "Select Category":
-                        continue
-                    
-                    print(f"   Processing: {category_name}")
-                    
-                    # Select the category
-                    page.select_option('select', label=category_name)
-                    
-                    # Click "Load Leaderboard" button
-                    load_button = page.query_selector('button:has-text("Load Leaderboard")')
-                    if load_button:
-                        load_button.click()
-                        page.wait_for_timeout(3000)  # Wait for results to load
-                        
-                        # Parse the results
-                        html = page.content()
-                        soup = BeautifulSoup(html, 'html.parser')
-                        
-                        # Find the results table/section
-                        # The structure varies by event type
-                        results = self._parse_event_results(soup, category_name, division, gender)
-                        all_events.extend(results)
-                        
-                        print(f"      → Found {len(results)} results")
-                    
-                    time.sleep(1)  # Be polite to the server
-                    
-            finally:
-                browser.close()
+        jobs = [(division, gender, name) for name in categories]
+        all_events = [row for rows in pool.map(self._scrape_category, jobs) for row in rows or []]
         
         if all_events:
             df = pd.DataFrame(all_events)
@@ -149,42 +160,6 @@ class AzPreps365Scraper:
             print("⚠️  No events found")
             return pd.DataFrame()
     
-    def _parse_event_results(self, soup: BeautifulSoup, event_name: str, 
-                            division: str, gender: str) -> list[dict]:
-        """
-        Parse results for a specific event from the page HTML.
-        
-        Args:
-            soup: BeautifulSoup object with page content
-            event_name: Name of the event
-            division: Division code
-            gender: Gender
-            
-        Returns:
-            List of result dictionaries
-        """
-        results = []
-        
-        # Look for result entries
-        # Based on the web search, results appear in a structured format with:
-        # - Athlete name
-        # - School name
-        # - Time
-        
-        # Find all result entries (need to inspect actual HTML structure)
-        result_divs = soup.find_all('div', class_='leaderboard-entry')  # This class name is a guess
-        
-        # If we can't find specific divs, look for the athlete names mentioned in the search results
-        if not result_divs:
-            # Try parsing based on the known athletes from the search results
-            # Look for Wade Olsson, Zachary Duerkop, etc.
-            content = soup.get_text()
-            
-            # For now, return empty - we need to see the actual HTML structure
-            pass
-        
-        return results
-    
     def save_leaderboard(self, df: pd.DataFrame, division: str, gender: str, 
                         harvest_date: str) -> Path:
         """
@@ -214,6 +189,14 @@ class AzPreps365Scraper:
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description='Harvest AzPreps365 D3 Leaderboards')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--record', action='store_true',
+                      help='Save every leaderboard page to the snapshot store')
+    mode.add_argument('--replay', action='store_true',
+                      help='Parse recorded snapshots instead of the live site')
+    args = parser.parse_args()
+    
     print("\n" + "="*70)
     print(" AzPreps365 D3 Leaderboard Harvest")
     print("="*70)
@@ -231,15 +214,21 @@ def main():
     divisions = ["d3"]
     genders = ["boys", "girls"]
     
-    for division in divisions:
-        for gender in genders:
-            # Try with Playwright first (handles JavaScript)
-            df = scraper.scrape_with_playwright(division, gender)
-            
-            if df.empty:
-                print(f"⚠️  No data retrieved for {gender} {division}")
-            else:
-                scraper.save_leaderboard(df, division, gender, harvest_date)
+    snapshots = SnapshotStore() if args.record or args.replay else None
+    try:
+        with BrowserPool(snapshots=snapshots, replay=args.replay) as pool:
+            for division in divisions:
+                for gender in genders:
+                    # Try with Playwright first (handles JavaScript)
+                    df = scraper.scrape_with_playwright(division, gender, pool)
+                    
+                    if df.empty:
+                        print(f"⚠️  No data retrieved for {gender} {division}")
+                    else:
+                        scraper.save_leaderboard(df, division, gender, harvest_date)
+    except ImportError as e:
+        print(e)
+        sys.exit(1)
     
     print("\n" + "="*70)
     print(" Harvest Complete!")
@@ -4,11 +4,17 @@ Harvest AzPreps365 D3 Leaderboards (v2 - Configurable Output)
 
 Scrapes Division III boys and girls swimming leaderboards from azpreps365.com.
 Enhanced version with configurable output directory to avoid overwriting existing data.
+Events are loaded concurrently on a shared browser (browser_pool.py).
+
+--record saves every rendered leaderboard page to the snapshot store
+(snapshots.py); --replay parses those snapshots instead of opening a browser.
 
 Usage:
     python3 harvest_azpreps365_v2.py
     python3 harvest_azpreps365_v2.py --output-dir=data/raw/harvest_2024_11_01
     python3 harvest_azpreps365_v2.py --output-dir=../swim-data-tool/data/reports/azpreps/d3-leaderboards
+    python3 harvest_azpreps365_v2.py --record
+    python3 harvest_azpreps365_v2.py --replay --output-dir=/tmp/replay
 """
 
 import sys
@@ -18,9 +24,12 @@ from datetime import datetime
 import pandas as pd
 from bs4 import BeautifulSoup
 import requests
-import time
 from typing import Optional
 
+from browser_pool import BrowserPool, DEFAULT_PAGES
+from parse_azpreps365_html import EVENTS, leaderboard_results, load_leaderboard
+from snapshots import SnapshotStore
+
 # Add swim-data-tool to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'swim-data-tool' / 'src'))
 
@@ -34,6 +43,7 @@ class AzPreps365Scraper:
         """Initialize scraper with output directory."""
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.pool = None  # the BrowserPool of the scrape in progress
         
     def scrape_division_leaderboard(self, division: str, gender: str) -> pd.DataFrame:
         """
@@ -78,130 +88,55 @@ class AzPreps365Scraper:
             print(f"❌ Error fetching {gender} {division}: {e}")
             return pd.DataFrame()
     
-    def scrape_with_playwright(self, division: str, gender: str) -> pd.DataFrame:
+    async def _scrape_event(self, page, job: tuple[str, str, str, str]) -> list[dict]:
+        """
+        Scrape one leaderboard event on a pooled page.
+        
+        Args:
+            page: Playwright page from the pool
+            job: (division, gender, event value, event name)
+            
+        Returns:
+            List of result dictionaries
+        """
+        division, gender, event_value, event_name = job
+        url = f"{self.BASE_URL}/leaderboards/swimming-{gender}/{division}"
+        
+        html = await self.pool.fetch(page, f"{url}#{event_value}",
+                                     lambda page: load_leaderboard(page, url, value=event_value))
+        results = leaderboard_results(html, event_name, division, gender)
+        
+        print(f"   📊 {event_name}: {len(results)} results")
+        return results
+    
+    def scrape_with_playwright(self, division: str, gender: str,
+                               pool: BrowserPool = None) -> pd.DataFrame:
         """
         Scrape leaderboard using Playwright (handles JavaScript).
         
         Args:
             division: Division code (d1, d2, d3, d4)
             gender: Gender (boys, girls)
+            pool: Shared browser pool (one is opened for this call if omitted)
             
         Returns:
             DataFrame with leaderboard data
         """
-        try:
-            from playwright.sync_api import sync_playwright
-        except ImportError:
-            print("❌ Playwright not installed. Install with: pip install playwright && playwright install")
-            return pd.DataFrame()
+        if pool is None:
+            try:
+                with BrowserPool() as pool:
+                    return self.scrape_with_playwright(division, gender, pool)
+            except ImportError as e:
+                print(e)
+                return pd.DataFrame()
         
+        self.pool = pool
         url = f"{self.BASE_URL}/leaderboards/swimming-{gender}/{division}"
         print(f"\n🎭 Using Playwright to fetch {gender.title()} {division.upper()} leaderboard...")
         print(f"   URL: {url}")
         
-        all_data = []
-        
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            
-            try:
-                # Navigate to page (don't wait for networkidle - it times out)
-                page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                time.sleep(3)  # Wait for JavaScript to load
-                print("   ✓ Page loaded")
-                
-                # Define events to scrape (value format for select)
-                events = [
-                    ("freeindividual50", "50 Free"),
-                    ("freeindividual100", "100 Free"),
-                    ("freeindividual200", "200 Free"),
-                    ("freeindividual500", "500 Free"),
-                    ("backindividual100", "100 Back"),
-                    ("breastindividual100", "100 Breast"),
-                    ("flyindividual100", "100 Fly"),
-                    ("medleyindividual200", "200 IM"),
-                    ("medleyrelay200", "200 Medley Relay"),
-                    ("freerelay200", "200 Free Relay"),
-                    ("freerelay400", "400 Free Relay")
-                ]
-                
-                for event_value, event_name in events:
-                    print(f"   📊 Scraping {event_name}...")
-                    
-                    try:
-                        # Select event from dropdown (using name="category")
-                        page.select_option('select[name="category"]', value=event_value)
-                        time.sleep(1)
-                        
-                        # Click "Load Leaderboard" button
-                        page.click('button:has-text("Load Leaderboard")')
-                        
-                        # Wait for results to load (wait for at least one result row)
-                        try:
-                            page.wait_for_selector('div.box.leaderboard-top-ten div.columns.is-mobile', timeout=10000)
-                        except:
-                            # No results for this event
-                            pass
-                        
-                        time.sleep(2)  # Extra wait for all results to load
-                        
-                        # Extract results from leaderboard boxes
-                        # Results are in div.columns.is-mobile within div.box.leaderboard-top-ten
-                        result_rows = page.query_selector_all('div.box.leaderboard-top-ten div.columns.is-mobile')
-                        
-                        for i, row in enumerate(result_rows, 1):
-                            try:
-                                # Athlete name and school are in column is-9
-                                name_col = row.query_selector('div.column.is-9.leaderboard-name.athlete')
-                                if not name_col:
-                                    continue
-                                
-                                # Extract athlete name (in <a> tag)
-                                name_link = name_col.query_selector('a.name')
-                                if name_link:
-                                    athlete = name_link.inner_text().strip().replace('\n', ' ').replace('  ', ' ')
-                                else:
-                                    continue
-                                
-                                # Extract school (in <span class="team">)
-                                school_span = name_col.query_selector('span.team')
-                                if school_span:
-                                    school = school_span.inner_text().strip()
-                                else:
-                                    school = "Unknown"
-                                
-                                # Time is in column is-3
-                                time_col = row.query_selector('div.column.is-3.leaderboard-value')
-                                if time_col:
-                                    time_str = time_col.inner_text().strip()
-                                else:
-                                    continue
-                                
-                                all_data.append({
-                                    'event': event_name,
-                                    'athlete': athlete,
-                                    'school': school,
-                                    'time': time_str,
-                                    'rank': i,
-                                    'division': division,
-                                    'gender': gender,
-                                    'harvest_date': datetime.now().strftime("%Y-%m-%d")
-                                })
-                            except Exception as e:
-                                # Skip rows that don't parse correctly
-                                continue
-                        
-                        print(f"      ✓ Found {len(result_rows)} results")
-                        
-                    except Exception as e:
-                        print(f"      ⚠️  Error scraping {event}: {e}")
-                        continue
-                
-            except Exception as e:
-                print(f"❌ Error during scraping: {e}")
-            finally:
-                browser.close()
+        jobs = [(division, gender, value, name) for value, name in EVENTS]
+        all_data = [row for rows in pool.map(self._scrape_event, jobs) for row in rows or []]
         
         if all_data:
             df = pd.DataFrame(all_data)
@@ -264,11 +199,28 @@ Examples:
         type=str,
         help='Output directory for harvest data (default: data/raw/azpreps365_harvest/YYYY-MM-DD/)'
     )
+    parser.add_argument(
+        '--pages',
+        type=int,
+        default=DEFAULT_PAGES,
+        help=f'Browser pages loading at once (default: {DEFAULT_PAGES})'
+    )
     parser.add_argument(
         '--no-timestamp',
         action='store_true',
         help='Do not append timestamp to output directory'
     )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        '--record',
+        action='store_true',
+        help='Save every leaderboard page to the snapshot store'
+    )
+    mode.add_argument(
+        '--replay',
+        action='store_true',
+        help='Parse recorded snapshots instead of the live site'
+    )
     
     args = parser.parse_args()
     
@@ -298,15 +250,21 @@ Examples:
     divisions = ["d3"]
     genders = ["boys", "girls"]
     
-    for division in divisions:
-        for gender in genders:
-            # Try with Playwright first (handles JavaScript)
-            df = scraper.scrape_with_playwright(division, gender)
-            
-            if df.empty:
-                print(f"⚠️  No data retrieved for {gender} {division}")
-            else:
-                scraper.save_leaderboard(df, division, gender, harvest_date)
+    snapshots = SnapshotStore() if args.record or args.replay else None
+    try:
+        with BrowserPool(args.pages, snapshots=snapshots, replay=args.replay) as pool:
+            for division in divisions:
+                for gender in genders:
+                    # Try with Playwright first (handles JavaScript)
+                    df = scraper.scrape_with_playwright(division, gender, pool)
+                    
+                    if df.empty:
+                        print(f"⚠️  No data retrieved for {gender} {division}")
+                    else:
+                        scraper.save_leaderboard(df, division, gender, harvest_date)
+    except ImportError as e:
+        print(e)
+        sys.exit(1)
     
     print("\n" + "="*70)
     print(" Harvest Complete!")
@@ -3,12 +3,19 @@
 Harvest AzPreps365 D3 Leaderboards (v3 - Direct URL Method)
 
 Scrapes Division III boys and girls swimming leaderboards from azpreps365.com.
-Uses direct event URLs (top 50 results already loaded on each page).
+Uses direct event URLs (top 50 results already loaded on each page), loaded
+concurrently on a shared browser (browser_pool.py).
+
+--record saves every rendered event page to the snapshot store
+(snapshots.py); --replay parses those snapshots instead of opening a browser.
 
 Usage:
     python3 harvest_azpreps365_v3.py
     python3 harvest_azpreps365_v3.py --output-dir=data/raw/harvest_2024_11_01
     python3 harvest_azpreps365_v3.py --division=d3 --top-n=50
+    python3 harvest_azpreps365_v3.py --pages=8
+    python3 harvest_azpreps365_v3.py --record
+    python3 harvest_azpreps365_v3.py --replay --output-dir=/tmp/replay
 """
 
 import sys
@@ -16,7 +23,10 @@ import argparse
 from pathlib import Path
 from datetime import datetime
 import pandas as pd
-import time
+
+from browser_pool import BrowserPool, DEFAULT_PAGES, wait_for_rows
+from parse_azpreps365_html import EVENTS, EVENT_PAGE_ROWS, parse_event_page_rows
+from snapshots import SnapshotStore
 
 # Add swim-data-tool to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'swim-data-tool' / 'src'))
@@ -32,122 +42,84 @@ class AzPreps365ScraperV3:
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.top_n = top_n
+        self.pool = None  # the BrowserPool of the scrape in progress
+        
+    async def _load_event_page(self, page, url: str) -> str:
+        """Event page HTML once its result rows have rendered."""
+        await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        await wait_for_rows(page, EVENT_PAGE_ROWS, self.top_n)
+        return await page.content()
+    
+    async def _scrape_event(self, page, job: tuple[str, str, str, str]) -> list[dict]:
+        """
+        Scrape one event page on a pooled page.
+        
+        Args:
+            page: Playwright page from the pool
+            job: (division, gender, event slug, event name)
+            
+        Returns:
+            List of result dictionaries
+        """
+        division, gender, event_slug, event_name = job
+        
+        # Go directly to the event page (top 50 already loaded!)
+        url = f"{self.BASE_URL}/leaderboards/swimming-{gender}/{division}/{event_slug}"
+        html = await self.pool.fetch(page, url, lambda page: self._load_event_page(page, url))
+        rows = parse_event_page_rows(html)
+        
+        harvest_date = datetime.now().strftime("%Y-%m-%d")
+        results = []
+        for row in rows:
+            if len(results) >= self.top_n:
+                break
+            rank_text, athlete, school, time_str = row
+            try:
+                rank = int(rank_text)
+            except (TypeError, ValueError):
+                continue
+            if not athlete:
+                continue
+            results.append({
+                'event': event_name,
+                'athlete': athlete,
+                'school': school or "Unknown",
+                'time': time_str,
+                'rank': rank,
+                'division': division,
+                'gender': gender,
+                'harvest_date': harvest_date
+            })
         
-    def scrape_division_leaderboard(self, division: str, gender: str) -> pd.DataFrame:
+        print(f"   📊 {gender.title()} {event_name}: {len(results)} results")
+        return results
+    
+    def scrape_division_leaderboard(self, division: str, gender: str,
+                                    pool: BrowserPool = None) -> pd.DataFrame:
         """
         Scrape leaderboard for a specific division and gender.
         
         Args:
             division: Division code (d1, d2, d3, d4)
             gender: Gender (boys, girls)
+            pool: Shared browser pool (one is opened for this call if omitted)
             
         Returns:
             DataFrame with leaderboard data
         """
-        try:
-            from playwright.sync_api import sync_playwright
-        except ImportError:
-            print("❌ Playwright not installed. Install with: pip install playwright && playwright install")
-            return pd.DataFrame()
+        if pool is None:
+            try:
+                with BrowserPool() as pool:
+                    return self.scrape_division_leaderboard(division, gender, pool)
+            except ImportError as e:
+                print(e)
+                return pd.DataFrame()
         
+        self.pool = pool
         print(f"\n🎭 Scraping {gender.title()} {division.upper()} leaderboard (top {self.top_n})...")
         
-        all_data = []
-        
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            
-            try:
-                # Define events to scrape (URL slug format)
-                # Each event has its own page: /leaderboards/swimming-{gender}/{division}/{event_slug}
-                events = [
-                    ("freeindividual50", "50 Free"),
-                    ("freeindividual100", "100 Free"),
-                    ("freeindividual200", "200 Free"),
-                    ("freeindividual500", "500 Free"),
-                    ("backindividual100", "100 Back"),
-                    ("breastindividual100", "100 Breast"),
-                    ("flyindividual100", "100 Fly"),
-                    ("medleyindividual200", "200 IM"),
-                    ("medleyrelay200", "200 Medley Relay"),
-                    ("freerelay200", "200 Free Relay"),
-                    ("freerelay400", "400 Free Relay")
-                ]
-                
-                for event_slug, event_name in events:
-                    # Go directly to the event page (top 50 already loaded!)
-                    url = f"{self.BASE_URL}/leaderboards/swimming-{gender}/{division}/{event_slug}"
-                    print(f"   📊 Scraping {event_name}...")
-                    
-                    try:
-                        # Navigate to event page
-                        page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                        time.sleep(2)  # Wait for content to render
-                        
-                        # Extract results from table
-                        # Results are in a table with rows
-                        result_rows = page.query_selector_all('table tbody tr')
-                        
-                        count = 0
-                        for row in result_rows:
-                            if count >= self.top_n:
-                                break
-                                
-                            try:
-                                cols = row.query_selector_all('td')
-                                if len(cols) < 4:
-                                    continue
-                                
-                                # Column 0: Rank
-                                rank_text = cols[0].inner_text().strip()
-                                try:
-                                    rank = int(rank_text)
-                                except:
-                                    continue
-                                
-                                # Column 1: Athlete name (with link)
-                                athlete_link = cols[1].query_selector('a')
-                                if athlete_link:
-                                    athlete = athlete_link.inner_text().strip()
-                                else:
-                                    continue
-                                
-                                # School is also in column 1 (as a separate link)
-                                school_links = cols[1].query_selector_all('a')
-                                if len(school_links) >= 2:
-                                    school = school_links[1].inner_text().strip()
-                                else:
-                                    school = "Unknown"
-                                
-                                # Column 3: Time
-                                time_str = cols[3].inner_text().strip()
-                                
-                                all_data.append({
-                                    'event': event_name,
-                                    'athlete': athlete,
-                                    'school': school,
-                                    'time': time_str,
-                                    'rank': rank,
-                                    'division': division,
-                                    'gender': gender,
-                                    'harvest_date': datetime.now().strftime("%Y-%m-%d")
-                                })
-                                count += 1
-                            except Exception as e:
-                                # Skip rows that don't parse correctly
-                                continue
-                        
-                        print(f"      ✓ Found {count} results")
-                        
-                    except Exception as e:
-                        print(f"      ⚠️  Error scraping {event_name}: {e}")
-                        continue
-                
-            except Exception as e:
-                print(f"❌ Error during scraping: {e}")
-            finally:
-                browser.close()
+        jobs = [(division, gender, slug, name) for slug, name in EVENTS]
+        all_data = [row for rows in pool.map(self._scrape_event, jobs) for row in rows or []]
         
         if all_data:
             df = pd.DataFrame(all_data)
@@ -226,11 +198,28 @@ Examples:
         default=50,
         help='Number of top results to harvest per event (default: 50)'
     )
+    parser.add_argument(
+        '--pages',
+        type=int,
+        default=DEFAULT_PAGES,
+        help=f'Browser pages loading at once (default: {DEFAULT_PAGES})'
+    )
     parser.add_argument(
         '--no-timestamp',
         action='store_true',
         help='Do not append timestamp to output directory'
     )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        '--record',
+        action='store_true',
+        help='Save every event page to the snapshot store'
+    )
+    mode.add_argument(
+        '--replay',
+        action='store_true',
+        help='Parse recorded snapshots instead of the live site'
+    )
     
     args = parser.parse_args()
     
@@ -261,13 +250,19 @@ Examples:
     # Scrape Boys and Girls
     genders = ["boys", "girls"]
     
-    for gender in genders:
-        df = scraper.scrape_division_leaderboard(args.division, gender)
-        
-        if df.empty:
-            print(f"⚠️  No data retrieved for {gender} {args.division}")
-        else:
-            scraper.save_leaderboard(df, args.division, gender, harvest_date)
+    snapshots = SnapshotStore() if args.record or args.replay else None
+    try:
+        with BrowserPool(args.pages, snapshots=snapshots, replay=args.replay) as pool:
+            for gender in genders:
+                df = scraper.scrape_division_leaderboard(args.division, gender, pool)
+                
+                if df.empty:
+                    print(f"⚠️  No data retrieved for {gender} {args.division}")
+                else:
+                    scraper.save_leaderboard(df, args.division, gender, harvest_date)
+    except ImportError as e:
+        print(e)
+        sys.exit(1)
     
     print("\n" + "="*70)
     print(" Harvest Complete!")
@@ -8,26 +8,142 @@ Harvests:
 3. Visits each school's MaxPreps page and harvests relay results
 
 This provides complete division data for lineup optimization and competitive analysis.
+Events and schools are scraped concurrently on a shared browser (browser_pool.py).
+
+Runs are resumable: every leaderboard event and every school/season relay
+harvest is appended to a checkpoint as it completes, and a re-run skips
+completed jobs. The checkpoint is kept in data/cache/division_harvest/, keyed
+by division, top N and relay cutoff date (not by harvest date), so a run
+interrupted one day resumes the next. School -> MaxPreps
+URL resolutions are cached permanently in data/cache/maxpreps_school_urls.json.
+
+--record saves each rendered leaderboard page to the snapshot store
+(snapshots.py); --replay parses those snapshots instead of opening a browser,
+so the parsing can be re-run and timed offline.
 
 Usage:
     python3 harvest_division_complete.py
     python3 harvest_division_complete.py --output-dir=data/raw/d3_complete --top-n=100
     python3 harvest_division_complete.py --division=d3 --top-n=50 --cutoff-date=2024-09-01
+    python3 harvest_division_complete.py --pages=8
+    python3 harvest_division_complete.py --restart      # ignore the checkpoint
+    python3 harvest_division_complete.py --record
+    python3 harvest_division_complete.py --replay --leaderboard-only --output-dir=/tmp/replay
 """
 
 import sys
 import argparse
+import json
+import os
 import re
+import time
 from pathlib import Path
 from datetime import datetime, date
 from typing import Optional
 import pandas as pd
-from bs4 import BeautifulSoup
-import time
+
+from browser_pool import BrowserPool, DEFAULT_PAGES
+from parse_azpreps365_html import EVENTS, leaderboard_results, load_leaderboard
+from snapshots import SnapshotStore
 
 # Add swim-data-tool to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'swim-data-tool' / 'src'))
 
+# Permanent school name -> MaxPreps URL cache (shared by all runs)
+SCHOOL_URL_CACHE = Path(__file__).parent.parent.parent / 'data' / 'cache' / 'maxpreps_school_urls.json'
+
+CHECKPOINT_FILE = 'checkpoint.jsonl'
+
+# Resumable harvest checkpoints, one per division/top-N/cutoff
+CHECKPOINT_DIR = Path(__file__).parent.parent.parent / 'data' / 'cache' / 'division_harvest'
+
+# Common Arizona high school mascots (MaxPreps slugs end in the mascot)
+MASCOTS = ["hawks", "wildcats", "eagles", "falcons", "panthers", "jaguars",
+           "mustangs", "bulldogs", "cougars", "spartans", "warriors", "knights"]
+
+
+def checkpoint_path(division: str, top_n: int, cutoff_date: date) -> Path:
+    """Checkpoint file for a harvest; independent of the harvest date"""
+    return CHECKPOINT_DIR / f"{division}_top{top_n}_since{cutoff_date:%Y%m%d}.jsonl"
+
+
+def season_label(day: date) -> str:
+    """date(2024, 10, 20) -> '24-25' (Aug 1 cutoff)"""
+    start = day.year if day.month >= 8 else day.year - 1
+    return f"{start % 100:02d}-{(start + 1) % 100:02d}"
+
+
+class HarvestCheckpoint:
+    """
+    Completed jobs of a harvest run, with their result rows.
+    
+    Each job is appended to a JSONL file (and fsynced) the moment it
+    finishes, so an interrupted run loses at most the jobs in flight. A line
+    torn by a crash is dropped when the file is next loaded. With no path
+    the checkpoint is kept in memory only.
+    """
+    
+    def __init__(self, path: Optional[Path]):
+        self.path = path
+        self.done: dict[str, list[dict]] = {}
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not path.exists():
+            return
+        
+        torn = False
+        with open(path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    torn = True
+                    continue
+                self.done[entry['job']] = entry['rows']
+        if torn:
+            self._rewrite()
+    
+    def _rewrite(self):
+        tmp = self.path.with_suffix('.jsonl.tmp')
+        with open(tmp, 'w') as f:
+            for job, rows in self.done.items():
+                f.write(json.dumps({'job': job, 'rows': rows}) + '\n')
+        tmp.replace(self.path)
+    
+    def __contains__(self, job: str) -> bool:
+        return job in self.done
+    
+    def rows(self, job: str) -> list[dict]:
+        return self.done[job]
+    
+    def record(self, job: str, rows: list[dict]):
+        """Mark a job complete"""
+        self.done[job] = rows
+        if self.path is None:
+            return
+        with open(self.path, 'a') as f:
+            f.write(json.dumps({'job': job, 'rows': rows}) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def load_school_urls(cache_file: Path = SCHOOL_URL_CACHE) -> dict[str, str]:
+    """Cached school name -> MaxPreps URL resolutions"""
+    if not cache_file.exists():
+        return {}
+    with open(cache_file) as f:
+        return json.load(f)
+
+
+def save_school_urls(school_urls: dict[str, str], cache_file: Path = SCHOOL_URL_CACHE):
+    """Write the school URL cache atomically"""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_file.with_suffix('.json.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(school_urls, f, indent=2, sort_keys=True)
+    tmp.replace(cache_file)
+
 
 class DivisionHarvester:
     """Complete division data harvester."""
@@ -35,156 +151,161 @@ class DivisionHarvester:
     BASE_URL = "https://azpreps365.com"
     MAXPREPS_URL = "https://www.maxpreps.com"
     
-    def __init__(self, output_dir: Path, division: str = "d3", top_n: int = 50):
-        """Initialize harvester."""
+    def __init__(self, output_dir: Path, division: str = "d3", top_n: int = 50,
+                 pages: int = DEFAULT_PAGES, resume: bool = True,
+                 snapshots: Optional[SnapshotStore] = None, replay: bool = False,
+                 checkpoint_file: Optional[Path] = None):
+        """
+        Initialize harvester.
+        
+        The checkpoint is written to checkpoint_file (default:
+        <output_dir>/checkpoint.jsonl); resume=False discards it. Pages are recorded to
+        snapshots if given; replay=True parses them from snapshots instead of
+        the live site (and ignores the checkpoint).
+        """
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.division = division
         self.top_n = top_n
-        self._playwright = None
-        self._browser = None
-        
-    def _ensure_playwright(self):
-        """Ensure Playwright is initialized."""
-        if self._playwright is None:
+        self.pages = pages
+        self._pool = None
+        self.snapshots = snapshots
+        self.replay = replay
+        if replay and snapshots is None:
+            raise ValueError("replay needs a SnapshotStore")
+        
+        checkpoint_file = checkpoint_file or output_dir / CHECKPOINT_FILE
+        if not resume and checkpoint_file.exists() and not replay:
+            checkpoint_file.unlink()
+        self.checkpoint = HarvestCheckpoint(None if replay else checkpoint_file)
+        self.school_urls = load_school_urls()
+        
+    def _ensure_playwright(self) -> BrowserPool:
+        """Open the shared browser pool on first use."""
+        if self._pool is None:
             try:
-                from playwright.sync_api import sync_playwright
-                self._playwright = sync_playwright().start()
-                self._browser = self._playwright.chromium.launch(headless=True)
-            except ImportError:
-                print("❌ Playwright not installed. Install with: pip install playwright && playwright install")
+                self._pool = BrowserPool(self.pages).__enter__()
+            except ImportError as e:
+                print(e)
                 sys.exit(1)
+        return self._pool
     
     def _close_playwright(self):
         """Close Playwright resources."""
-        if self._browser:
-            self._browser.close()
-        if self._playwright:
-            self._playwright.stop()
+        if self._pool:
+            self._pool.close()
+            self._pool = None
     
-    def harvest_leaderboard(self, gender: str) -> pd.DataFrame:
+    async def _scrape_event(self, page, job: tuple[str, str, str]) -> list[dict]:
         """
-        Harvest top N from division leaderboard.
+        Scrape one leaderboard event on a pooled page.
         
         Args:
-            gender: "boys" or "girls"
+            page: Playwright page from the pool
+            job: (gender, event value, event name)
             
         Returns:
-            DataFrame with leaderboard data
+            List of result dictionaries
         """
-        self._ensure_playwright()
-        
+        gender, event_value, _ = job
         url = f"{self.BASE_URL}/leaderboards/swimming-{gender}/{self.division}"
-        print(f"\n🎭 Harvesting {gender.title()} {self.division.upper()} leaderboard (top {self.top_n})...")
-        print(f"   URL: {url}")
         
-        all_data = []
-        page = self._browser.new_page()
+        html = await load_leaderboard(page, url, self.top_n, value=event_value)
+        if self.snapshots is not None:
+            self.snapshots.record(self._snapshot_key(job), html)
+        return self._event_results(job, html)
+    
+    def _snapshot_key(self, job: tuple[str, str, str]) -> str:
+        """Snapshot key: the leaderboard URL plus the selected event"""
+        gender, event_value, _ = job
+        return f"{self.BASE_URL}/leaderboards/swimming-{gender}/{self.division}#{event_value}"
+    
+    def _event_results(self, job: tuple[str, str, str], html: str) -> list[dict]:
+        """Result dictionaries for one event from its rendered leaderboard page."""
+        gender, _, event_name = job
+        results = leaderboard_results(html, event_name, self.division, gender, self.top_n)
+        print(f"   📊 {gender.title()} {event_name}: {len(results)} results")
+        return results
+    
+    def _event_job(self, job: tuple[str, str, str]) -> str:
+        gender, event_value, _ = job
+        return f"leaderboard:{self.division}:{gender}:{event_value}:top{self.top_n}"
+    
+    async def _scrape_event_checkpointed(self, page, job: tuple[str, str, str]) -> list[dict]:
+        results = await self._scrape_event(page, job)
+        self.checkpoint.record(self._event_job(job), results)
+        return results
+    
+    def _replay_events(self, jobs: list[tuple[str, str, str]]):
+        """Parse recorded leaderboard pages into the (in-memory) checkpoint."""
+        print(f"\n🧪 Replaying {self.division.upper()} leaderboards (top {self.top_n}) from snapshots...")
+        parse_seconds = 0.0
+        parsed = 0
+        for job in jobs:
+            html = self.snapshots.get(self._snapshot_key(job))
+            if html is None:
+                print(f"   ⚠️  No snapshot: {self._snapshot_key(job)}")
+                continue
+            start = time.perf_counter()
+            self.checkpoint.record(self._event_job(job), self._event_results(job, html))
+            parse_seconds += time.perf_counter() - start
+            parsed += 1
+        print(f"\n🧪 Parsed {parsed} pages in {parse_seconds:.3f}s "
+              f"({parsed / max(parse_seconds, 1e-9):.0f} pages/s)")
+    
+    def harvest_leaderboards(self, genders: list[str]) -> dict[str, pd.DataFrame]:
+        """
+        Harvest top N from the division leaderboards, all events at once.
         
-        try:
-            # Navigate to page (don't wait for networkidle - it times out)
-            page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            time.sleep(3)  # Wait for JavaScript to load
-            print("   ✓ Page loaded")
-            
-            # Define events to scrape (value format for select)
-            events = [
-                ("freeindividual50", "50 Free"),
-                ("freeindividual100", "100 Free"),
-                ("freeindividual200", "200 Free"),
-                ("freeindividual500", "500 Free"),
-                ("backindividual100", "100 Back"),
-                ("breastindividual100", "100 Breast"),
-                ("flyindividual100", "100 Fly"),
-                ("medleyindividual200", "200 IM"),
-                ("medleyrelay200", "200 Medley Relay"),
-                ("freerelay200", "200 Free Relay"),
-                ("freerelay400", "400 Free Relay")
-            ]
-            
-            for event_value, event_name in events:
-                print(f"   📊 Scraping {event_name} (top {self.top_n})...")
-                
-                try:
-                    # Select event from dropdown (using name="category")
-                    page.select_option('select[name="category"]', value=event_value)
-                    time.sleep(1)
-                    
-                    # Click "Load Leaderboard" button
-                    page.click('button:has-text("Load Leaderboard")')
-                    
-                    # Wait for results to load (wait for at least one result row)
-                    try:
-                        page.wait_for_selector('div.box.leaderboard-top-ten div.columns.is-mobile', timeout=10000)
-                    except:
-                        # No results for this event
-                        pass
-                    
-                    time.sleep(2)  # Extra wait for all results to load
-                    
-                    # Extract results from leaderboard boxes
-                    result_rows = page.query_selector_all('div.box.leaderboard-top-ten div.columns.is-mobile')
-                    
-                    for i, row in enumerate(result_rows[:self.top_n], 1):
-                        try:
-                            # Athlete name and school are in column is-9
-                            name_col = row.query_selector('div.column.is-9.leaderboard-name.athlete')
-                            if not name_col:
-                                continue
-                            
-                            # Extract athlete name (in <a> tag)
-                            name_link = name_col.query_selector('a.name')
-                            if name_link:
-                                athlete = name_link.inner_text().strip().replace('\n', ' ').replace('  ', ' ')
-                            else:
-                                continue
-                            
-                            # Extract school (in <span class="team">)
-                            school_span = name_col.query_selector('span.team')
-                            if school_span:
-                                school = school_span.inner_text().strip()
-                            else:
-                                school = "Unknown"
-                            
-                            # Time is in column is-3
-                            time_col = row.query_selector('div.column.is-3.leaderboard-value')
-                            if time_col:
-                                time_str = time_col.inner_text().strip()
-                            else:
-                                continue
-                            
-                            all_data.append({
-                                'event': event_name,
-                                'athlete': athlete,
-                                'school': school,
-                                'time': time_str,
-                                'rank': i,
-                                'division': self.division,
-                                'gender': gender,
-                                'harvest_date': datetime.now().strftime("%Y-%m-%d")
-                            })
-                        except Exception as e:
-                            # Skip rows that don't parse correctly
-                            continue
-                    
-                    print(f"      ✓ Found {min(len(result_rows), self.top_n)} results")
-                
-                except Exception as e:
-                    print(f"      ⚠️  Error scraping {event_name}: {e}")
-                    continue
+        Every (gender, event) is scraped on its own pooled page, so the
+        events of both genders load concurrently. Events completed by an
+        earlier, interrupted run are taken from the checkpoint.
+        
+        Args:
+            genders: e.g. ["boys", "girls"]
             
-        except Exception as e:
-            print(f"❌ Error during scraping: {e}")
-        finally:
-            page.close()
-        
-        if all_data:
-            df = pd.DataFrame(all_data)
-            print(f"\n✅ Successfully scraped {len(df)} total results")
-            return df
+        Returns:
+            {gender: DataFrame with leaderboard data}
+        """
+        jobs = [(gender, value, name) for gender in genders for value, name in EVENTS]
+        pending = [job for job in jobs if self._event_job(job) not in self.checkpoint]
+        
+        if self.replay:
+            self._replay_events(pending)
         else:
-            print(f"\n⚠️  No data scraped")
-            return pd.DataFrame()
+            print(f"\n🎭 Harvesting {self.division.upper()} leaderboards (top {self.top_n}): "
+                  f"{len(pending)} events to scrape, {len(jobs) - len(pending)} done in a previous run")
+            if pending:
+                pool = self._ensure_playwright()
+                pool.map(self._scrape_event_checkpointed, pending)
+        
+        # Events that failed are not in the checkpoint (they are retried on the next run)
+        results = [self.checkpoint.rows(self._event_job(job)) if self._event_job(job) in self.checkpoint
+                   else None for job in jobs]
+        
+        leaderboards = {}
+        for gender in genders:
+            rows = [row for (job_gender, _, _), event_rows in zip(jobs, results)
+                    if job_gender == gender for row in event_rows or []]
+            if rows:
+                leaderboards[gender] = pd.DataFrame(rows)
+                print(f"\n✅ {gender.title()}: scraped {len(rows)} total results")
+            else:
+                leaderboards[gender] = pd.DataFrame()
+                print(f"\n⚠️  {gender.title()}: no data scraped")
+        return leaderboards
+    
+    def harvest_leaderboard(self, gender: str) -> pd.DataFrame:
+        """
+        Harvest top N from division leaderboard.
+        
+        Args:
+            gender: "boys" or "girls"
+            
+        Returns:
+            DataFrame with leaderboard data
+        """
+        return self.harvest_leaderboards([gender])[gender]
     
     def extract_schools(self, df: pd.DataFrame) -> list[str]:
         """
@@ -231,6 +352,55 @@ class DivisionHarvester:
         
         return slug
     
+    async def _find_school_url(self, page, school_name: str) -> Optional[str]:
+        """Try slug + mascot URLs for a school on a pooled page."""
+        slug = self.school_name_to_slug(school_name)
+        
+        for mascot in MASCOTS:
+            test_url = f"{self.MAXPREPS_URL}/high-schools/{slug}-{mascot}/swimming-winter-23-24/stats.htm"
+            try:
+                response = await page.goto(test_url, wait_until="domcontentloaded", timeout=10000)
+                if response and response.status == 200:
+                    # Check if page contains school name
+                    content = await page.content()
+                    if school_name.lower() in content.lower():
+                        print(f"      ✓ Found: {test_url}")
+                        return test_url
+            except Exception:
+                continue
+        
+        print(f"      ⚠️  Could not find MaxPreps URL for {school_name}")
+        return None
+    
+    async def _find_school_url_cached(self, page, school_name: str) -> Optional[str]:
+        url = await self._find_school_url(page, school_name)
+        if url:
+            self.school_urls[school_name] = url
+            save_school_urls(self.school_urls)
+        return url
+    
+    def find_maxpreps_school_urls(self, schools: list[str]) -> dict[str, Optional[str]]:
+        """
+        Search MaxPreps for many schools at once.
+        
+        Schools found before (in any run) come from the URL cache; schools
+        not found are searched again next time.
+        
+        Args:
+            schools: School names
+            
+        Returns:
+            {school: MaxPreps school URL or None}
+        """
+        missing = [school for school in schools if school not in self.school_urls]
+        print(f"\n🔍 Finding MaxPreps URLs: {len(schools) - len(missing)} cached, {len(missing)} to search")
+        if missing and self.replay:
+            print("   (replay: not searching)")
+        elif missing:
+            pool = self._ensure_playwright()
+            pool.map(self._find_school_url_cached, missing)
+        return {school: self.school_urls.get(school) for school in schools}
+    
     def find_maxpreps_school_url(self, school_name: str, state: str = "az") -> Optional[str]:
         """
         Search MaxPreps for school URL.
@@ -242,45 +412,11 @@ class DivisionHarvester:
         Returns:
             MaxPreps school URL or None
         """
-        self._ensure_playwright()
-        
-        # Try direct slug first
-        slug = self.school_name_to_slug(school_name)
-        
-        # Common Arizona high school mascots
-        mascots = ["hawks", "wildcats", "eagles", "falcons", "panthers", "jaguars", 
-                   "mustangs", "bulldogs", "cougars", "spartans", "warriors", "knights"]
-        
-        page = self._browser.new_page()
-        
-        try:
-            for mascot in mascots:
-                test_slug = f"{slug}-{mascot}"
-                test_url = f"{self.MAXPREPS_URL}/high-schools/{test_slug}/swimming-winter-23-24/stats.htm"
-                
-                try:
-                    response = page.goto(test_url, wait_until="domcontentloaded", timeout=10000)
-                    if response and response.status == 200:
-                        # Check if page contains school name
-                        content = page.content()
-                        if school_name.lower() in content.lower():
-                            print(f"      ✓ Found: {test_url}")
-                            page.close()
-                            return test_url
-                except:
-                    continue
-            
-            print(f"      ⚠️  Could not find MaxPreps URL for {school_name}")
-            page.close()
-            return None
-            
-        except Exception as e:
-            print(f"      ❌ Error searching for {school_name}: {e}")
-            page.close()
-            return None
+        return self.find_maxpreps_school_urls([school_name])[school_name]
     
     def harvest_school_relays(self, school_name: str, gender: str, 
-                             cutoff_date: date, state: str = "az") -> pd.DataFrame:
+                             cutoff_date: date, state: str = "az",
+                             school_url: Optional[str] = None) -> pd.DataFrame:
         """
         Harvest relay results for a specific school.
         
@@ -289,6 +425,7 @@ class DivisionHarvester:
             gender: "boys" or "girls"
             cutoff_date: Only include relays from this date onwards
             state: State abbreviation
+            school_url: MaxPreps school URL, if already found
             
         Returns:
             DataFrame with relay results
@@ -296,7 +433,8 @@ class DivisionHarvester:
         print(f"\n   🏊 Harvesting {gender} relays for {school_name}...")
         
         # Find school URL
-        school_url = self.find_maxpreps_school_url(school_name, state)
+        if school_url is None:
+            school_url = self.find_maxpreps_school_url(school_name, state)
         if not school_url:
             return pd.DataFrame()
         
@@ -317,6 +455,12 @@ class DivisionHarvester:
         """
         Harvest relays for all schools.
         
+        School URLs are looked up concurrently on the shared browser first.
+        Each school/season that returned relays is checkpointed and skipped
+        on re-runs. Empty results are not checkpointed: they cannot be told
+        apart from harvest_school_relays' placeholder, and would otherwise
+        mark every school done before relay scraping exists.
+        
         Args:
             schools: List of school names
             gender: "boys" or "girls"
@@ -327,20 +471,34 @@ class DivisionHarvester:
         """
         print(f"\n🏊 Harvesting {gender} relays for {len(schools)} schools...")
         
+        season = season_label(cutoff_date)
+        jobs = {school: f"relays:{self.division}:{gender}:{school}:{season}:{cutoff_date}"
+                for school in schools}
+        pending = [school for school in schools if jobs[school] not in self.checkpoint]
+        print(f"   {len(schools) - len(pending)} school(s) done in a previous run")
+        
+        school_urls = self.find_maxpreps_school_urls(pending)
         all_relays = []
         
         for i, school in enumerate(schools, 1):
+            if jobs[school] in self.checkpoint:
+                rows = self.checkpoint.rows(jobs[school])
+                if rows:
+                    all_relays.append(pd.DataFrame(rows))
+                continue
+            
             print(f"\n[{i}/{len(schools)}] {school}")
+            if not school_urls[school]:
+                continue
             
             try:
-                df = self.harvest_school_relays(school, gender, cutoff_date)
+                df = self.harvest_school_relays(school, gender, cutoff_date,
+                                                school_url=school_urls[school])
                 if not df.empty:
+                    self.checkpoint.record(jobs[school], df.to_dict('records'))
                     all_relays.append(df)
                     print(f"      ✓ Found {len(df)} relay results")
                 
-                # Rate limiting
-                time.sleep(2)
-                
             except Exception as e:
                 print(f"      ❌ Error: {e}")
                 continue
@@ -413,6 +571,28 @@ Examples:
         action='store_true',
         help='Do not append timestamp to output directory'
     )
+    parser.add_argument(
+        '--pages',
+        type=int,
+        default=DEFAULT_PAGES,
+        help=f'Browser pages loading at once (default: {DEFAULT_PAGES})'
+    )
+    parser.add_argument(
+        '--restart',
+        action='store_true',
+        help='Discard the checkpoint for this division/top-N/cutoff and harvest everything again'
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        '--record',
+        action='store_true',
+        help='Save every leaderboard page to the snapshot store'
+    )
+    mode.add_argument(
+        '--replay',
+        action='store_true',
+        help='Parse recorded snapshots instead of the live site'
+    )
     parser.add_argument(
         '--leaderboard-only',
         action='store_true',
@@ -449,7 +629,13 @@ Examples:
         sys.exit(1)
     
     # Initialize harvester
-    harvester = DivisionHarvester(output_dir, args.division, args.top_n)
+    snapshots = SnapshotStore() if args.record or args.replay else None
+    checkpoint_file = checkpoint_path(args.division, args.top_n, cutoff_date)
+    if not args.replay:
+        print(f"💾 Checkpoint: {checkpoint_file}")
+    harvester = DivisionHarvester(output_dir, args.division, args.top_n, args.pages,
+                                  resume=not args.restart, snapshots=snapshots,
+                                  replay=args.replay, checkpoint_file=checkpoint_file)
     
     try:
         # Step 1: Harvest leaderboards
@@ -457,8 +643,9 @@ Examples:
         print(" Step 1: Harvesting Leaderboards")
         print("="*70)
         
-        boys_leaderboard = harvester.harvest_leaderboard("boys")
-        girls_leaderboard = harvester.harvest_leaderboard("girls")
+        leaderboards = harvester.harvest_leaderboards(["boys", "girls"])
+        boys_leaderboard = leaderboards["boys"]
+        girls_leaderboard = leaderboards["girls"]
         
         # Save leaderboards
         if not boys_leaderboard.empty:
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Cached, rate-limited HTTP fetching for the harvesters.
+
+Pages are fetched on a bounded thread pool, with requests to each host
+spaced at least min_interval seconds apart. Every response is stored in an
+on-disk cache keyed by URL (data/cache/http/<sha256>.json + .body); on the
+next run the cached ETag / Last-Modified are sent back, and a 304 reply
+reuses the cached page, so re-harvests only download pages that changed.
+
+Given a SnapshotStore (snapshots.py), every page returned is also recorded
+as a snapshot; with replay=True pages come only from the snapshots and the
+network is never touched.
+
+Usage:
+    from http_cache import CachedFetcher
+    fetcher = CachedFetcher()
+    pages = fetcher.fetch_all(urls, jobs=4)   # {url: html or None}
+    print(fetcher.summary())
+
+    replayer = CachedFetcher(snapshots=SnapshotStore(), replay=True)
+"""
+
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+from urllib.request import Request, urlopen
+
+CACHE_DIR = Path(__file__).parent.parent.parent / 'data' / 'cache' / 'http'
+
+USER_AGENT = 'Mozilla/5.0'
+
+
+class HostRateLimiter:
+    """Spaces out requests to the same host by at least min_interval seconds"""
+
+    def __init__(self, min_interval: float = 0.5):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot: dict[str, float] = {}
+
+    def wait(self, url: str):
+        """Block until a request to url's host may be sent"""
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class CachedFetcher:
+    """HTTP GET with an on-disk cache revalidated by ETag / Last-Modified"""
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, min_interval: float = 0.5,
+                 timeout: float = 30, refresh: bool = False, snapshots=None,
+                 replay: bool = False):
+        self.cache_dir = cache_dir
+        self.rate_limiter = HostRateLimiter(min_interval)
+        self.timeout = timeout
+        self.refresh = refresh
+        self.snapshots = snapshots
+        self.replay = replay
+        if replay and snapshots is None:
+            raise ValueError("replay needs a SnapshotStore")
+        self.stats = {'downloaded': 0, 'not_modified': 0, 'replayed': 0, 'errors': 0}
+        self._stats_lock = threading.Lock()
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return self.cache_dir / f'{key}.json', self.cache_dir / f'{key}.body'
+
+    def _count(self, outcome: str):
+        with self._stats_lock:
+            self.stats[outcome] += 1
+
+    def cached(self, url: str) -> tuple[dict | None, bytes | None]:
+        """Cached metadata and body for url, if any"""
+        meta_path, body_path = self._paths(url)
+        if not meta_path.exists() or not body_path.exists():
+            return None, None
+        with open(meta_path) as f:
+            return json.load(f), body_path.read_bytes()
+
+    def _store(self, url: str, headers, body: bytes):
+        meta_path, body_path = self._paths(url)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = body_path.with_suffix('.body.tmp')
+        tmp.write_bytes(body)
+        tmp.replace(body_path)
+        meta = {
+            'url': url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'fetched_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        }
+        tmp = meta_path.with_suffix('.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(meta, f, indent=2)
+        tmp.replace(meta_path)
+
+    def _replay(self, url: str) -> str | None:
+        text = self.snapshots.get(url)
+        if text is None:
+            print(f"  No snapshot: {url}")
+            self._count('errors')
+        else:
+            self._count('replayed')
+        return text
+
+    def _snapshot(self, url: str, text: str) -> str:
+        if self.snapshots is not None:
+            self.snapshots.record(url, text)
+        return text
+
+    def fetch(self, url: str) -> str | None:
+        """Page text, from the network or (if unchanged) the cache; None on error"""
+        if self.replay:
+            return self._replay(url)
+
+        meta, body = (None, None) if self.refresh else self.cached(url)
+
+        headers = {'User-Agent': USER_AGENT}
+        if meta and meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta and meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+        self.rate_limiter.wait(url)
+        try:
+            with urlopen(Request(url, headers=headers), timeout=self.timeout) as response:
+                body = response.read()
+                self._store(url, response.headers, body)
+                self._count('downloaded')
+                return self._snapshot(url, body.decode('utf-8'))
+        except HTTPError as e:
+            if e.code == 304 and body is not None:
+                self._count('not_modified')
+                return self._snapshot(url, body.decode('utf-8'))
+            print(f"  HTTP Error {e.code}: {url}")
+        except URLError as e:
+            print(f"  URL Error: {e.reason}")
+        except Exception as e:
+            print(f"  Error: {e}")
+        self._count('errors')
+        return None
+
+    def fetch_all(self, urls: list[str], jobs: int = 4) -> dict[str, str | None]:
+        """Fetch urls on up to jobs threads; returns {url: text or None} in input order"""
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            pages = list(pool.map(self.fetch, urls))
+        return dict(zip(urls, pages))
+
+    def summary(self) -> str:
+        if self.replay:
+            return f"{self.stats['replayed']} replayed from snapshots, {self.stats['errors']} missing"
+        return (f"{self.stats['downloaded']} downloaded, {self.stats['not_modified']} unchanged "
+                f"(from cache), {self.stats['errors']} failed")
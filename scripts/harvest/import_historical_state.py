@@ -13,6 +13,10 @@ from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
 import urllib.request
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from time_parser import parse_time
 
 
 @dataclass
@@ -247,14 +251,6 @@ def generate_season_file(results: list[SwimResult], year: int, gender: str, outp
     print(f"  ✓ Generated: {output_path.name}")
 
 
-def parse_time(time_str: str) -> float:
-    """Parse swim time to seconds for sorting."""
-    if ':' in time_str:
-        parts = time_str.split(':')
-        return float(parts[0]) * 60 + float(parts[1])
-    return float(time_str)
-
-
 def main():
     base_dir = Path(__file__).parent
     data_dir = base_dir / "historical_data"
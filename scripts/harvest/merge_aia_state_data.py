@@ -9,49 +9,16 @@ missing swims to create a complete historical record.
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List
-import re
-import json
+import sys
 
-
-def normalize_name(name: str) -> str:
-    """Normalize name for matching (lowercase, no spaces, no punctuation)"""
-    return re.sub(r'[^a-z]', '', name.lower())
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from name_resolver import NameResolver
+from swimmer_index import SwimmerIndex
 
 
 def find_swimmer_file(name: str, swimmers_dir: Path) -> Path | None:
     """Find the CSV file for a swimmer by name matching"""
-    normalized_search = normalize_name(name)
-    
-    for csv_file in swimmers_dir.glob("*.csv"):
-        # Check filename
-        filename_normalized = normalize_name(csv_file.stem)
-        if normalized_search in filename_normalized:
-            return csv_file
-        
-        # Check Name column in file
-        try:
-            df = pd.read_csv(csv_file, nrows=1)
-            if 'Name' in df.columns:
-                file_name_normalized = normalize_name(df['Name'].iloc[0])
-                if file_name_normalized == normalized_search:
-                    return csv_file
-        except:
-            continue
-    
-    return None
-
-
-def load_aliases(aliases_file: Path) -> dict:
-    """Load swimmer name aliases"""
-    if aliases_file.exists():
-        with open(aliases_file, 'r') as f:
-            return json.load(f)
-    return {}
-
-
-def apply_alias(name: str, aliases: dict) -> str:
-    """Apply alias mapping to get preferred name"""
-    return aliases.get(name, name)
+    return SwimmerIndex.load(swimmers_dir).find_file_normalized(name)
 
 
 def merge_aia_swims(aia_csv: Path, swimmers_dir: Path, aliases_file: Path) -> Dict:
@@ -64,16 +31,16 @@ def merge_aia_swims(aia_csv: Path, swimmers_dir: Path, aliases_file: Path) -> Di
     print("🔄 Merging AIA State Meet Data\n")
     
     # Load aliases
-    aliases = load_aliases(aliases_file)
-    if aliases:
-        print(f"📋 Loaded {len(aliases)} name aliases")
+    resolver = NameResolver.load(aliases_file)
+    if resolver.aliases:
+        print(f"📋 Loaded {len(resolver.aliases)} name aliases")
     
     # Load AIA state meet data
     aia_df = pd.read_csv(aia_csv)
     print(f"📂 Loaded {len(aia_df)} AIA state meet swims")
     
     # Apply aliases to normalize names
-    aia_df['Name'] = aia_df['Name'].apply(lambda x: apply_alias(x, aliases))
+    aia_df['Name'] = resolver.resolve_series(aia_df['Name'])
     
     stats = {
         'swimmers_found': 0,
@@ -4,15 +4,65 @@ Parse AIA State Championship PDFs for Tanque Verde High School swimmers
 
 Extracts swimmer results from Arizona Interscholastic Association (AIA)
 state championship PDFs and saves them to CSV files.
+
+PDFs are parsed concurrently on a process pool. Each PDF's per-page text and
+its parsed rows are cached in data/cache/aia_state/, keyed by the PDF's
+SHA-256, so re-runs only extract and parse new or changed PDFs.
+
+With --all-schools the whole field of every event is kept, not just Tanque
+Verde's swims: individual results, relay team lines with their four legs,
+and the split lines under each result (cumulative splits as hundredths).
+It is written as one Parquet dataset partitioned by meet year
+(data/cache/aia_state_results/year=2024/part.parquet), with finals and
+prelim times also as int32 hundredths. --benchmark times uncached text
+extraction and parsing of the downloaded PDFs and reports pages per second.
+
+These PDFs are laid out one result per line, unlike the 2001-2011 PDFs read
+by extract_historical_state.py, so the two keep separate parsers. The
+full-meet dataset takes those years' individual results from
+extract_historical_state.stream_school_results (they have no places, relays
+or splits). Result-like lines that neither pattern parses are counted and
+reported per year.
+
+Usage:
+    python3 parse_aia_state_meets.py
+    python3 parse_aia_state_meets.py --jobs 1        # parse serially
+    python3 parse_aia_state_meets.py --all-schools   # full-meet dataset
+    python3 parse_aia_state_meets.py --benchmark
+
+    from parse_aia_state_meets import load_state_results
+    df = load_state_results(years=[2023, 2024])
 """
 
+import argparse
+import hashlib
+import json
+import os
 import pdfplumber
 import re
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional
 import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from time_parser import parse_hundredths, parse_times
+from extract_historical_state import iter_pdf_lines, stream_school_results
+
+CACHE_DIR = Path(__file__).parent.parent.parent / 'data' / 'cache' / 'aia_state'
+RESULTS_DIR = Path(__file__).parent.parent.parent / 'data' / 'cache' / 'aia_state_results'
+
+# Bump to invalidate cached page text (extract_pdf_pages) or rows (parse_aia_lines)
+TEXT_VERSION = 1
+PARSER_VERSION = 3
+
+# Meets up to this year use the older layout read by extract_historical_state.py
+LAST_HISTORICAL_YEAR = 2011
+
+HISTORICAL_GRADES = {'FR': 9, 'SO': 10, 'JR': 11, 'SR': 12}
 
 # AIA State Championship PDFs (2001-2025)
 AIA_STATE_MEETS = [
@@ -62,6 +112,34 @@ def normalize_event_name(event: str) -> str:
     return event_map.get(event, event)
 
 
+# Pattern: place lastname, firstname grade school prelim finals [splits]
+# Grade is 09-12 (with leading zero). Names may have apostrophes, hyphens and
+# spaces (O'Brien, De La Cruz), as in RELAY_LEG_RE.
+SWIMMER_LINE_RE = re.compile(
+    r"^\s*(\d+)\s+([A-Za-z][A-Za-z\-' ]*?),\s+([A-Za-z][A-Za-z\-'\s]*?)\s+(\d{2})\s+(.*?)\s+([\d:\.]+)\s+([\d:\.]+|DQ|DNF|SCR)")
+
+# A line that looks like a result (a place, or -- for a DQ, then a name or
+# school); full mode counts those that no pattern parsed
+RESULT_LIKE_RE = re.compile(r'^\s*(?:\d+|--)\s+[A-Za-z]')
+
+
+# Pattern: place school relay-letter prelim finals
+# e.g. 3 Tanque Verde High School A 1:52.10 1:50.87
+RELAY_LINE_RE = re.compile(
+    r"^\s*(\d+)\s+(.+?)\s+'?([A-E])'?\s+([\d:\.]+|NT)\s+([\d:\.]+|DQ|DNF|SCR)")
+
+# Relay legs listed under a relay line: 1) Olsson, Wade 10 2) The, Grayson 12
+RELAY_LEG_RE = re.compile(
+    r"(\d)\)\s+(?:r:[+-]?\d*\.\d+\s+)?([A-Za-z][A-Za-z\-' ]*?),\s+([A-Za-z]+(?:\s[A-Za-z]+)*?)\s+(\d{2})\b")
+
+# Split line under a result: an optional reaction time, then cumulative
+# times, each optionally followed by its (interval)
+_TIME = r'(?:\d{1,2}:)?\d{1,2}\.\d{2}'
+SPLIT_LINE_RE = re.compile(
+    rf'^\s*(?:r:[+-]?\d*\.\d+\s+)?{_TIME}(?:\s+(?:\({_TIME}\)|{_TIME}))*\s*$')
+SPLIT_TIME_RE = re.compile(rf'(?:^|(?<=\s))({_TIME})(?=\s|$)')
+
+
 def parse_swimmer_line(line: str) -> Optional[Dict]:
     """
     Parse a results line like:
@@ -69,11 +147,7 @@ def parse_swimmer_line(line: str) -> Optional[Dict]:
     
     Returns dict with place, name, grade, school, prelim_time, finals_time
     """
-    # Pattern: place lastname, firstname grade school prelim finals [splits]
-    # Grade is 09-12 (with leading zero)
-    pattern = r'^\s*(\d+)\s+([A-Za-z\-]+),\s+([A-Za-z\s]+?)\s+(\d{2})\s+(.*?)\s+([\d:\.]+)\s+([\d:\.]+|DQ|DNF|SCR)'
-    
-    match = re.match(pattern, line)
+    match = SWIMMER_LINE_RE.match(line)
     if match:
         place, last_name, first_name, grade, school, prelim, finals = match.groups()
         
@@ -92,6 +166,32 @@ def parse_swimmer_line(line: str) -> Optional[Dict]:
     return None
 
 
+def parse_relay_line(line: str) -> Optional[Dict]:
+    """
+    Parse a relay team line like:
+    3 Tanque Verde High School A 1:52.10 1:50.87
+    
+    Returns dict with place, school, relay letter, prelim_time, finals_time
+    and an empty swimmers list for the legs on the following lines
+    """
+    match = RELAY_LINE_RE.match(line)
+    if not match:
+        return None
+    place, school, relay, prelim, finals = match.groups()
+    remarks = line[match.end():].strip()
+    return {
+        'place': int(place),
+        'name': None,
+        'grade': None,
+        'school': school.strip(),
+        'relay': relay,
+        'prelim_time': prelim if prelim not in ['NT', 'DQ', 'DNF', 'SCR'] else None,
+        'finals_time': finals if finals not in ['DQ', 'DNF', 'SCR'] else None,
+        'splits': remarks if remarks else None,
+        'swimmers': [],
+    }
+
+
 def determine_gender_from_context(lines: List[str], line_idx: int) -> str:
     """Determine gender by looking at nearby event headers"""
     # Look backwards up to 50 lines for event header
@@ -104,13 +204,94 @@ def determine_gender_from_context(lines: List[str], line_idx: int) -> str:
     return 'U'  # Unknown
 
 
-def parse_aia_pdf(pdf_path: str, school_name: str = "Tanque Verde") -> List[Dict]:
+def pdf_digest(pdf_path) -> str:
+    """SHA-256 of a PDF's content"""
+    return hashlib.sha256(Path(pdf_path).read_bytes()).hexdigest()
+
+
+def _read_cache(path: Path, version: int):
+    """Cached data, or None if missing or written by another version"""
+    if not path.exists():
+        return None
+    with open(path) as f:
+        cached = json.load(f)
+    return cached['data'] if cached.get('version') == version else None
+
+
+def _write_cache(path: Path, version: int, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    with open(tmp, 'w') as f:
+        json.dump({'version': version, 'data': data}, f)
+    tmp.replace(path)
+
+
+def extract_pdf_pages(pdf_path) -> List[str]:
+    """Text of every page ('' for pages without text)"""
+    with pdfplumber.open(pdf_path) as pdf:
+        return [page.extract_text() or '' for page in pdf.pages]
+
+
+def cached_pdf_pages(pdf_path, digest: str = None, cache_dir: Path = CACHE_DIR) -> List[str]:
+    """Page text of a PDF, extracted once per PDF content"""
+    digest = digest or pdf_digest(pdf_path)
+    cache_file = cache_dir / f"{digest}.pages.json"
+    pages = _read_cache(cache_file, TEXT_VERSION)
+    if pages is None:
+        pages = extract_pdf_pages(pdf_path)
+        _write_cache(cache_file, TEXT_VERSION, pages)
+    return pages
+
+
+def page_lines(pages: List[str]) -> List[str]:
+    """Text lines of every page, in order"""
+    return [line for text in pages if text for line in text.split('\n')]
+
+
+def event_from_header(line: str) -> Optional[str]:
+    """AIA event name ('200 Free') for an event header line, or None"""
+    # Relays first: "200 Yard Free Relay" or "200 Yard Freestyle Relay"
+    if "Relay" in line:
+        if "200 Yard Medley" in line:
+            return "200 Medley Relay"
+        elif "200 Yard Free" in line:
+            return "200 Free Relay"
+        elif "400 Yard Free" in line:
+            return "400 Free Relay"
+        return None
+    if "200 Yard Free" in line:
+        return "200 Free"
+    elif "200 Yard IM" in line:
+        return "200 IM"
+    elif "50 Yard Free" in line:
+        return "50 Free"
+    elif "100 Yard Fly" in line or "100 Yard Butterfly" in line:
+        return "100 Fly"
+    elif "100 Yard Free" in line:
+        return "100 Free"
+    elif "500 Yard Free" in line:
+        return "500 Free"
+    elif "100 Yard Back" in line:
+        return "100 Back"
+    elif "100 Yard Breast" in line:
+        return "100 Breast"
+    return None
+
+
+def parse_aia_lines(all_lines: List[str], school_name: Optional[str] = "Tanque Verde",
+                    full: bool = False, unmatched: Optional[List[str]] = None) -> List[Dict]:
     """
-    Extract all swims for a specific school from an AIA state championship PDF
+    Extract all swims for a specific school from the text lines of an AIA
+    state championship PDF
     
     Args:
-        pdf_path: Path to PDF file
-        school_name: School name to search for (default: "Tanque Verde")
+        all_lines: Text lines of every page, in order
+        school_name: School name to search for (default: "Tanque Verde");
+            None keeps every school's swims
+        full: Also parse relay team lines (with their legs as 'swimmers')
+            and the split lines under each result ('split_hundredths')
+        unmatched: full mode appends the result-like lines (RESULT_LIKE_RE)
+            of an event that no pattern parsed here
     
     Returns:
         List of swim dictionaries with extracted data
@@ -118,65 +299,275 @@ def parse_aia_pdf(pdf_path: str, school_name: str = "Tanque Verde") -> List[Dict
     swims = []
     current_event = None
     current_gender = None
+    last_result = None  # full: the kept result that leg and split lines belong to
     
-    print(f"  📖 Parsing {Path(pdf_path).name}...")
-    
-    with pdfplumber.open(pdf_path) as pdf:
-        all_lines = []
-        for page in pdf.pages:
-            text = page.extract_text()
-            if text:
-                all_lines.extend(text.split('\n'))
+    for i, line in enumerate(all_lines):
+        # Check for event headers
+        if "Yard" in line:
+            last_result = None
+            # Boys/Girls event detection
+            if "Boys" in line or "#Boys" in line:
+                current_gender = 'M'
+            elif "Girls" in line or "#Girls" in line:
+                current_gender = 'F'
+            current_event = event_from_header(line) or current_event
         
-        for i, line in enumerate(all_lines):
-            # Check for event headers
-            if "Yard" in line:
-                # Boys/Girls event detection
-                if "Boys" in line or "#Boys" in line:
-                    current_gender = 'M'
-                elif "Girls" in line or "#Girls" in line:
-                    current_gender = 'F'
-                
-                # Event detection
-                if "200 Yard Medley Relay" in line:
-                    current_event = "200 Medley Relay"
-                elif "200 Yard Free" in line and "Relay" not in line:
-                    current_event = "200 Free"
-                elif "200 Yard IM" in line:
-                    current_event = "200 IM"
-                elif "50 Yard Free" in line:
-                    current_event = "50 Free"
-                elif "100 Yard Fly" in line or "100 Yard Butterfly" in line:
-                    current_event = "100 Fly"
-                elif "100 Yard Free" in line and "Relay" not in line:
-                    current_event = "100 Free"
-                elif "500 Yard Free" in line:
-                    current_event = "500 Free"
-                elif "200 Yard Free Relay" in line:
-                    current_event = "200 Free Relay"
-                elif "100 Yard Back" in line:
-                    current_event = "100 Back"
-                elif "100 Yard Breast" in line:
-                    current_event = "100 Breast"
-                elif "400 Yard Free Relay" in line:
-                    current_event = "400 Free Relay"
-            
-            # Look for school name
-            if school_name in line and current_event:
-                # Try to parse as swimmer result
-                result = parse_swimmer_line(line)
-                if result:
-                    # Determine gender if not set
+        if full:
+            if not current_event:
+                continue
+            result = parse_swimmer_line(line)
+            if result is None and 'Relay' in current_event:
+                result = parse_relay_line(line)
+            if result:
+                # Legs and splits of a result from another school are skipped
+                last_result = None
+                if school_name is None or school_name in line:
                     if not current_gender:
                         current_gender = determine_gender_from_context(all_lines, i)
-                    
                     result['event'] = current_event
                     result['gender'] = current_gender
+                    result['split_hundredths'] = []
                     swims.append(result)
+                    last_result = result
+            elif last_result is None or not parse_result_detail(line, last_result):
+                if (unmatched is not None and RESULT_LIKE_RE.match(line)
+                        and (school_name is None or school_name in line)):
+                    unmatched.append(line)
+            continue
+        
+        # Look for school name
+        if current_event and (school_name is None or school_name in line):
+            # Try to parse as swimmer result
+            result = parse_swimmer_line(line)
+            if result:
+                # Determine gender if not set
+                if not current_gender:
+                    current_gender = determine_gender_from_context(all_lines, i)
+                
+                result['event'] = current_event
+                result['gender'] = current_gender
+                swims.append(result)
+
+    return swims
+
+
+def parse_result_detail(line: str, result: Dict) -> bool:
+    """
+    Add a relay legs line or a split line to the result above it.
+    
+    Returns False if the line is neither.
+    """
+    if 'swimmers' in result:
+        legs = RELAY_LEG_RE.findall(line)
+        if legs:
+            result['swimmers'].extend(f"{first.strip()} {last}" for _, last, first, _ in legs)
+            return True
+    if SPLIT_LINE_RE.match(line):
+        result['split_hundredths'].extend(parse_hundredths(t) for t in SPLIT_TIME_RE.findall(line))
+        return True
+    return False
+
+
+def parse_aia_pdf(pdf_path: str, school_name: Optional[str] = "Tanque Verde",
+                  cache_dir: Path = CACHE_DIR, full: bool = False,
+                  unmatched: Optional[List[str]] = None) -> List[Dict]:
+    """
+    Extract all swims for a specific school from an AIA state championship PDF
+    
+    Page text and parsed rows are cached by the PDF's content hash.
     
+    Args:
+        pdf_path: Path to PDF file
+        school_name: School name to search for (default: "Tanque Verde");
+            None keeps every school's swims
+        cache_dir: Cache directory (None to disable caching)
+        full: Also parse relays, relay legs and splits (see parse_aia_lines)
+        unmatched: full mode extends this with the result-like lines no
+            pattern parsed (cached along with the rows)
+    
+    Returns:
+        List of swim dictionaries with extracted data
+    """
+    if cache_dir is None:
+        print(f"  📖 Parsing {Path(pdf_path).name}...")
+        pages = extract_pdf_pages(pdf_path)
+        return parse_aia_lines(page_lines(pages), school_name, full, unmatched)
+    
+    digest = pdf_digest(pdf_path)
+    school_key = re.sub(r'[^a-z0-9]+', '-', (school_name or 'all schools').lower()).strip('-')
+    if full:
+        school_key += '.full'
+    rows_file = cache_dir / f"{digest}.{school_key}.rows.json"
+    cached = _read_cache(rows_file, PARSER_VERSION)
+    if cached is not None:
+        if full:
+            if unmatched is not None:
+                unmatched.extend(cached['unmatched'])
+            return cached['swims']
+        return cached
+    
+    print(f"  📖 Parsing {Path(pdf_path).name}...")
+    pages = cached_pdf_pages(pdf_path, digest, cache_dir)
+    skipped = []
+    swims = parse_aia_lines(page_lines(pages), school_name, full, skipped)
+    _write_cache(rows_file, PARSER_VERSION, {'swims': swims, 'unmatched': skipped} if full else swims)
+    if unmatched is not None:
+        unmatched.extend(skipped)
+    return swims
+
+
+def _parse_year(pdf_path, school_name: Optional[str], full: bool = False):
+    """Worker: (swims, unmatched lines) for one PDF, or the exception that stopped it"""
+    try:
+        unmatched = []
+        return parse_aia_pdf(pdf_path, school_name=school_name, full=full, unmatched=unmatched), unmatched
+    except Exception as e:
+        return e
+
+
+def parse_aia_pdfs(pdf_paths: Dict[int, Path], school_name: Optional[str] = "Tanque Verde",
+                   workers: int = 1, full: bool = False,
+                   unmatched: Optional[Dict[int, List[str]]] = None) -> Dict[int, object]:
+    """
+    Parse several years' PDFs, on a process pool for more than one worker.
+    
+    Returns {year: list of swims, or the exception raised parsing it}. With
+    full, unmatched (if given) gets each year's unparsed result-like lines.
+    """
+    years = list(pdf_paths)
+    if workers <= 1:
+        results = {year: _parse_year(pdf_paths[year], school_name, full) for year in years}
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {year: pool.submit(_parse_year, pdf_paths[year], school_name, full) for year in years}
+            results = {year: future.result() for year, future in futures.items()}
+    
+    parsed = {}
+    for year, result in results.items():
+        if isinstance(result, Exception):
+            parsed[year] = result
+            continue
+        parsed[year], skipped = result
+        if unmatched is not None:
+            unmatched[year] = skipped
+    return parsed
+
+
+def historical_swims(pdf_path, year: int) -> List[Dict]:
+    """Every school's individual swims from a 2001-2011 PDF, as full-mode rows"""
+    swims = []
+    for result in stream_school_results(iter_pdf_lines(Path(pdf_path)), year, school=None):
+        event = event_from_header(result.event)
+        if event is None:
+            continue
+        swims.append({
+            'place': None,
+            'name': result.swimmer_name,
+            'grade': HISTORICAL_GRADES.get(result.grade),
+            'school': result.school,
+            'prelim_time': None,
+            'finals_time': result.time,
+            'splits': None,
+            'event': event,
+            'gender': result.gender,
+            'split_hundredths': [],
+        })
     return swims
 
 
+def _parse_historical_year(pdf_path, year: int):
+    """Worker: swims for one 2001-2011 PDF, or the exception that stopped it"""
+    try:
+        return historical_swims(pdf_path, year)
+    except Exception as e:
+        return e
+
+
+def parse_historical_pdfs(pdf_paths: Dict[int, Path], workers: int = 1) -> Dict[int, object]:
+    """{year: list of swims, or the exception raised parsing it} for 2001-2011 PDFs"""
+    years = list(pdf_paths)
+    if workers <= 1:
+        return {year: _parse_historical_year(pdf_paths[year], year) for year in years}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {year: pool.submit(_parse_historical_year, pdf_paths[year], year) for year in years}
+        return {year: future.result() for year, future in futures.items()}
+
+
+def state_results_frame(swims: List[Dict], year: int, meet_date: str) -> pd.DataFrame:
+    """
+    One year's full-meet swims as typed columns.
+    
+    Relay rows have no name or grade; they carry the relay letter and the
+    legs in swimmers. Rows from the 2001-2011 PDFs have no place. split_hundredths holds the cumulative splits, and
+    remarks any text after the times (e.g. qualifier marks).
+    """
+    df = pd.DataFrame(swims, columns=[
+        'place', 'name', 'grade', 'school', 'relay', 'prelim_time', 'finals_time', 'splits',
+        'event', 'gender', 'swimmers', 'split_hundredths'])
+    df = df.rename(columns={'splits': 'remarks'})
+    df.insert(0, 'year', year)
+    df.insert(1, 'meet_date', pd.to_datetime(meet_date, format='%m/%d/%Y'))
+    df['event'] = df['event'].map(normalize_event_name)
+    df['finals_hundredths'] = parse_times(df['finals_time'], unit='hundredths')
+    df['prelim_hundredths'] = parse_times(df['prelim_time'], unit='hundredths')
+    df['place'] = df['place'].astype('Int16')
+    df['grade'] = df['grade'].astype('Int8')
+    for column in ('school', 'event', 'gender'):
+        df[column] = df[column].astype('category')
+    return df
+
+
+def write_state_results(df: pd.DataFrame, year: int, results_dir: Path = RESULTS_DIR) -> Path:
+    """Replace one year's partition of the full-meet dataset"""
+    part = results_dir / f'year={year}' / 'part.parquet'
+    part.parent.mkdir(parents=True, exist_ok=True)
+    tmp = part.with_suffix('.parquet.tmp')
+    df.drop(columns='year').to_parquet(tmp, index=False)
+    tmp.replace(part)
+    return part
+
+
+def load_state_results(years: Optional[List[int]] = None, results_dir: Path = RESULTS_DIR) -> pd.DataFrame:
+    """Full-meet state results, optionally only some years"""
+    frames = []
+    for part in sorted(results_dir.glob('year=*/part.parquet')):
+        year = int(part.parent.name.split('=', 1)[1])
+        if years is None or year in years:
+            frames.append(pd.read_parquet(part).assign(year=year))
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def _benchmark_pdf(pdf_path) -> tuple:
+    """Worker: (pages, extract seconds, parse seconds, swims) without caches"""
+    start = time.perf_counter()
+    pages = extract_pdf_pages(pdf_path)
+    extracted = time.perf_counter()
+    swims = parse_aia_lines(page_lines(pages), school_name=None, full=True)
+    return len(pages), extracted - start, time.perf_counter() - extracted, len(swims)
+
+
+def benchmark_extraction(pdf_paths: Dict[int, Path], workers: int = 1):
+    """Print full-meet extraction throughput in pages per second"""
+    start = time.perf_counter()
+    if workers <= 1:
+        timings = [_benchmark_pdf(path) for path in pdf_paths.values()]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            timings = list(pool.map(_benchmark_pdf, pdf_paths.values()))
+    wall = time.perf_counter() - start
+
+    pages = sum(t[0] for t in timings)
+    extract_seconds = sum(t[1] for t in timings)
+    parse_seconds = sum(t[2] for t in timings)
+    swims = sum(t[3] for t in timings)
+    print(f"\n⏱  {len(timings)} PDFs, {pages} pages, {swims} swims ({workers} workers)")
+    print(f"  Text extraction: {pages / max(extract_seconds, 1e-9):8.1f} pages/s per worker")
+    print(f"  Line parsing:    {pages / max(parse_seconds, 1e-9):8.1f} pages/s per worker")
+    print(f"  End to end:      {pages / max(wall, 1e-9):8.1f} pages/s ({wall:.2f}s wall)")
+
+
 def download_aia_pdf(year: int, file_id: int, output_dir: Path) -> Path:
     """Download AIA state championship PDF for a specific year"""
     import urllib.request
@@ -198,33 +589,95 @@ def download_aia_pdf(year: int, file_id: int, output_dir: Path) -> Path:
         return None
 
 
+def extract_all_schools(pdf_paths: Dict[int, Path], workers: int = 1,
+                        results_dir: Path = RESULTS_DIR):
+    """Parse every school's swims and write the year-partitioned dataset"""
+    print(f"\n🔍 Parsing {len(pdf_paths)} PDFs, all schools ({workers} workers)...")
+    historical = {year: path for year, path in pdf_paths.items() if year <= LAST_HISTORICAL_YEAR}
+    current = {year: path for year, path in pdf_paths.items() if year > LAST_HISTORICAL_YEAR}
+    unmatched = {}
+    parsed = parse_aia_pdfs(current, school_name=None, workers=workers, full=True, unmatched=unmatched)
+    parsed.update(parse_historical_pdfs(historical, workers=workers))
+    
+    total = 0
+    for meet in AIA_STATE_MEETS:
+        year = meet["year"]
+        swims = parsed.get(year)
+        if swims is None:
+            continue
+        if isinstance(swims, Exception):
+            print(f"  ✗ Error parsing {year}: {swims}")
+            continue
+        if not swims:
+            print(f"  – {year}: no results parsed, partition not written")
+            continue
+        df = state_results_frame(swims, year, meet["date"])
+        write_state_results(df, year, results_dir)
+        layout = " (historical layout: individual events only)" if year in historical else ""
+        print(f"  ✓ {year}: {len(df)} swims, {df['school'].nunique()} schools{layout}")
+        skipped = unmatched.get(year, [])
+        if skipped:
+            print(f"    ⚠️  {len(skipped)} result-like lines matched no pattern, e.g. {skipped[0].strip()!r}")
+        total += len(df)
+    
+    print("\n" + "=" * 80)
+    print(f"\n📊 Total: {total} swims written to {results_dir}")
+
+
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description='Parse AIA state championship PDFs')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes for PDF parsing')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--all-schools', action='store_true',
+                      help=f'Extract every school\'s swims into {RESULTS_DIR}')
+    mode.add_argument('--benchmark', action='store_true',
+                      help='Time uncached extraction of the downloaded PDFs (pages/s)')
+    args = parser.parse_args()
+    
     script_dir = Path(__file__).parent
     output_dir = script_dir / "data" / "raw" / "aia-state"
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    print("🏊 AIA State Championship Parser for Tanque Verde High School\n")
+    if args.all_schools or args.benchmark:
+        print("🏊 AIA State Championship Parser (full meet)\n")
+    else:
+        print("🏊 AIA State Championship Parser for Tanque Verde High School\n")
     print("=" * 80)
     
     all_swims = []
     
-    # Download and parse each year
+    # Download each year's PDF
+    pdf_paths = {}
+    for meet in AIA_STATE_MEETS:
+        print(f"\n📅 {meet['year']} State Championships")
+        pdf_path = download_aia_pdf(meet["year"], meet["file_id"], output_dir)
+        if pdf_path:
+            pdf_paths[meet["year"]] = pdf_path
+    
+    if args.benchmark:
+        benchmark_extraction(pdf_paths, workers=args.jobs)
+        return
+    
+    if args.all_schools:
+        extract_all_schools(pdf_paths, workers=args.jobs)
+        return
+    
+    # Parse PDFs for Tanque Verde swimmers (concurrently; cached PDFs are not re-parsed)
+    print(f"\n🔍 Parsing {len(pdf_paths)} PDFs ({args.jobs} workers)...")
+    parsed = parse_aia_pdfs(pdf_paths, school_name="Tanque Verde", workers=args.jobs)
+    
     for meet in AIA_STATE_MEETS:
         year = meet["year"]
-        file_id = meet["file_id"]
         meet_date = meet["date"]
-        
-        print(f"\n📅 {year} State Championships")
-        
-        # Download PDF
-        pdf_path = download_aia_pdf(year, file_id, output_dir)
-        if not pdf_path:
+        if year not in parsed:
             continue
         
-        # Parse PDF for Tanque Verde swimmers
         try:
-            swims = parse_aia_pdf(pdf_path, school_name="Tanque Verde")
+            swims = parsed[year]
+            if isinstance(swims, Exception):
+                raise swims
             
             # Add year and date to each swim
             for swim in swims:
@@ -232,7 +685,7 @@ def main():
                 swim['meet_date'] = meet_date
                 swim['meet_name'] = f"{year} D-3 AIA State Championships (AZ)"
             
-            print(f"  ✓ Found {len(swims)} Tanque Verde swims")
+            print(f"  ✓ {year}: found {len(swims)} Tanque Verde swims")
             all_swims.extend(swims)
             
         except Exception as e:
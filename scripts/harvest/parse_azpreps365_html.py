@@ -4,13 +4,158 @@ Parse AzPreps365 HTML for Leaderboard Data
 
 This script helps inspect and parse the actual HTML structure from azpreps365.com
 to extract leaderboard data. Run this after saving raw HTML files.
+
+It is also the one place that knows the azpreps365 page structure: the
+event list, the dropdown and row selectors, load_leaderboard() to drive the
+category dropdown on a pooled browser page, and the row parsers
+category_names(), parse_leaderboard_rows() / leaderboard_results()
+(leaderboard page) and
+parse_event_page_rows() (direct event pages). Every azpreps365 harvester imports them from here.
+`--snapshots` runs the leaderboard parser over every azpreps365 page in the
+snapshot store (snapshots.py) and reports parse throughput.
+
+Usage:
+    python3 parse_azpreps365_html.py
+    python3 parse_azpreps365_html.py --snapshots
 """
 
+import argparse
+import time
+from datetime import datetime
 from pathlib import Path
 from bs4 import BeautifulSoup
 import pandas as pd
 import re
 
+from browser_pool import wait_for_rows
+from snapshots import SnapshotStore
+
+# Events to scrape: (category select value, also the direct event page slug; name)
+EVENTS = [
+    ("freeindividual50", "50 Free"),
+    ("freeindividual100", "100 Free"),
+    ("freeindividual200", "200 Free"),
+    ("freeindividual500", "500 Free"),
+    ("backindividual100", "100 Back"),
+    ("breastindividual100", "100 Breast"),
+    ("flyindividual100", "100 Fly"),
+    ("medleyindividual200", "200 IM"),
+    ("medleyrelay200", "200 Medley Relay"),
+    ("freerelay200", "200 Free Relay"),
+    ("freerelay400", "400 Free Relay")
+]
+
+# The leaderboard page also has a select[name="tier"] (Statewide, Division I-III)
+CATEGORY_SELECT = 'select[name="category"]'
+
+# Results are in div.columns.is-mobile within div.box.leaderboard-top-ten
+LEADERBOARD_ROWS = 'div.box.leaderboard-top-ten div.columns.is-mobile'
+
+# Rows shown per event on the leaderboard page
+LEADERBOARD_SIZE = 50
+
+# Direct event pages (/leaderboards/swimming-{gender}/{division}/{slug}) use a table
+EVENT_PAGE_ROWS = 'table tbody tr'
+
+
+async def load_leaderboard(page, url: str, rows: int = LEADERBOARD_SIZE,
+                           value: str | None = None, label: str | None = None) -> str:
+    """
+    Load one event on a leaderboard page and return the rendered HTML.
+    
+    Selects the event in the category dropdown by value (or label), clicks
+    "Load Leaderboard" and waits for up to rows result rows. No rows within
+    the timeout means no results for the event.
+    """
+    # Don't wait for networkidle (it times out); wait for the event dropdown instead
+    await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+    await page.wait_for_selector(CATEGORY_SELECT, timeout=30000)
+    if value is not None:
+        await page.select_option(CATEGORY_SELECT, value=value)
+    else:
+        await page.select_option(CATEGORY_SELECT, label=label)
+    await page.click('button:has-text("Load Leaderboard")')
+    await wait_for_rows(page, LEADERBOARD_ROWS, rows)
+    return await page.content()
+
+
+def _text(element) -> str | None:
+    """Element text with whitespace collapsed, as the browser renders it"""
+    return ' '.join(element.get_text().split()) if element else None
+
+
+def category_names(html: str) -> list[str]:
+    """Event names in a rendered leaderboard page's category dropdown"""
+    soup = BeautifulSoup(html, 'html.parser')
+    names = [_text(option) for option in soup.select(f'{CATEGORY_SELECT} option')]
+    return [name for name in names if name and name != "Select Category"]
+
+
+def parse_leaderboard_rows(html: str) -> list[tuple[str | None, str | None, str | None]]:
+    """
+    (athlete, school, time) for every leaderboard result row, in page order.
+    
+    Athlete name and school are in column is-9 (a.name, span.team), time is
+    in column is-3. Missing fields are None.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    rows = []
+    for row in soup.select(LEADERBOARD_ROWS):
+        name_col = row.select_one('div.column.is-9.leaderboard-name.athlete')
+        link = name_col.select_one('a.name') if name_col else None
+        team = name_col.select_one('span.team') if name_col else None
+        value = row.select_one('div.column.is-3.leaderboard-value')
+        rows.append((_text(link), _text(team), _text(value)))
+    return rows
+
+
+def leaderboard_results(html: str, event_name: str, division: str, gender: str,
+                        top_n: int = LEADERBOARD_SIZE) -> list[dict]:
+    """
+    Harvest result dictionaries for one event from its rendered leaderboard page.
+    
+    Rank is the row position; rows without an athlete or time are skipped.
+    """
+    harvest_date = datetime.now().strftime("%Y-%m-%d")
+    results = []
+    for i, (athlete, school, time_str) in enumerate(parse_leaderboard_rows(html)[:top_n], 1):
+        if not athlete or not time_str:
+            continue
+        results.append({
+            'event': event_name,
+            'athlete': athlete,
+            'school': school or "Unknown",
+            'time': time_str,
+            'rank': i,
+            'division': division,
+            'gender': gender,
+            'harvest_date': harvest_date
+        })
+    return results
+
+
+def parse_event_page_rows(html: str) -> list[tuple[str, str | None, str | None, str]]:
+    """
+    (rank, athlete, school, time) for every result row of a direct event page.
+    
+    Column 0 is the rank, column 1 holds the athlete link then the school
+    link, column 3 the time. Rows with fewer than 4 columns are skipped.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    rows = []
+    for row in soup.select(EVENT_PAGE_ROWS):
+        cols = row.find_all('td')
+        if len(cols) < 4:
+            continue
+        links = cols[1].find_all('a')
+        rows.append((
+            _text(cols[0]),
+            _text(links[0]) if links else None,
+            _text(links[1]) if len(links) >= 2 else None,
+            _text(cols[3]),
+        ))
+    return rows
+
 
 def parse_leaderboard_html(html_file: Path) -> pd.DataFrame:
     """
@@ -98,12 +243,41 @@ def parse_leaderboard_html(html_file: Path) -> pd.DataFrame:
     return pd.DataFrame()
 
 
+def parse_snapshots(prefix: str = "https://azpreps365.com/"):
+    """Parse every recorded azpreps365 page and report throughput."""
+    store = SnapshotStore()
+    # Leaderboard pages are recorded as URL#event
+    keys = [key for key in store.keys(prefix) if '#' in key]
+    if not keys:
+        print(f"\n⚠️  No snapshots under {prefix}")
+        print("   Record some with: python3 harvest_division_complete.py --record")
+        return
+    
+    pages = [store.get(key) for key in keys]
+    start = time.perf_counter()
+    rows = sum(len(parse_leaderboard_rows(html)) for html in pages if html)
+    elapsed = time.perf_counter() - start
+    size = sum(len(html) for html in pages if html)
+    
+    print(f"\n🧪 Parsed {len(pages)} pages ({size / 1e6:.1f} MB, {rows} rows) in {elapsed:.3f}s "
+          f"({len(pages) / max(elapsed, 1e-9):.0f} pages/s)")
+
+
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description='Parse saved AzPreps365 leaderboard HTML')
+    parser.add_argument('--snapshots', action='store_true',
+                        help='Parse the recorded snapshots and report throughput')
+    args = parser.parse_args()
+    
     print("\n" + "="*70)
     print(" AzPreps365 HTML Parser")
     print("="*70)
     
+    if args.snapshots:
+        parse_snapshots()
+        return
+    
     # Find all saved HTML files
     harvest_dirs = list(Path("data/raw/azpreps365_harvest").glob("*/"))
     
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Content-addressed snapshots of harvested pages, for offline replay.
+
+With --record, a harvester saves every raw page it parses: the body goes
+to data/snapshots/objects/<sha256[:2]>/<sha256>.html (identical pages are
+stored once) and one line is appended to index.jsonl mapping the request
+key (the URL, or URL#event for pages driven by a dropdown) to the body's
+hash; the last line for a key wins. With --replay, the harvester
+reads the same keys from the store instead of the network, so its parsing
+can be re-run, benchmarked and compared at disk speed.
+
+Usage:
+    from snapshots import SnapshotStore
+    store = SnapshotStore()
+    store.record(url, html)
+    html = store.get(url)        # None if never recorded
+
+    python3 scripts/harvest/snapshots.py list [PREFIX]
+    python3 scripts/harvest/snapshots.py add KEY FILE   # e.g. a page saved by hand
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+
+SNAPSHOT_DIR = Path(__file__).parent.parent.parent / 'data' / 'snapshots'
+
+
+class SnapshotStore:
+    """Request key -> page body, stored by content hash"""
+
+    def __init__(self, root: Path = SNAPSHOT_DIR):
+        self.root = root
+        self.index_file = root / 'index.jsonl'
+        self._lock = threading.Lock()
+        self.index: dict[str, dict] = {}
+        # Stores written before the JSONL index kept one index.json
+        legacy = root / 'index.json'
+        if legacy.exists():
+            with open(legacy) as f:
+                self.index = json.load(f)
+        if self.index_file.exists():
+            with open(self.index_file) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # a line torn by a crash
+                    self.index[entry.pop('key')] = entry
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / 'objects' / digest[:2] / f'{digest}.html'
+
+    def record(self, key: str, text: str) -> str:
+        """Store a page under key; returns its content hash"""
+        data = text.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        with self._lock:
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix('.tmp')
+                tmp.write_bytes(data)
+                tmp.replace(path)
+            if self.index.get(key, {}).get('sha256') == digest:
+                return digest
+            entry = {'sha256': digest, 'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%S')}
+            self.index[key] = entry
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(self.index_file, 'a') as f:
+                f.write(json.dumps({'key': key, **entry}) + '\n')
+        return digest
+
+    def get(self, key: str) -> str | None:
+        """Recorded page for key, or None"""
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        path = self._object_path(entry['sha256'])
+        if not path.exists():
+            return None
+        return path.read_text(encoding='utf-8')
+
+    def keys(self, prefix: str = '') -> list[str]:
+        """Recorded keys starting with prefix, sorted"""
+        return sorted(key for key in self.index if key.startswith(prefix))
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect or add harvest snapshots')
+    sub = parser.add_subparsers(dest='command', required=True)
+    list_parser = sub.add_parser('list', help='List recorded keys')
+    list_parser.add_argument('prefix', nargs='?', default='')
+    add_parser = sub.add_parser('add', help='Record a saved page under a key')
+    add_parser.add_argument('key')
+    add_parser.add_argument('file', type=Path)
+    args = parser.parse_args()
+
+    store = SnapshotStore()
+    if args.command == 'list':
+        for key in store.keys(args.prefix):
+            entry = store.index[key]
+            print(f"{entry['sha256'][:12]}  {entry['recorded_at']}  {key}")
+        print(f"\n{len(store.keys(args.prefix))} snapshot(s) in {store.root}")
+    else:
+        digest = store.record(args.key, args.file.read_text(encoding='utf-8'))
+        print(f"✓ Recorded {args.file} as {args.key} ({digest[:12]})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+One place to decide which swimmer a name refers to.
+
+data/swimmer_aliases.json maps informal names to the preferred one
+("Nick Cusson" -> "Nicholas Cusson"). NameResolver compiles it once into:
+
+- the alias map itself (exact names),
+- a normalized-key map (lowercase letters only, see normalize_name), so
+  "nick cusson" and "Nick  Cusson" resolve the same way,
+- a (last name, first initial) index of preferred names, for matchers that
+  only have a last name and initial to go on. index_last_initial() builds
+  the same blocking over any list of names (detect_duplicate_swimmers.py).
+
+The compiled index is saved to data/cache/name_resolver.json and rebuilt
+only when the aliases file changes. Resolved names are memoized, and whole
+DataFrame columns are resolved by mapping their distinct values once.
+
+Usage:
+    from name_resolver import NameResolver
+    resolver = NameResolver.load()
+    resolver.canonical('Nick Cusson')          # 'Nicholas Cusson'
+    resolver.same_swimmer('Sam Stott', 'Samuel Stott')
+    df['Name'] = resolver.resolve_series(df['Name'])
+"""
+
+import json
+import re
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+ALIASES_FILE = PROJECT_ROOT / 'data' / 'swimmer_aliases.json'
+CACHE_FILE = PROJECT_ROOT / 'data' / 'cache' / 'name_resolver.json'
+
+INDEX_VERSION = 3
+
+# Resolvers already loaded in this process, keyed by aliases file
+_loaded: dict[str, tuple[int, 'NameResolver']] = {}
+
+
+def normalize_name(name: str) -> str:
+    """Normalize name for matching (lowercase, no spaces, no punctuation)"""
+    return re.sub(r'[^a-z]', '', str(name).lower())
+
+
+def last_initial(name: str) -> tuple[str, str]:
+    """('cusson', 'n') for 'Nicholas Cusson'; ('', '') for an empty name"""
+    parts = str(name).split()
+    if not parts:
+        return ('', '')
+    return (normalize_name(parts[-1]), normalize_name(parts[0])[:1])
+
+
+def index_last_initial(names) -> dict[str, list[int]]:
+    """Positions of names grouped by 'last initial' key ('cusson n')"""
+    index: dict[str, list[int]] = {}
+    for position, name in enumerate(names):
+        index.setdefault(' '.join(last_initial(name)), []).append(position)
+    return index
+
+
+class NameResolver:
+    """Alias, normalized-name and last-name/initial lookups, compiled once"""
+
+    def __init__(self, aliases: dict[str, str], by_key: dict[str, str] | None = None,
+                 by_last_initial: dict[str, list[str]] | None = None):
+        self.aliases = aliases
+        if by_key is None or by_last_initial is None:
+            by_key, by_last_initial = self.compile(aliases)
+        self.by_key = by_key
+        self.by_last_initial = by_last_initial
+        self._canonical: dict[str, str] = {}
+        self._keys: dict[str, str] = {}
+
+    @staticmethod
+    def compile(aliases: dict[str, str]) -> tuple[dict[str, str], dict[str, list[str]]]:
+        """Normalized-key map and last-name/initial index for an alias map"""
+        by_key = {}
+        for alias, preferred in aliases.items():
+            by_key.setdefault(normalize_name(alias), preferred)
+            by_key.setdefault(normalize_name(preferred), preferred)
+        preferred_names = list(dict.fromkeys(aliases.values()))
+        by_last_initial = {
+            key: [preferred_names[i] for i in positions]
+            for key, positions in index_last_initial(preferred_names).items()
+        }
+        return by_key, by_last_initial
+
+    @classmethod
+    def load(cls, aliases_file: Path = ALIASES_FILE, cache_file: Path = CACHE_FILE) -> 'NameResolver':
+        """Load the compiled index, recompiling it if the aliases file changed"""
+        mtime = aliases_file.stat().st_mtime_ns if aliases_file.exists() else 0
+
+        loaded = _loaded.get(str(aliases_file))
+        if loaded and loaded[0] == mtime:
+            return loaded[1]
+
+        if cache_file.exists():
+            with open(cache_file) as f:
+                cached = json.load(f)
+            if (cached.get('version') == INDEX_VERSION and cached.get('source') == str(aliases_file)
+                    and cached.get('mtime_ns') == mtime):
+                resolver = cls(cached['aliases'], cached['by_key'], cached['by_last_initial'])
+                _loaded[str(aliases_file)] = (mtime, resolver)
+                return resolver
+
+        aliases = {}
+        if aliases_file.exists():
+            with open(aliases_file) as f:
+                aliases = json.load(f)
+        resolver = cls(aliases)
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix('.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump({
+                'version': INDEX_VERSION,
+                'source': str(aliases_file),
+                'mtime_ns': mtime,
+                'aliases': resolver.aliases,
+                'by_key': resolver.by_key,
+                'by_last_initial': resolver.by_last_initial,
+            }, f, indent=2)
+        tmp.replace(cache_file)
+        _loaded[str(aliases_file)] = (mtime, resolver)
+        return resolver
+
+    def canonical(self, name: str) -> str:
+        """Preferred name for a swimmer (the name itself if it has no alias)"""
+        resolved = self._canonical.get(name)
+        if resolved is None:
+            resolved = self.aliases.get(name) or self.by_key.get(normalize_name(name), name)
+            self._canonical[name] = resolved
+        return resolved
+
+    def key(self, name: str) -> str:
+        """Identity key: the normalized preferred name"""
+        key = self._keys.get(name)
+        if key is None:
+            key = self._keys[name] = normalize_name(self.canonical(name))
+        return key
+
+    def same_swimmer(self, name: str, other: str) -> bool:
+        """True if both names resolve to the same swimmer"""
+        return self.key(name) == self.key(other)
+
+    def candidates(self, name: str) -> list[str]:
+        """Preferred names sharing a last name and first initial with name"""
+        return self.by_last_initial.get(' '.join(last_initial(self.canonical(name))), [])
+
+    def resolve_series(self, names):
+        """Preferred names for a pandas column, resolving each distinct value once"""
+        mapping = {name: self.canonical(name) for name in names.dropna().unique()}
+        return names.map(mapping)
@@ -9,167 +9,86 @@ Process Top 10 files with proper name aliasing and deduplication.
 5. Renumber rankings
 """
 
-import json
 import re
 from pathlib import Path
 from datetime import datetime
 
+from name_resolver import NameResolver
+from ranked_entries import entries_by_event, load_entries, write_entries
 
-def load_aliases(aliases_path: Path) -> dict:
-    """Load swimmer aliases from JSON file."""
-    if aliases_path.exists():
-        with open(aliases_path) as f:
-            return json.load(f)
-    return {}
 
+def parse_date(entry: dict) -> datetime:
+    """Entry date as datetime for comparison (datetime.max if unknown)."""
+    if entry['date']:
+        return datetime.fromisoformat(entry['date'])
+    return datetime.max
 
-def parse_time_to_seconds(time_str: str) -> float:
-    """Convert swim time string to seconds for comparison."""
-    time_str = time_str.strip()
-    if ':' in time_str:
-        parts = time_str.split(':')
-        if len(parts) == 2:
-            return float(parts[0]) * 60 + float(parts[1])
-        elif len(parts) == 3:
-            return float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2])
-    try:
-        return float(time_str)
-    except ValueError:
-        return float('inf')
 
-
-def parse_date(date_str: str) -> datetime:
-    """Parse date string to datetime for comparison."""
-    date_str = date_str.strip()
-    try:
-        return datetime.strptime(date_str, "%b %d, %Y")
-    except ValueError:
-        return datetime.max
-
-
-def process_top10_file(source_path: Path, dest_path: Path, aliases: dict) -> dict:
+def process_top10_file(source_path: Path, dest_path: Path, resolver: NameResolver) -> dict:
     """Process a single top10 file with aliasing and deduplication."""
+    stats = {'name_fixes': 0, 'duplicates_removed': 0, 'events_processed': 0}
+    
+    processed = {
+        event: process_entries(entries, resolver, stats)
+        for event, entries in entries_by_event(load_entries(source_path)).items()
+    }
+    stats['events_processed'] = len(processed)
+    
+    # Copy the page layout, replacing each table's rows with the processed entries
+    # (tables with no entries, e.g. '—' placeholders, are copied unchanged)
     with open(source_path, 'r') as f:
-        content = f.read()
+        lines = f.read().split('\n')
     
-    lines = content.split('\n')
     new_lines = []
-    stats = {'name_fixes': 0, 'duplicates_removed': 0, 'events_processed': 0}
-    
-    in_table = False
+    current_event = None
     table_rows = []
-    header_lines = []
+    in_table = False
     
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        
-        # Detect event header (### Event Name)
-        if line.startswith('### '):
-            # Process previous table if any
-            if table_rows:
-                processed = process_table(table_rows, aliases, stats)
-                new_lines.extend(header_lines)
-                new_lines.extend(processed)
-                stats['events_processed'] += 1
-            
-            # Start new event
-            new_lines.append(line)
-            table_rows = []
-            header_lines = []
-            in_table = False
-            i += 1
-            continue
-        
-        # Detect table header
-        if '| Rank |' in line:
+    for line in lines:
+        if line.strip().startswith('|'):
+            if not in_table or set(line.strip()) <= set('|-: '):
+                # Table header or separator
+                new_lines.append(line)
+            else:
+                table_rows.append(line)
             in_table = True
-            header_lines = [line]
-            i += 1
-            # Get separator line
-            if i < len(lines) and lines[i].strip().startswith('|--'):
-                header_lines.append(lines[i])
-                i += 1
             continue
         
-        # Detect table end
-        if in_table and (line.strip() == '' or line.startswith('#') or line.startswith('---')):
-            # Process table
-            if table_rows:
-                processed = process_table(table_rows, aliases, stats)
-                new_lines.extend(header_lines)
-                new_lines.extend(processed)
-                stats['events_processed'] += 1
+        # Table end
+        if in_table:
+            new_lines.extend(format_rows(processed.get(current_event)) or table_rows)
             table_rows = []
-            header_lines = []
             in_table = False
-            new_lines.append(line)
-            i += 1
-            continue
-        
-        # Collect table data rows
-        if in_table and line.strip().startswith('|') and '|' in line[1:]:
-            table_rows.append(line)
-            i += 1
-            continue
         
-        # Non-table line
+        heading = re.match(r'^#{2,3}\s+(.+)$', line)
+        if heading:
+            current_event = heading.group(1).strip()
         new_lines.append(line)
-        i += 1
     
-    # Process final table if any
-    if table_rows:
-        processed = process_table(table_rows, aliases, stats)
-        new_lines.extend(header_lines)
-        new_lines.extend(processed)
-        stats['events_processed'] += 1
+    if in_table:
+        new_lines.extend(format_rows(processed.get(current_event)) or table_rows)
     
     # Write output
     dest_path.parent.mkdir(parents=True, exist_ok=True)
     with open(dest_path, 'w') as f:
         f.write('\n'.join(new_lines))
+    write_entries(dest_path, [entry for entries in processed.values() for entry in entries])
     
     return stats
 
 
-def process_table(rows: list, aliases: dict, stats: dict) -> list:
-    """Process table rows: apply aliases, deduplicate, keep top 10, renumber."""
-    if not rows:
-        return []
-    
-    # Parse rows
+def process_entries(entries: list, resolver: NameResolver, stats: dict) -> list:
+    """Process one event's entries: apply aliases, deduplicate, keep top 10, renumber."""
     parsed = []
-    for row in rows:
-        parts = [p.strip() for p in row.split('|')]
-        if len(parts) >= 6:
-            # parts: ['', rank, time, athlete, year, date, meet, '']
-            rank = parts[1]
-            time = parts[2]
-            athlete = parts[3]
-            year = parts[4]
-            date = parts[5]
-            meet = parts[6] if len(parts) > 6 else ""
-            
-            # Apply alias
-            original_name = athlete
-            if athlete in aliases:
-                athlete = aliases[athlete]
-                if athlete != original_name:
-                    stats['name_fixes'] += 1
-            
-            parsed.append({
-                'time': time,
-                'time_seconds': parse_time_to_seconds(time),
-                'athlete': athlete,
-                'original_athlete': original_name,
-                'year': year,
-                'date': date,
-                'date_parsed': parse_date(date),
-                'meet': meet
-            })
+    for entry in entries:
+        # Apply alias
+        athlete = resolver.canonical(entry['athlete'])
+        if athlete != entry['athlete']:
+            stats['name_fixes'] += 1
+        parsed.append({**entry, 'athlete': athlete})
     
     # Sort by time (fastest first), then by date (earliest first for ties)
-    parsed.sort(key=lambda x: (x['time_seconds'], x['date_parsed']))
+    parsed.sort(key=lambda x: (x['time_hundredths'], parse_date(x)))
     
     # Deduplicate by athlete (keep first = fastest)
     seen_athletes = set()
@@ -181,17 +100,19 @@ def process_table(rows: list, aliases: dict, stats: dict) -> list:
         else:
             stats['duplicates_removed'] += 1
     
-    # Keep top 10
-    top10 = deduped[:10]
-    
-    # Renumber and format
-    result = []
-    for rank, entry in enumerate(top10, 1):
-        result.append(
-            f"| {rank} | {entry['time']} | {entry['athlete']} | {entry['year']} | {entry['date']} | {entry['meet']} |"
-        )
-    
-    return result
+    # Keep top 10 and renumber
+    return [{**entry, 'rank': rank} for rank, entry in enumerate(deduped[:10], 1)]
+
+
+def format_rows(entries: list | None) -> list:
+    """Format entries as markdown table rows (record holders in bold)."""
+    rows = []
+    for entry in entries or []:
+        cells = [entry['rank'], entry['time'], entry['athlete'], entry['year'], entry['date_display'], entry['meet']]
+        if entry['is_record']:
+            cells = [f"**{cell}**" for cell in cells]
+        rows.append('| ' + ' | '.join(str(cell) for cell in cells) + ' |')
+    return rows
 
 
 def main():
@@ -205,8 +126,8 @@ def main():
     print("=" * 70)
     
     # Load aliases
-    aliases = load_aliases(aliases_path)
-    print(f"\n📋 Loaded {len(aliases)} swimmer aliases")
+    resolver = NameResolver.load(aliases_path)
+    print(f"\n📋 Loaded {len(resolver.aliases)} swimmer aliases")
     
     # Find all top10 files
     top10_files = sorted(source_dir.glob("top10*.md"))
@@ -216,7 +137,7 @@ def main():
     
     for source_path in top10_files:
         dest_path = dest_dir / source_path.name
-        stats = process_top10_file(source_path, dest_path, aliases)
+        stats = process_top10_file(source_path, dest_path, resolver)
         
         if stats['name_fixes'] > 0 or stats['duplicates_removed'] > 0:
             print(f"  {source_path.name}:")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Ranked entries: the machine-readable side of the generated record tables.
+
+Every table the generators write to markdown (top 10 lists, records by
+grade) is also written as JSON Lines next to the markdown file, one entry
+per table row:
+
+    records/top10-boys-2024-25.md  ->  records/top10-boys-2024-25.jsonl
+
+    {"event": "50 Freestyle", "event_code": "50-free", "rank": 1,
+     "grade_group": null, "time": "21.99", "time_hundredths": 2199,
+     "athlete": "Nicholas Cusson", "year": "SO", "date": "2021-10-23",
+     "date_display": "Oct 23, 2021", "meet": "...", "is_record": false}
+
+rank is set for top 10 lists and grade_group ("Freshman" ... "Open") for
+records files. is_record marks rows shown in bold (record holders). date
+is ISO, or None when only a partial date is known ("Nov 2007");
+date_display is the text shown in the table.
+
+Downstream scripts read entries with load_entries() instead of parsing the
+markdown. Markdown without an up-to-date artifact (the hand-built historical
+seasons, or a file edited after it was generated) is read once with
+read_markdown_entries() and its artifact saved.
+
+Usage:
+    python3 scripts/ranked_entries.py records data/records   # backfill artifacts
+
+    from ranked_entries import load_entries
+    entries = load_entries(Path('records/top10-boys-2024-25.md'))
+"""
+
+import json
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from time_parser import parse_hundredths
+
+EVENT_CODES = {
+    "50 Freestyle": "50-free",
+    "100 Freestyle": "100-free",
+    "200 Freestyle": "200-free",
+    "500 Freestyle": "500-free",
+    "100 Backstroke": "100-back",
+    "100 Breaststroke": "100-breast",
+    "100 Butterfly": "100-fly",
+    "200 Individual Medley": "200-im",
+}
+
+GRADE_YEARS = {"Freshman": "FR", "Sophomore": "SO", "Junior": "JR", "Senior": "SR"}
+
+DATE_FORMAT = "%b %d, %Y"
+
+
+def entries_path(md_path: Path) -> Path:
+    """Artifact file for a markdown table file"""
+    return md_path.with_suffix('.jsonl')
+
+
+def make_entry(event: str, time: str, athlete: str, date_display: str, meet: str,
+               rank: int | None = None, grade_group: str | None = None, year: str = '',
+               is_record: bool = False) -> dict:
+    """Build one entry from the values shown in a table row"""
+    try:
+        date = datetime.strptime(date_display.strip(), DATE_FORMAT).date().isoformat()
+    except ValueError:
+        date = None
+    return {
+        'event': event,
+        'event_code': EVENT_CODES.get(event),
+        'rank': rank,
+        'grade_group': grade_group,
+        'time': time,
+        'time_hundredths': parse_hundredths(time),
+        'athlete': athlete,
+        'year': year or GRADE_YEARS.get(grade_group, ''),
+        'date': date,
+        'date_display': date_display,
+        'meet': meet,
+        'is_record': is_record,
+    }
+
+
+def write_entries(md_path: Path, entries: list[dict]):
+    """Write the artifact for a markdown file (call after writing the markdown)"""
+    path = entries_path(md_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.jsonl.tmp')
+    with open(tmp, 'w') as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + '\n')
+    tmp.replace(path)
+
+
+def read_markdown_entries(md_path: Path) -> list[dict]:
+    """
+    Read entries from a markdown file's tables.
+
+    Columns are located by the table header (Rank/Grade, Time, Athlete,
+    Year, Date, Meet). Bold rows are flagged is_record and placeholder
+    rows ('—') are skipped.
+    """
+    entries = []
+    event = None
+    columns = None
+
+    with open(md_path) as f:
+        for line in f:
+            line = line.strip()
+            heading = re.match(r'^#{2,3}\s+(.+)$', line)
+            if heading:
+                event = heading.group(1).strip()
+                columns = None
+                continue
+            if not line.startswith('|'):
+                columns = None
+                continue
+
+            cells = [c.strip().replace('**', '') for c in line.strip('|').split('|')]
+            if columns is None:
+                columns = {name.lower(): i for i, name in enumerate(cells)}
+                continue
+            if set(line) <= set('|-: '):
+                continue
+
+            def cell(name):
+                i = columns.get(name)
+                return cells[i] if i is not None and i < len(cells) else ''
+
+            time, athlete = cell('time'), cell('athlete')
+            if not time or not athlete or athlete == '—':
+                continue
+
+            rank = cell('rank')
+            grade_group = cell('grade') or None
+            entries.append(make_entry(
+                event, time, athlete, cell('date'), cell('meet'),
+                rank=int(rank) if rank.isdigit() else None,
+                grade_group=grade_group,
+                year=cell('year'),
+                is_record='**' in line,
+            ))
+
+    return entries
+
+
+def load_entries(md_path: Path) -> list[dict]:
+    """
+    Entries for a markdown table file, from its artifact.
+
+    Falls back to reading the markdown (and saving the artifact) when the
+    artifact is missing or older than the markdown. Returns [] if neither
+    exists.
+    """
+    path = entries_path(md_path)
+    md_exists = md_path.exists()
+    if path.exists() and (not md_exists or path.stat().st_mtime_ns >= md_path.stat().st_mtime_ns):
+        with open(path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+    if not md_exists:
+        return []
+
+    entries = read_markdown_entries(md_path)
+    write_entries(md_path, entries)
+    return entries
+
+
+def entries_by_event(entries: list[dict]) -> dict[str, list[dict]]:
+    """Group entries by event name, keeping table order"""
+    events: dict[str, list[dict]] = {}
+    for entry in entries:
+        events.setdefault(entry['event'], []).append(entry)
+    return events
+
+
+def main():
+    dirs = [Path(d) for d in sys.argv[1:]] or [Path('records'), Path('data/records')]
+    total = 0
+    for directory in dirs:
+        for md_path in sorted(directory.glob('*.md')):
+            if md_path.name.startswith(('top10-', 'records')):
+                total += len(load_entries(md_path))
+    print(f"✓ {total} ranked entries available in {', '.join(str(d) for d in dirs)}")
+
+
+if __name__ == '__main__':
+    main()
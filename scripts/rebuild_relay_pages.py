@@ -4,22 +4,24 @@ Rebuild relay records pages with expandable card pattern.
 - Top 10 only (not 15)
 - First row: Rank | Time | Last names + Date (clickable)
 - Expanded: 4 swimmer lines with splits, then meet line
+
+Pages are reused from the render cache (render_cache.py) while the relay
+records markdown, the season splits files it draws on and the template are
+unchanged, so an unchanged page is not rewritten on every website build.
 """
 
-import json
 import re
 from pathlib import Path
 
+from relay_splits import INDEX_SOURCES, SPLITS_DIR, SplitIndex, load_splits, season_of
+from render_cache import RenderCache, write_page
+from time_parser import parse_hundredths, format_hundredths_as_seconds, NO_TIME_HUNDREDTHS
+
 # Get project root (parent of scripts/ directory)
 PROJECT_ROOT = Path(__file__).parent.parent
 
-def load_splits():
-    """Load all relay splits from harvested data"""
-    try:
-        with open(PROJECT_ROOT / 'data/historical_splits/all_relay_splits.json', 'r') as f:
-            return json.load(f)
-    except:
-        return {'boys': [], 'girls': []}
+# Bump when the page template changes in a way the render cache can't see
+TEMPLATE_VERSION = 1
 
 def parse_relay_markdown(filepath):
     """Parse relay records from markdown file"""
@@ -64,53 +66,10 @@ def get_last_name(full_name):
     parts = full_name.strip().split()
     return parts[-1] if parts else full_name
 
-def find_splits_for_relay(splits_data, gender, event_type, swimmers, total_time):
-    """Find matching splits for a relay based on swimmers and time"""
-    # Normalize swimmer names for matching
+def find_splits_for_relay(splits_index, gender, event_type, swimmers, total_time):
+    """Find matching splits for a relay based on swimmers (at least 3 must match)"""
     relay_swimmers = [s.strip() for s in swimmers.split(',')]
-    relay_set = set(s.lower().strip() for s in relay_swimmers)
-    
-    # Parse total time to seconds for comparison
-    try:
-        time_parts = total_time.replace(':', '.').split('.')
-        if len(time_parts) == 3:
-            total_secs = int(time_parts[0]) * 60 + float(f"{time_parts[1]}.{time_parts[2]}")
-        else:
-            total_secs = float(total_time)
-    except:
-        total_secs = 0
-    
-    best_match = None
-    best_score = 0
-    
-    for split_entry in splits_data.get(gender, []):
-        # Check event type - now using full event names
-        entry_type = split_entry.get('type', '')
-        num_splits = len(split_entry.get('splits', []))
-        
-        # Match based on event type (full names now)
-        if event_type == '200 Medley Relay' and entry_type != '200 Medley Relay':
-            continue
-        if event_type == '200 Free Relay' and entry_type != '200 Free Relay':
-            continue
-        if event_type == '400 Free Relay' and entry_type != '400 Free Relay':
-            continue
-        
-        # Match swimmers
-        entry_swimmers = set()
-        for s in split_entry.get('swimmers', []):
-            # Remove grade suffix like " - Jr."
-            name = re.sub(r'\s*-\s*(Fr|So|Jr|Sr)\.$', '', s, flags=re.IGNORECASE)
-            entry_swimmers.add(name.lower().strip())
-        
-        # Check overlap
-        matching = len(relay_set & entry_swimmers)
-        if matching >= 3:  # At least 3 swimmers match
-            if matching > best_score:
-                best_score = matching
-                best_match = split_entry
-    
-    return best_match
+    return splits_index.find(gender, event_type, relay_swimmers)
 
 def format_split_time(split_str):
     """Format split time for display"""
@@ -133,16 +92,15 @@ def strip_leading_zero(time_str):
         return time_str[1:]
     return time_str
 
-def extract_class_from_splits(splits_match, swimmer_name):
+def extract_class_from_splits(splits_match, swimmer_name, splits_index):
     """Extract class (FR/SO/JR/SR) from splits data for a swimmer"""
     if not splits_match:
         return ''
     
-    swimmer_lower = swimmer_name.lower().strip()
-    for full_name in splits_match.get('swimmers', []):
+    swimmer_key = splits_index.key(swimmer_name)
+    for full_name in splits_match.swimmers:
         # Check if this swimmer matches
-        name_part = re.sub(r'\s*-\s*(Fr|So|Jr|Sr)\.?$', '', full_name, flags=re.IGNORECASE)
-        if name_part.lower().strip() == swimmer_lower:
+        if splits_index.key(full_name) == swimmer_key:
             # Extract class
             match = re.search(r'-\s*(Fr|So|Jr|Sr)\.?$', full_name, flags=re.IGNORECASE)
             if match:
@@ -171,7 +129,7 @@ def get_class_badge_html(class_abbr):
     css_class = class_map.get(class_abbr, '')
     return f'<span class="grade-badge {css_class}">{class_abbr}</span>'
 
-def generate_relay_row_html(relay, gender, splits_data, event_type, row_num):
+def generate_relay_row_html(relay, gender, splits_index, event_type, row_num):
     """Generate HTML for a single relay table row"""
     rank = relay['rank']
     time = strip_leading_zero(relay['time'])
@@ -183,7 +141,7 @@ def generate_relay_row_html(relay, gender, splits_data, event_type, row_num):
     last_names = ', '.join(get_last_name(s) for s in swimmers)
     
     # Find splits
-    splits_match = find_splits_for_relay(splits_data, gender, event_type, participants, time)
+    splits_match = find_splits_for_relay(splits_index, gender, event_type, participants, time)
     
     # Build expanded content
     expanded_html = '<div class="relay-expanded-rows">'
@@ -192,21 +150,19 @@ def generate_relay_row_html(relay, gender, splits_data, event_type, row_num):
         split_time = ''
         
         if splits_match:
-            splits = splits_match.get('splits', [])
+            splits = splits_match.splits
             if event_type == '400 Free Relay' and len(splits) == 8:
                 idx = i * 2
                 if idx + 1 < len(splits):
-                    try:
-                        t1 = float(splits[idx].replace('00:', ''))
-                        t2 = float(splits[idx + 1].replace('00:', ''))
-                        split_time = f"{t1 + t2:.2f}"
-                    except:
-                        pass
+                    t1 = parse_hundredths(splits[idx])
+                    t2 = parse_hundredths(splits[idx + 1])
+                    if NO_TIME_HUNDREDTHS not in (t1, t2):
+                        split_time = format_hundredths_as_seconds(t1 + t2)
             elif i < len(splits):
                 split_time = format_split_time(splits[i])
         
         # Get class badge if available
-        swimmer_class = extract_class_from_splits(splits_match, swimmer)
+        swimmer_class = extract_class_from_splits(splits_match, swimmer, splits_index)
         class_badge = get_class_badge_html(swimmer_class)
         
         expanded_html += f'<div class="relay-split-row">'
@@ -232,7 +188,7 @@ def generate_relay_row_html(relay, gender, splits_data, event_type, row_num):
     
     return html
 
-def generate_relay_section_html(event_name, relays, gender, splits_data):
+def generate_relay_section_html(event_name, relays, gender, splits_index):
     """Generate HTML table for an event section"""
     event_id = event_name.lower().replace(' ', '-')
     
@@ -243,14 +199,14 @@ def generate_relay_section_html(event_name, relays, gender, splits_data):
     html += '<tbody>\n'
     
     for i, relay in enumerate(relays[:10]):  # Top 10
-        html += generate_relay_row_html(relay, gender, splits_data, event_name, i)
+        html += generate_relay_row_html(relay, gender, splits_index, event_name, i)
     
     html += '</tbody></table>\n'
     html += '</div>\n'
     
     return html
 
-def generate_full_page_html(gender, events, splits_data):
+def generate_full_page_html(gender, events, splits_index):
     """Generate the full HTML page"""
     gender_title = gender.title()
     other_gender = 'girls' if gender == 'boys' else 'boys'
@@ -259,7 +215,7 @@ def generate_full_page_html(gender, events, splits_data):
     sections_html = ''
     for event_name in ['200 Medley Relay', '200 Free Relay', '400 Free Relay']:
         if event_name in events and events[event_name]:
-            sections_html += generate_relay_section_html(event_name, events[event_name], gender, splits_data)
+            sections_html += generate_relay_section_html(event_name, events[event_name], gender, splits_index)
     
     html = f'''<!DOCTYPE html>
 <html lang="en">
@@ -422,9 +378,8 @@ def generate_full_page_html(gender, events, splits_data):
 def main():
     print("Rebuilding relay pages with expandable cards...")
     
-    splits_data = load_splits()
-    print(f"  Loaded {len(splits_data.get('boys', []))} boys splits, {len(splits_data.get('girls', []))} girls splits")
-    
+    cache = RenderCache(TEMPLATE_VERSION, 'relay_pages')
+    rebuilt = 0
     for gender in ['boys', 'girls']:
         md_path = PROJECT_ROOT / f'records/relay-records-{gender}.md'
         html_path = PROJECT_ROOT / f'docs/records/{gender}-relays.html'
@@ -435,14 +390,31 @@ def main():
         for event, relays in events.items():
             print(f"  {event}: {len(relays)} relays (showing top 10)")
         
-        html = generate_full_page_html(gender, events, splits_data)
+        # Only the seasons the listed relays were swum in
+        seasons = {season_of(relay['date']) for relays in events.values() for relay in relays}
+        key = cache.key([
+            md_path, Path(__file__), *INDEX_SOURCES,
+            *(SPLITS_DIR / f'splits_{season}.json' for season in seasons - {None}),
+        ])
+        if cache.is_fresh(html_path, key):
+            print(f"  ✓ {html_path} unchanged")
+            continue
+        
+        splits_data = load_splits(genders=[gender], seasons=seasons)
+        print(f"  Loaded {len(splits_data[gender])} {gender} splits from {len(seasons - {None})} seasons")
+        splits_index = SplitIndex(splits_data)
+        
+        html = generate_full_page_html(gender, events, splits_index)
         
-        with open(html_path, 'w') as f:
-            f.write(html)
+        if write_page(html_path, html):
+            rebuilt += 1
+        cache.record(html_path, key)
         
         print(f"  ✓ Generated {html_path}")
     
-    print("\n✅ Relay pages rebuilt with expandable card pattern!")
+    cache.save()
+    
+    print(f"\n✅ Relay pages rebuilt with expandable card pattern ({rebuilt} rebuilt, {2 - rebuilt} reused)")
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Loading and indexed lookup of harvested relay splits.
+
+Splits are stored one file per season (data/historical_splits/splits_YY-YY.json,
+each holding boys and girls). load_splits() reads only the seasons and
+genders asked for, memoizes each season file for the life of the process,
+and returns compact RelaySplit records rather than nested dicts.
+
+Relay rows on the records pages are matched to split entries by
+swimmers: an entry matches when at least 3 of its swimmers swam the relay.
+Instead of scanning every split entry for every relay row, SplitIndex is
+built once per run with grade suffixes (" - Jr.") stripped and names
+resolved (name_resolver.py) ahead of time, plus an inverted index from
+(gender, relay type, swimmer) to split entries. A lookup only counts
+overlaps for entries that share at least one swimmer.
+
+Usage:
+    from relay_splits import SplitIndex, load_splits
+    index = SplitIndex(load_splits(genders=['boys'], seasons=['24-25', '25-26']))
+    entry = index.find('boys', '200 Medley Relay', ['Wade Olsson', ...])
+"""
+
+import json
+import re
+from collections import Counter
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+import name_resolver
+import time_parser
+from name_resolver import ALIASES_FILE, NameResolver
+from time_parser import parse_hundredths, NO_TIME_HUNDREDTHS
+
+SPLITS_DIR = Path(__file__).parent.parent / 'data' / 'historical_splits'
+
+# Files (besides the splits themselves) that a page rendered through
+# SplitIndex depends on, for render cache keys
+INDEX_SOURCES = (Path(__file__), Path(name_resolver.__file__), Path(time_parser.__file__), ALIASES_FILE)
+
+GENDERS = ('boys', 'girls')
+
+RELAY_TYPES = ('200 Medley Relay', '200 Free Relay', '400 Free Relay')
+
+MIN_MATCHING_SWIMMERS = 3
+
+_GRADE_SUFFIX_RE = re.compile(r'\s*-\s*(Fr|So|Jr|Sr)\.$', re.IGNORECASE)
+
+
+def strip_grade_suffix(name: str) -> str:
+    """'Andrew Lam - Jr.' -> 'Andrew Lam'"""
+    return _GRADE_SUFFIX_RE.sub('', name).strip()
+
+
+def normalize_swimmer(name: str, resolver: NameResolver) -> str:
+    """Key used to match relay swimmers to split entries (aliases resolved)"""
+    return resolver.key(strip_grade_suffix(name))
+
+
+class RelaySplit:
+    """One relay's swimmers and leg splits"""
+
+    __slots__ = ('type', 'year', 'gender', 'swimmers', 'splits',
+                 'split_hundredths', 'total_hundredths', 'team')
+
+    def __init__(self, type: str, year: str, gender: str, swimmers: tuple[str, ...],
+                 splits: tuple[str, ...], split_hundredths: tuple[int, ...],
+                 total_hundredths: int, team: str = ''):
+        self.type = type
+        self.year = year
+        self.gender = gender
+        self.swimmers = swimmers
+        self.splits = splits
+        self.split_hundredths = split_hundredths
+        self.total_hundredths = total_hundredths
+        self.team = team
+
+    @classmethod
+    def from_dict(cls, data: dict, gender: str) -> 'RelaySplit':
+        """Build from a season file entry (hundredths parsed if missing)"""
+        splits = tuple(data.get('splits', []))
+        hundredths = tuple(data.get('split_hundredths') or (parse_hundredths(s) for s in splits))
+        total = data.get('total_hundredths')
+        if total is None:
+            total = sum(h for h in hundredths if h != NO_TIME_HUNDREDTHS)
+        return cls(data.get('type', ''), data.get('year', ''), data.get('gender', gender),
+                   tuple(data.get('swimmers', [])), splits, hundredths, total,
+                   data.get('team', ''))
+
+    def __repr__(self):
+        return f'RelaySplit({self.gender} {self.year} {self.type}: {", ".join(self.swimmers)})'
+
+
+def season_of(date_display: str) -> str | None:
+    """'Oct 24, 2025' -> '25-26' (Aug 1 cutoff); None if not a full date"""
+    try:
+        date = datetime.strptime(date_display.strip(), '%b %d, %Y')
+    except ValueError:
+        return None
+    start = date.year if date.month >= 8 else date.year - 1
+    return f'{start % 100:02d}-{(start + 1) % 100:02d}'
+
+
+def available_seasons(splits_dir: Path = SPLITS_DIR) -> list[str]:
+    """Seasons with a splits file, oldest first"""
+    return sorted(p.stem.removeprefix('splits_') for p in splits_dir.glob('splits_*.json'))
+
+
+@lru_cache(maxsize=None)
+def _load_season(splits_dir: Path, season: str) -> dict[str, tuple[RelaySplit, ...]]:
+    """One season file as {gender: records}, read once per process"""
+    path = splits_dir / f'splits_{season}.json'
+    if not path.exists():
+        return {gender: () for gender in GENDERS}
+    with open(path) as f:
+        data = json.load(f)
+    return {
+        gender: tuple(RelaySplit.from_dict(entry, gender) for entry in data.get(gender, []))
+        for gender in GENDERS
+    }
+
+
+def load_splits(genders=None, seasons=None, splits_dir: Path = SPLITS_DIR) -> dict[str, list[RelaySplit]]:
+    """
+    Relay splits by gender, oldest season first.
+
+    Args:
+        genders: Optional list of genders ('boys', 'girls') to load
+        seasons: Optional seasons ('24-25') to load; None loads every season
+        splits_dir: Directory holding the splits_YY-YY.json files
+    """
+    genders = list(genders) if genders is not None else list(GENDERS)
+    wanted = available_seasons(splits_dir)
+    if seasons is not None:
+        wanted = [s for s in wanted if s in set(seasons)]
+
+    splits = {gender: [] for gender in genders}
+    for season in wanted:
+        partition = _load_season(splits_dir, season)
+        for gender in genders:
+            splits[gender].extend(partition.get(gender, ()))
+    return splits
+
+
+class SplitIndex:
+    """Split entries indexed by gender, relay type and swimmer"""
+
+    def __init__(self, splits_data: dict[str, list[RelaySplit]],
+                 resolver: NameResolver | None = None):
+        self.resolver = resolver or NameResolver.load()
+        self.entries: dict[str, list[RelaySplit]] = {}
+        self.types: dict[str, set[str]] = {}
+        self.postings: dict[tuple[str, str, str], list[int]] = {}
+
+        for gender, entries in splits_data.items():
+            self.entries[gender] = entries
+            self.types[gender] = set()
+            for position, entry in enumerate(entries):
+                entry_type = entry.type
+                self.types[gender].add(entry_type)
+                for name in {self.key(s) for s in entry.swimmers}:
+                    self.postings.setdefault((gender, entry_type, name), []).append(position)
+
+    def key(self, name: str) -> str:
+        """Match key for a relay swimmer's name"""
+        return normalize_swimmer(name, self.resolver)
+
+    def find(self, gender: str, event_type: str, swimmers,
+             min_matching: int = MIN_MATCHING_SWIMMERS) -> RelaySplit | None:
+        """
+        Split entry sharing the most swimmers with a relay (at least min_matching).
+
+        event_type limits candidates to that relay type; an unrecognized
+        type searches every type. Ties go to the earliest entry.
+        """
+        names = {self.key(s) for s in swimmers}
+        types = [event_type] if event_type in RELAY_TYPES else self.types.get(gender, ())
+
+        overlap = Counter()
+        for entry_type in types:
+            for name in names:
+                overlap.update(self.postings.get((gender, entry_type, name), ()))
+
+        best = None
+        for position, matching in overlap.items():
+            if matching < min_matching:
+                continue
+            if best is None or (-matching, position) < (-best[1], best[0]):
+                best = (position, matching)
+        return self.entries[gender][best[0]] if best else None
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Render cache for the generated website pages.
+
+Each page is keyed on the content hash of its source files (markdown,
+JSON, the generating script) plus a template version. When the key and the
+page on disk both match the last render, the page is reused without
+rendering or touching the file. A page that is re-rendered but comes out
+identical is not rewritten either, so unchanged pages keep their mtime and
+are not redeployed by GitHub Pages.
+
+Each generator keeps its own cache file (data/cache/render_cache_<name>.json):
+generate_website.py runs rebuild_relay_pages.py and generate_annual_pages.py
+alongside itself, and a shared file would lose whichever process saved first.
+
+Usage:
+    cache = RenderCache(TEMPLATE_VERSION, 'website')
+    key = cache.key([md_file, Path(__file__)])
+    if not cache.is_fresh(output_file, key):
+        write_page(output_file, html)
+        cache.record(output_file, key)
+    cache.save()
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).parent.parent / 'data' / 'cache'
+
+
+def _hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_page(output_file: Path, html: str) -> bool:
+    """
+    Write a page atomically (temp file + rename), unless it is unchanged.
+
+    Returns True if the file was written, False if it already had this content.
+    """
+    data = html.encode()
+    if output_file.exists() and output_file.read_bytes() == data:
+        return False
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = output_file.with_name(f'.{output_file.name}.{os.getpid()}.tmp')
+    tmp_file.write_bytes(data)
+    tmp_file.replace(output_file)
+    return True
+
+
+class RenderCache:
+    """Source-hash → page cache, one entry per output file"""
+
+    def __init__(self, template_version: int, name: str, cache_dir: Path = CACHE_DIR):
+        self.template_version = template_version
+        self.cache_file = cache_dir / f'render_cache_{name}.json'
+        self.entries: dict[str, dict] = {}
+        if self.cache_file.exists():
+            with open(self.cache_file) as f:
+                self.entries = json.load(f)
+
+    def key(self, sources) -> str:
+        """Hash of the template version and every source file's content"""
+        digest = hashlib.sha256(f'template:{self.template_version}'.encode())
+        for source in sorted(str(s) for s in sources):
+            path = Path(source)
+            content = path.read_bytes() if path.exists() else b''
+            digest.update(f'\0{source}\0{_hash_bytes(content)}'.encode())
+        return digest.hexdigest()
+
+    def is_fresh(self, output_file: Path, key: str) -> bool:
+        """True if the page was rendered from this key and is unchanged on disk"""
+        entry = self.entries.get(str(output_file))
+        if not entry or entry['key'] != key or not output_file.exists():
+            return False
+        return _hash_bytes(output_file.read_bytes()) == entry['output']
+
+    def record(self, output_file: Path, key: str):
+        """Remember the key a page was rendered from"""
+        self.entries[str(output_file)] = {
+            'key': key,
+            'output': _hash_bytes(output_file.read_bytes()),
+        }
+
+    def save(self):
+        """Write the cache atomically"""
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_file.with_name(f'.{self.cache_file.name}.{os.getpid()}.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        tmp.replace(self.cache_file)
@@ -9,47 +9,358 @@ Run this script at the end of each season to:
 4. Update annual summary with formatted content
 5. Regenerate website
 
+The steps form a build graph: each step declares the files it reads and
+writes. A step is skipped when the content of its inputs (and its command)
+is unchanged since its last successful run and its outputs are untouched,
+so a mid-season re-run only redoes the steps downstream of what changed.
+Steps whose dependencies are done run concurrently (e.g. individual
+records, relay records and season top 10s). The swim store and swim
+database are brought up to date by their own steps first, so the steps
+reading them in parallel find nothing left to rebuild.
+
+Build state (file hashes and per-step input/output hashes) is kept in
+data/cache/build_state.json.
+
 Usage:
     python run_season_update.py --season 2025-26 --state-pdf path/to/state.pdf
-    
+    python run_season_update.py --season 2025-26 --state-pdf state.pdf --skip-harvest
+    python run_season_update.py --season 2025-26 --state-pdf state.pdf --force
+
 For next year:
     python run_season_update.py --season 2026-27 --state-pdf ~/Downloads/d3-state-2026.pdf
 """
 
 import argparse
+import hashlib
+import json
+import os
 import subprocess
 import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
-from datetime import datetime
-
-def run_command(cmd, description):
-    """Run a command and print status"""
-    print(f"\n{'='*70}")
-    print(f"🔄 {description}")
-    print(f"{'='*70}")
-    print(f"Running: {cmd}\n")
-    
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-    
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SCRIPTS_DIR = Path(__file__).parent
+TEAM_DIR = Path('/Users/aaryn/swimming/teams/tanque-verde')
+STATE_FILE = PROJECT_ROOT / 'data' / 'cache' / 'build_state.json'
+
+STATE_VERSION = 1
+
+# Modules shared by the generators; changing one re-runs every step that uses it
+SHARED_MODULES = [
+    'scripts/time_parser.py',
+    'scripts/time_formatter.py',
+    'scripts/swim_store.py',
+    'scripts/best_times.py',
+    'scripts/ranked_entries.py',
+]
+
+# Sources of the swim database (swim_db.py) the analysis steps query
+DB_INPUTS = ['scripts/swim_db.py', 'data/raw/swimmers/*.csv', 'data/all_relays.json',
+             'data/historical_splits/*.json', 'data/class_records_history.json',
+             'data/relay_leadoff_times.json']
+
+_print_lock = threading.Lock()
+
+
+@dataclass
+class Step:
+    """One build step: a command plus the files it reads and writes"""
+    name: str
+    description: str
+    cmd: list[str]
+    inputs: list[str] = field(default_factory=list)   # globs relative to PROJECT_ROOT
+    outputs: list[str] = field(default_factory=list)  # globs relative to PROJECT_ROOT
+    deps: list[str] = field(default_factory=list)
+    cwd: Path | None = None
+    harvest: bool = False  # fetches remote data, so always runs unless --skip-harvest
+
+
+class FileHashes:
+    """Content hashes of project files, reused while mtime and size are unchanged"""
+
+    def __init__(self, known: dict):
+        self.known = known
+        self.lock = threading.Lock()
+
+    def file_hash(self, path: Path) -> str:
+        stat = path.stat()
+        key = str(path.relative_to(PROJECT_ROOT)) if path.is_relative_to(PROJECT_ROOT) else str(path)
+        with self.lock:
+            entry = self.known.get(key)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        with self.lock:
+            self.known[key] = [stat.st_mtime_ns, stat.st_size, digest.hexdigest()]
+        return digest.hexdigest()
+
+    def files_hash(self, patterns: list[str], extra: str = '') -> str:
+        """Combined hash of every file matching the globs (plus an extra string)"""
+        digest = hashlib.sha256(extra.encode())
+        for pattern in patterns:
+            path = Path(pattern)
+            if path.is_absolute():
+                matches = [path] if path.exists() else []
+            else:
+                matches = sorted(p for p in PROJECT_ROOT.glob(pattern) if p.is_file())
+            digest.update(f'\0{pattern}'.encode())
+            for match in matches:
+                digest.update(f'\0{match}\0{self.file_hash(match)}'.encode())
+        return digest.hexdigest()
+
+
+def load_state() -> dict:
+    """Load the build state, or an empty one if missing or outdated"""
+    if STATE_FILE.exists():
+        with open(STATE_FILE) as f:
+            state = json.load(f)
+        if state.get('version') == STATE_VERSION:
+            return state
+    return {'version': STATE_VERSION, 'files': {}, 'steps': {}}
+
+
+def save_state(state: dict):
+    """Write the build state atomically"""
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = STATE_FILE.with_suffix('.json.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    tmp.replace(STATE_FILE)
+
+
+def python_step(script: str, *args: str) -> list[str]:
+    """Command for a script in scripts/ or scripts/harvest/"""
+    path = SCRIPTS_DIR / script
+    if not path.exists():
+        path = SCRIPTS_DIR / 'harvest' / script
+    return [sys.executable, str(path), *args]
+
+
+def script_input(script: str) -> str:
+    """Project-relative path of a script, for use as a step input"""
+    path = SCRIPTS_DIR / script
+    if not path.exists():
+        path = SCRIPTS_DIR / 'harvest' / script
+    return str(path.relative_to(PROJECT_ROOT))
+
+
+def build_steps(season: str, year: int, state_pdf: Path, senior_class: str | None) -> list[Step]:
+    """The season update build graph"""
+    target_pdf = f'data/raw/aia-state/aia-state-{year}.pdf'
+    records = ['data/records/records-*.md', 'data/records/relay-records-*.md']
+    generator_inputs = ['data/raw/swimmers/*.csv'] + SHARED_MODULES
+
+    steps = [
+        # Harvest
+        Step('roster', f"Step 1: Generate roster for {season} season",
+             ['swim-data-tool', 'roster', f'--seasons={season}'],
+             cwd=TEAM_DIR, harvest=True),
+        Step('import_swimmers', "Step 2: Import swimmer data from MaxPreps",
+             ['swim-data-tool', 'import', 'swimmers', '--source=maxpreps'],
+             outputs=['data/raw/swimmers/*.csv'],
+             deps=['roster'], cwd=TEAM_DIR, harvest=True),
+
+        # State Championship PDF
+        Step('copy_state_pdf', "Step 3: Copy State Championship PDF",
+             ['cp', str(state_pdf), str(PROJECT_ROOT / target_pdf)],
+             inputs=[str(state_pdf)], outputs=[target_pdf]),
+        Step('update_state_parser', f"Step 4: Update AIA State parser for {year}",
+             python_step('update_state_parser.py', '--year', str(year)),
+             inputs=[script_input('update_state_parser.py')],
+             outputs=[script_input('parse_aia_state_meets.py')]),
+        Step('parse_state', "Step 5: Parse AIA State Championship results",
+             python_step('parse_aia_state_meets.py'),
+             inputs=[script_input('parse_aia_state_meets.py'), 'data/raw/aia-state/*.pdf'],
+             outputs=['data/raw/aia-state/*.csv'],
+             deps=['copy_state_pdf', 'update_state_parser']),
+        Step('merge_state', "Step 6: Merge state data into swimmer files",
+             python_step('merge_aia_state_data.py'),
+             inputs=[script_input('merge_aia_state_data.py'), 'data/raw/aia-state/*.csv',
+                     'data/swimmer_aliases.json'],
+             outputs=['data/raw/swimmers/*.csv'],
+             deps=['parse_state', 'import_swimmers']),
+
+        # Shared swim data, built once before the steps that read it
+        Step('swim_store', "Step 7: Build the swim store",
+             python_step('swim_store.py'),
+             inputs=[script_input('swim_store.py')] + generator_inputs,
+             outputs=['data/cache/swims/manifest.json'],
+             deps=['merge_state']),
+        Step('swim_db', "Step 8: Update the swim database",
+             python_step('swim_db.py'),
+             inputs=DB_INPUTS + SHARED_MODULES,
+             deps=['swim_store']),
+
+        # Records (independent of each other)
+        Step('hs_records', "Step 9: Generate individual records",
+             python_step('generate_hs_records.py'),
+             inputs=[script_input('generate_hs_records.py')] + generator_inputs,
+             outputs=['data/records/records-*.md', 'data/records/records-*.jsonl'],
+             deps=['swim_store']),
+        Step('relay_records', "Step 10: Generate relay records",
+             python_step('generate_relay_records.py'),
+             inputs=[script_input('generate_relay_records.py')] + generator_inputs,
+             outputs=['data/records/relay-records-*.md'],
+             deps=['swim_store']),
+        Step('season_top10', "Step 11: Generate all season top 10 lists",
+             python_step('generate_all_season_top10.py'),
+             inputs=[script_input('generate_all_season_top10.py')] + generator_inputs,
+             outputs=['data/records/top10-*-20*.md', 'data/records/top10-*-20*.jsonl'],
+             deps=['swim_store']),
+
+        # Season highlights
+        Step('analyze_season', "Step 12: Analyze season for records broken and highlights",
+             python_step('analyze_season.py', '--season', season, '--year', str(year)),
+             inputs=[script_input('analyze_season.py')] + DB_INPUTS + SHARED_MODULES,
+             outputs=[f'artifacts/records-broken-{season}.md'],
+             deps=['swim_db', 'hs_records', 'relay_records']),
+        Step('analyze_state_meet', "Step 13: Analyze state meet performance",
+             python_step('analyze_state_meet.py', '--year', str(year)),
+             inputs=[script_input('analyze_state_meet.py'), 'data/raw/aia-state/*.csv']
+                    + DB_INPUTS + SHARED_MODULES,
+             deps=['swim_db']),
+        Step('annual_summary', "Step 14: Generate formatted annual summary",
+             python_step('generate_annual_summary.py', '--season', season, '--formatted'),
+             inputs=[script_input('generate_annual_summary.py'), f'artifacts/records-broken-{season}.md',
+                     'data/records/top10-*-20*.md'] + records,
+             outputs=[f'data/records/annual-summary-{season}.md'],
+             deps=['analyze_season', 'analyze_state_meet', 'season_top10']),
+    ]
+
+    website_deps = ['annual_summary']
+    if senior_class:
+        steps.append(Step(
+            'seniors', "Step 15: Generate senior class highlights",
+            python_step('analyze_seniors.py', '--class-year', senior_class),
+            inputs=[script_input('analyze_seniors.py'), script_input('swimmer_profiles.py')] + DB_INPUTS
+                   + SHARED_MODULES,
+            deps=['swim_db'],
+        ))
+        website_deps.append('seniors')
+
+    steps.append(Step(
+        'website', "Step 16: Regenerate website",
+        python_step('generate_website.py'),
+        inputs=[script_input('generate_website.py'), script_input('rebuild_relay_pages.py'),
+                script_input('generate_annual_pages.py'), 'records/*.md',
+                'data/records/annual-summary-*.md', 'data/historical_splits/*.json',
+                'data/class_records_history.json'] + SHARED_MODULES,
+        outputs=['docs/**/*.html'],
+        deps=website_deps,
+    ))
+    return steps
+
+
+def run_step(step: Step) -> tuple[bool, str]:
+    """Run a step's command, returning (success, captured output)"""
+    try:
+        result = subprocess.run(step.cmd, cwd=step.cwd, capture_output=True, text=True)
+    except OSError as e:
+        return False, str(e)
     if result.returncode != 0:
-        print(f"❌ Error: {result.stderr}")
-        return False
-    
-    print(result.stdout)
-    print(f"✅ {description} - COMPLETE")
-    return True
+        return False, result.stderr
+    return True, result.stdout
+
+
+def report(step: Step, status: str, output: str = ''):
+    """Print a step's result in one block (steps finish concurrently)"""
+    with _print_lock:
+        print(f"\n{'='*70}")
+        print(f"{status} {step.description}")
+        print(f"{'='*70}")
+        if output:
+            print(output)
+
+
+def run_graph(steps: list[Step], state: dict, jobs: int, force: bool, skip_harvest: bool) -> bool:
+    """
+    Run the build graph, skipping up-to-date steps.
+
+    A step starts once all of its dependencies have finished (run or
+    skipped). On the first failure no new steps are started.
+    """
+    hashes = FileHashes(state['files'])
+    by_name = {step.name: step for step in steps}
+    pending = dict(by_name)
+    done: set[str] = set()
+    failed = False
+
+    def execute(step: Step) -> tuple[bool, str]:
+        if step.harvest and skip_harvest:
+            report(step, "⏭️  Skipped (--skip-harvest):")
+            return True, 'skipped'
+
+        recorded = state['steps'].get(step.name)
+        input_hash = hashes.files_hash(step.inputs, extra='\0'.join(step.cmd)) if step.inputs else None
+        if (not force and input_hash and recorded
+                and recorded['inputs'] == input_hash
+                and recorded['outputs'] == hashes.files_hash(step.outputs)):
+            report(step, "⏭️  Up to date:")
+            return True, 'skipped'
+
+        ok, output = run_step(step)
+        if not ok:
+            report(step, "❌ Error:", output)
+            return False, 'failed'
+
+        if input_hash:
+            state['steps'][step.name] = {
+                'inputs': input_hash,
+                'outputs': hashes.files_hash(step.outputs),
+            }
+        report(step, "✅ COMPLETE:", output)
+        return True, 'ran'
+
+    counts = {'ran': 0, 'skipped': 0, 'failed': 0}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        running = {}
+        while pending or running:
+            if not failed:
+                for name, step in list(pending.items()):
+                    if all(dep in done or dep not in by_name for dep in step.deps):
+                        running[pool.submit(execute, step)] = name
+                        del pending[name]
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                ok, outcome = future.result()
+                counts[outcome] += 1
+                if ok:
+                    done.add(name)
+                else:
+                    failed = True
+
+    save_state(state)
+    print(f"\n📊 Steps: {counts['ran']} ran, {counts['skipped']} skipped, {counts['failed']} failed")
+    return not failed
+
 
 def main():
     parser = argparse.ArgumentParser(description='Automated season update workflow')
     parser.add_argument('--season', required=True, help='Season in YY-YY format (e.g., 25-26)')
     parser.add_argument('--state-pdf', required=True, help='Path to AIA State Championship PDF')
     parser.add_argument('--senior-class', help='Graduation year for senior highlights (e.g., 2026)')
-    
+    parser.add_argument('--skip-harvest', action='store_true',
+                        help='Reuse existing MaxPreps data instead of re-harvesting')
+    parser.add_argument('--force', action='store_true', help='Run every step even if up to date')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Maximum number of steps to run at once')
+
     args = parser.parse_args()
-    
+
     season = args.season
-    year = int("20" + season.split('-')[0])  # e.g., "25-26" -> 2025
-    
+    year = int("20" + season.split('-')[0][-2:])  # e.g., "25-26" or "2025-26" -> 2025
+
     print(f"""
 {'='*70}
 🏊 TANQUE VERDE SWIMMING - AUTOMATED SEASON UPDATE
@@ -60,108 +371,16 @@ State PDF: {args.state_pdf}
 Senior Class: {args.senior_class or 'Not specified'}
 {'='*70}
     """)
-    
-    # Step 1: Update roster and harvest MaxPreps data
-    if not run_command(
-        f'cd /Users/aaryn/swimming/teams/tanque-verde && '
-        f'swim-data-tool roster --seasons={season}',
-        f"Step 1: Generate roster for {season} season"
-    ):
-        sys.exit(1)
-    
-    if not run_command(
-        f'cd /Users/aaryn/swimming/teams/tanque-verde && '
-        f'swim-data-tool import swimmers --source=maxpreps',
-        f"Step 2: Import swimmer data from MaxPreps"
-    ):
-        sys.exit(1)
-    
-    # Step 2: Process State Championship PDF
-    state_pdf = Path(args.state_pdf).expanduser()
+
+    state_pdf = Path(args.state_pdf).expanduser().resolve()
     if not state_pdf.exists():
         print(f"❌ State PDF not found: {state_pdf}")
         sys.exit(1)
-    
-    target_pdf = Path("data/raw/aia-state/aia-state-{year}.pdf")
-    if not run_command(
-        f'cp "{state_pdf}" {target_pdf}',
-        f"Step 3: Copy State Championship PDF"
-    ):
-        sys.exit(1)
-    
-    # Update parse_aia_state_meets.py to include new year
-    if not run_command(
-        f'python update_state_parser.py --year {year}',
-        f"Step 4: Update AIA State parser for {year}"
-    ):
-        sys.exit(1)
-    
-    if not run_command(
-        'python parse_aia_state_meets.py',
-        f"Step 5: Parse AIA State Championship results"
-    ):
-        sys.exit(1)
-    
-    if not run_command(
-        'python merge_aia_state_data.py',
-        f"Step 6: Merge state data into swimmer files"
-    ):
-        sys.exit(1)
-    
-    # Step 3: Generate all records
-    if not run_command(
-        'python generate_hs_records.py',
-        f"Step 7: Generate individual records"
-    ):
-        sys.exit(1)
-    
-    if not run_command(
-        'python generate_relay_records.py',
-        f"Step 8: Generate relay records"
-    ):
-        sys.exit(1)
-    
-    if not run_command(
-        'python generate_all_season_top10.py',
-        f"Step 9: Generate all season top 10 lists"
-    ):
-        sys.exit(1)
-    
-    # Step 4: Analyze season highlights
-    if not run_command(
-        f'python analyze_season.py --season {season} --year {year}',
-        f"Step 10: Analyze season for records broken and highlights"
-    ):
-        sys.exit(1)
-    
-    if not run_command(
-        f'python analyze_state_meet.py --year {year}',
-        f"Step 11: Analyze state meet performance"
-    ):
-        sys.exit(1)
-    
-    # Step 5: Generate formatted annual summary
-    if not run_command(
-        f'python generate_annual_summary.py --season {season} --formatted',
-        f"Step 12: Generate formatted annual summary"
-    ):
-        sys.exit(1)
-    
-    # Step 6: Generate senior highlights if specified
-    if args.senior_class:
-        if not run_command(
-            f'python analyze_seniors.py --class-year {args.senior_class}',
-            f"Step 13: Generate senior class highlights"
-        ):
-            sys.exit(1)
-    
-    # Step 7: Regenerate website
-    if not run_command(
-        'python generate_website.py',
-        f"Step 14: Regenerate website"
-    ):
+
+    steps = build_steps(season, year, state_pdf, args.senior_class)
+    if not run_graph(steps, load_state(), args.jobs, args.force, args.skip_harvest):
         sys.exit(1)
-    
+
     print(f"""
 {'='*70}
 ✅ SEASON UPDATE COMPLETE!
@@ -184,4 +403,3 @@ Next steps:
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Local SQLite query layer over swims, relays, relay splits and records.
+
+data/cache/swims.sqlite holds one table per kind of project data:
+
+    swims          every swim in the swim store (swim_store.py), one row each
+    relays         data/all_relays.json
+    relay_splits   data/historical_splits/splits_YY-YY.json, one row per leg
+    class_records  data/class_records_history.json
+    leadoffs       data/relay_leadoff_times.json
+
+with indexes on swims (Gender, event_code, time_hundredths), (Name, season)
+and (MeetName, SwimDate), so the analysis scripts ask for one swimmer's
+swims, an event's fastest swims or one meet's results instead of loading
+and filtering everything in pandas.
+
+The database is built incrementally. A sources table records the mtime,
+size and content hash of every swim store partition and JSON file it was
+loaded from; on open, only sources whose content changed have their rows
+deleted and reloaded. Swims keep the swim store's column names; SwimDate is
+an ISO date string, so date comparisons are string comparisons.
+
+Usage:
+    python3 scripts/swim_db.py            # bring the database up to date
+    python3 scripts/swim_db.py --rebuild  # rebuild from scratch
+
+    from swim_db import SwimDB
+    db = SwimDB.open()
+    db.swims(name='Zachary Duerkop', kind='individual')
+    db.best_swim(gender='M', event_code='100-fly', before='2025-08-01')
+    db.best_swims(['Event'], name='Zachary Duerkop', kind='individual')
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from relay_splits import strip_grade_suffix
+from swim_store import STORE_DIR, build_store, store_lock
+from time_parser import parse_hundredths
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_DIR = PROJECT_ROOT / 'data'
+DB_FILE = DATA_DIR / 'cache' / 'swims.sqlite'
+RELAYS_FILE = DATA_DIR / 'all_relays.json'
+SPLITS_DIR = DATA_DIR / 'historical_splits'
+CLASS_RECORDS_FILE = DATA_DIR / 'class_records_history.json'
+LEADOFFS_FILE = DATA_DIR / 'relay_leadoff_times.json'
+
+# Bump when the schema or loaders change to force a rebuild
+DB_VERSION = 1
+
+# Swim store columns copied into the swims table
+SWIM_COLUMNS = ['Name', 'Gender', 'Team', 'Event', 'event_code', 'event_course', 'SwimTime',
+                'time_hundredths', 'SwimDate', 'year', 'season', 'grade', 'MeetName',
+                'is_relay', 'source_file']
+
+SCHEMA = """
+CREATE TABLE sources (
+    source TEXT PRIMARY KEY,
+    mtime_ns INTEGER, size INTEGER, sha256 TEXT
+);
+CREATE TABLE swims (
+    source TEXT NOT NULL,
+    Name TEXT, Gender TEXT, Team TEXT, Event TEXT, event_code TEXT, event_course TEXT,
+    SwimTime TEXT, time_hundredths INTEGER, SwimDate TEXT, year INTEGER, season TEXT,
+    grade INTEGER, MeetName TEXT, is_relay INTEGER, source_file TEXT
+);
+CREATE INDEX swims_event_time ON swims (Gender, event_code, time_hundredths);
+CREATE INDEX swims_swimmer_season ON swims (Name, season);
+CREATE INDEX swims_meet_date ON swims (MeetName, SwimDate);
+CREATE INDEX swims_source ON swims (source);
+
+CREATE TABLE relays (
+    source TEXT NOT NULL,
+    gender TEXT, event TEXT, season TEXT, date TEXT, meet TEXT, round TEXT,
+    place TEXT, time TEXT, time_hundredths INTEGER, swimmers TEXT
+);
+CREATE INDEX relays_event_time ON relays (gender, event, time_hundredths);
+CREATE INDEX relays_meet_date ON relays (meet, date);
+
+CREATE TABLE relay_splits (
+    source TEXT NOT NULL,
+    relay_id TEXT, season TEXT, gender TEXT, type TEXT, team TEXT, leg INTEGER,
+    swimmer TEXT, split TEXT, split_hundredths INTEGER, total_hundredths INTEGER
+);
+CREATE INDEX relay_splits_swimmer_season ON relay_splits (swimmer, season);
+CREATE INDEX relay_splits_relay ON relay_splits (relay_id, leg);
+
+CREATE TABLE class_records (
+    source TEXT NOT NULL,
+    season TEXT, gender TEXT, event TEXT, grade TEXT, time TEXT, time_hundredths INTEGER,
+    name TEXT, date TEXT, meet TEXT,
+    previous_time TEXT, previous_time_hundredths INTEGER, previous_name TEXT,
+    previous_date TEXT, previous_season TEXT, previous_meet TEXT
+);
+CREATE INDEX class_records_event ON class_records (gender, event, grade, season);
+
+CREATE TABLE leadoffs (
+    source TEXT NOT NULL,
+    gender TEXT, distance TEXT, name TEXT, grade TEXT, time TEXT, time_hundredths INTEGER,
+    year TEXT, from_relay TEXT, date TEXT, meet TEXT, relay_time TEXT
+);
+CREATE INDEX leadoffs_distance_time ON leadoffs (gender, distance, time_hundredths);
+"""
+
+TABLES = ('swims', 'relays', 'relay_splits', 'class_records', 'leadoffs')
+
+# Databases already opened in this process, keyed by path
+_opened: dict[str, 'SwimDB'] = {}
+
+
+def _file_hash(path: Path) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _iso_date(value: str, fmt: str) -> str | None:
+    """'10/6/2012' (fmt '%m/%d/%Y') -> '2012-10-06'; None if unparsable"""
+    try:
+        return datetime.strptime(str(value).strip(), fmt).date().isoformat()
+    except ValueError:
+        return None
+
+
+def _records(df: pd.DataFrame) -> list[tuple]:
+    """Frame rows as tuples with NaN/NaT replaced by None"""
+    return list(df.astype(object).where(df.notna(), None).itertuples(index=False, name=None))
+
+
+def _swim_rows(path: Path) -> tuple[str, list[tuple]]:
+    """Rows of one swim store partition"""
+    df = pd.read_parquet(path)
+    df = df.reindex(columns=SWIM_COLUMNS)
+    dates = pd.to_datetime(df['SwimDate'], errors='coerce')
+    df['SwimDate'] = dates.dt.strftime('%Y-%m-%d')
+    df['year'] = dates.dt.year.astype('Int64')
+    df['grade'] = pd.to_numeric(df['grade'], errors='coerce').astype('Int64')
+    df['is_relay'] = df['is_relay'].fillna(False).astype(int)
+    return 'swims', _records(df)
+
+
+def _relay_rows(path: Path) -> tuple[str, list[tuple]]:
+    with open(path) as f:
+        data = json.load(f)
+    rows = []
+    for gender, relays in data.items():
+        for relay in relays:
+            rows.append((relay.get('gender', gender), relay.get('event'), relay.get('season'),
+                         _iso_date(relay.get('date', ''), '%m/%d/%Y'), relay.get('meet'),
+                         relay.get('round'), relay.get('place'), relay.get('time'),
+                         parse_hundredths(relay.get('time')), json.dumps(relay.get('swimmers', []))))
+    return 'relays', rows
+
+
+def _split_rows(path: Path) -> tuple[str, list[tuple]]:
+    with open(path) as f:
+        data = json.load(f)
+    season = path.stem.removeprefix('splits_')
+    rows = []
+    for gender, entries in data.items():
+        for position, entry in enumerate(entries):
+            relay_id = f'{season}:{gender}:{position}'
+            splits = entry.get('splits', [])
+            hundredths = entry.get('split_hundredths') or [parse_hundredths(s) for s in splits]
+            for leg, swimmer in enumerate(entry.get('swimmers', []), start=1):
+                split = splits[leg - 1] if leg <= len(splits) else None
+                rows.append((relay_id, entry.get('year', season), entry.get('gender', gender),
+                             entry.get('type'), entry.get('team'), leg, strip_grade_suffix(swimmer),
+                             split, hundredths[leg - 1] if leg <= len(hundredths) else None,
+                             entry.get('total_hundredths')))
+    return 'relay_splits', rows
+
+
+def _class_record_rows(path: Path) -> tuple[str, list[tuple]]:
+    with open(path) as f:
+        data = json.load(f)
+    rows = []
+    for record in data:
+        previous = record.get('previous') or {}
+        rows.append((record.get('season'), record.get('gender'), record.get('event'),
+                     record.get('grade'), record.get('time'), record.get('time_hundredths'),
+                     record.get('name'), record.get('date'), record.get('meet'),
+                     previous.get('time'), previous.get('time_hundredths'), previous.get('name'),
+                     previous.get('date'), previous.get('season'), previous.get('meet')))
+    return 'class_records', rows
+
+
+def _leadoff_rows(path: Path) -> tuple[str, list[tuple]]:
+    with open(path) as f:
+        data = json.load(f)
+    rows = []
+    for gender, distances in data.items():
+        for distance, swims in distances.items():
+            for swim in swims:
+                rows.append((gender, distance, swim.get('name'), swim.get('grade'),
+                             swim.get('time_str'), swim.get('time_hundredths'), swim.get('year'),
+                             swim.get('from_relay'), swim.get('date'), swim.get('meet'),
+                             swim.get('relay_time')))
+    return 'leadoffs', rows
+
+
+def _sources() -> dict[str, tuple[Path, object]]:
+    """Source key -> (file, loader) for every file the database is built from"""
+    sources = {}
+    for part in sorted(STORE_DIR.glob('gender=*/season=*/part.parquet')):
+        sources[f'swims/{part.parent.parent.name}/{part.parent.name}'] = (part, _swim_rows)
+    for path in sorted(SPLITS_DIR.glob('splits_*.json')):
+        sources[f'relay_splits/{path.name}'] = (path, _split_rows)
+    for path, loader in ((RELAYS_FILE, _relay_rows), (CLASS_RECORDS_FILE, _class_record_rows),
+                         (LEADOFFS_FILE, _leadoff_rows)):
+        if path.exists():
+            sources[path.name] = (path, loader)
+    return sources
+
+
+def _where(filters: dict) -> tuple[str, list]:
+    """WHERE clause for swims() filters"""
+    clauses, params = [], []
+    columns = {'name': 'Name', 'gender': 'Gender', 'team': 'Team', 'event': 'Event',
+               'event_code': 'event_code', 'course': 'event_course', 'season': 'season', 'year': 'year',
+               'meet': 'MeetName', 'date': 'SwimDate'}
+    for key, value in filters.items():
+        if value is None:
+            continue
+        if key in columns:
+            clauses.append(f'{columns[key]} = ?')
+            params.append(value)
+        elif key == 'kind':
+            clauses.append('is_relay = ?')
+            params.append(1 if value == 'relay' else 0)
+        elif key == 'before':
+            clauses.append('SwimDate < ?')
+            params.append(str(value)[:10])
+        elif key == 'since':
+            clauses.append('SwimDate >= ?')
+            params.append(str(value)[:10])
+        elif key == 'meet_like':
+            patterns = [value] if isinstance(value, str) else list(value)
+            clauses.append('(' + ' OR '.join('MeetName LIKE ?' for _ in patterns) + ')')
+            params.extend(f'%{pattern}%' for pattern in patterns)
+        else:
+            raise TypeError(f'unknown swim filter: {key}')
+    return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+
+class SwimDB:
+    """Indexed SQLite copy of the swim store and the relay/record JSON files"""
+
+    def __init__(self, path: Path = DB_FILE):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=60, isolation_level=None, check_same_thread=False)
+        if self._version() != DB_VERSION:
+            self._create()
+
+    @classmethod
+    def open(cls, path: Path = DB_FILE, refresh: bool = True) -> 'SwimDB':
+        """The database for path, brought up to date once per process"""
+        db = _opened.get(str(path))
+        if db is None:
+            db = _opened[str(path)] = cls(path)
+            if refresh:
+                db.refresh(verbose=False)
+        return db
+
+    def _version(self) -> int:
+        return self.conn.execute('PRAGMA user_version').fetchone()[0]
+
+    def _create(self):
+        """(Re)create every table, unless another process just did"""
+        self.conn.execute('BEGIN IMMEDIATE')
+        if self._version() == DB_VERSION:
+            self.conn.execute('COMMIT')
+            return
+        for table in ('sources',) + TABLES:
+            self.conn.execute(f'DROP TABLE IF EXISTS {table}')
+        for statement in SCHEMA.split(';'):
+            if statement.strip():
+                self.conn.execute(statement)
+        self.conn.execute(f'PRAGMA user_version = {DB_VERSION}')
+        self.conn.execute('COMMIT')
+
+    def refresh(self, verbose: bool = True) -> dict:
+        """
+        Reload the sources whose content changed since the last refresh.
+
+        Brings the swim store up to date first, then reads it under the
+        store's shared lock so no build can rewrite partitions mid-load.
+        Runs in one write transaction, so concurrent refreshes from other
+        processes wait for it and then find nothing left to do.
+        """
+        build_store(verbose=False)
+        with store_lock(shared=True):
+            return self._refresh(verbose)
+
+    def _refresh(self, verbose: bool) -> dict:
+        sources = _sources()
+        summary = {'sources': len(sources), 'changed': 0, 'rows': 0}
+        # A missing store means it was never built here, not that every swim was deleted
+        store_missing = not STORE_DIR.is_dir()
+
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            known = {row[0]: row[1:] for row in self.conn.execute(
+                'SELECT source, mtime_ns, size, sha256 FROM sources')}
+
+            for source in set(known) - set(sources):
+                if store_missing and source.startswith('swims/'):
+                    continue
+                self._delete(source)
+                summary['changed'] += 1
+
+            for source, (path, loader) in sources.items():
+                stat = path.stat()
+                entry = known.get(source)
+                if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                    continue
+                digest = _file_hash(path)
+                if not entry or entry[2] != digest:
+                    self._delete(source)
+                    table, rows = loader(path)
+                    placeholders = ', '.join('?' * (len(rows[0]) + 1)) if rows else ''
+                    if rows:
+                        self.conn.executemany(f'INSERT INTO {table} VALUES ({placeholders})',
+                                              [(source,) + row for row in rows])
+                    summary['changed'] += 1
+                    summary['rows'] += len(rows)
+                self.conn.execute('INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?)',
+                                  (source, stat.st_mtime_ns, stat.st_size, digest))
+            self.conn.execute('COMMIT')
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            raise
+
+        if verbose:
+            print(f"🗃️  Swim database: {summary['sources']} sources, "
+                  f"{summary['changed']} reloaded ({summary['rows']:,} rows)")
+        return summary
+
+    def _delete(self, source: str):
+        for table in TABLES:
+            self.conn.execute(f'DELETE FROM {table} WHERE source = ?', (source,))
+        self.conn.execute('DELETE FROM sources WHERE source = ?', (source,))
+
+    def query(self, sql: str, params=()) -> pd.DataFrame:
+        """Run any SELECT and return the rows as a frame"""
+        return pd.read_sql_query(sql, self.conn, params=list(params))
+
+    def swims(self, **filters) -> pd.DataFrame:
+        """
+        Swims matching filters, in load order.
+
+        Filters: name, gender, team, event, event_code, course, season, year,
+        meet, date (exact matches), kind ('individual' or 'relay'), before / since
+        (SwimDate bounds, exclusive / inclusive) and meet_like (a substring,
+        or several OR'ed, matched case-insensitively against MeetName).
+        """
+        where, params = _where(filters)
+        return self.query(f'SELECT {", ".join(SWIM_COLUMNS)} FROM swims{where} ORDER BY rowid', params)
+
+    def best_swims(self, keys: list[str], **filters) -> pd.DataFrame:
+        """
+        Fastest swim for each combination of keys (swims columns), among
+        swims matching filters. Swims without a time, or with a missing key,
+        are ignored; ties keep the earlier swim in load order.
+        """
+        where, params = _where(filters)
+        condition = ' AND '.join(f'{key} IS NOT NULL' for key in keys)
+        where = f'{where} AND {condition}' if where else f' WHERE {condition}'
+        partition = ', '.join(keys)
+        return self.query(f"""
+            SELECT {", ".join(SWIM_COLUMNS)} FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY {partition} ORDER BY time_hundredths, rowid) AS position
+                FROM swims{where})
+            WHERE position = 1 ORDER BY {partition}""", params)
+
+    def best_swim(self, **filters) -> dict | None:
+        """Fastest swim matching filters (see swims()), or None"""
+        where, params = _where(filters)
+        df = self.query(f'SELECT {", ".join(SWIM_COLUMNS)} FROM swims{where} '
+                        'ORDER BY time_hundredths, rowid LIMIT 1', params)
+        return None if df.empty else df.iloc[0].to_dict()
+
+    def best_relay(self, gender: str, event: str, before: str | None = None) -> dict | None:
+        """Fastest relay for gender ('boys'/'girls') and event, optionally before a date"""
+        sql = 'SELECT * FROM relays WHERE gender = ? AND event = ?'
+        params = [gender, event]
+        if before is not None:
+            sql += ' AND date < ?'
+            params.append(str(before)[:10])
+        df = self.query(sql + ' ORDER BY time_hundredths, rowid LIMIT 1', params)
+        if df.empty:
+            return None
+        relay = df.iloc[0].to_dict()
+        relay['swimmers'] = json.loads(relay['swimmers'])
+        return relay
+
+    def class_records(self, gender: str | None = None, season: str | None = None) -> pd.DataFrame:
+        """Grade records set (data/class_records_history.json), by gender and season"""
+        clauses = [(column, value) for column, value in (('gender', gender), ('season', season))
+                   if value is not None]
+        where = ' WHERE ' + ' AND '.join(f'{column} = ?' for column, _ in clauses) if clauses else ''
+        return self.query(f'SELECT * FROM class_records{where} ORDER BY rowid',
+                          [value for _, value in clauses])
+
+    def close(self):
+        _opened.pop(str(self.path), None)
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the SQLite swim database')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild the database from scratch')
+    args = parser.parse_args()
+
+    print("\n🏊 Building Swim Database\n")
+    if args.rebuild:
+        DB_FILE.unlink(missing_ok=True)
+    db = SwimDB(DB_FILE)
+    db.refresh()
+    for table in TABLES:
+        count = db.conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+        print(f"  {table:14s} {count:>8,} rows")
+    print("\n✓ Swim Database Complete!\n")
+
+
+if __name__ == '__main__':
+    main()
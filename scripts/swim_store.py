@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Consolidated columnar swim store.
+
+Every swimmer CSV in data/raw/swimmers is parsed once into a Parquet dataset
+partitioned by gender and season (data/cache/swims/gender=M/season=2024-25/).
+Rows carry typed columns (SwimDate as datetime, event_code, season, and
+times as int32 hundredths in time_hundredths) so generators can load the whole history without re-reading and
+re-parsing thousands of small CSVs.
+
+The store is rebuilt incrementally: a manifest records each source CSV's
+mtime, size and content hash, and only CSVs whose content changed are
+re-parsed. Only the partitions touched by those CSVs are rewritten.
+
+Builds hold an exclusive lock on data/cache/swims.lock and reads a shared
+one, so scripts run side by side never see a half-rewritten store.
+
+Usage:
+    python3 scripts/swim_store.py            # refresh the store
+    python3 scripts/swim_store.py --rebuild  # rebuild from scratch
+
+    from swim_store import load_swims
+    df = load_swims(kind='individual', genders=['M'])
+"""
+
+import argparse
+import fcntl
+import hashlib
+import json
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+from time_parser import parse_times
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SWIMMERS_DIR = PROJECT_ROOT / 'data' / 'raw' / 'swimmers'
+STORE_DIR = PROJECT_ROOT / 'data' / 'cache' / 'swims'
+MANIFEST_FILE = STORE_DIR / 'manifest.json'
+LOCK_FILE = STORE_DIR.parent / 'swims.lock'
+
+# Bump when the stored schema or normalization changes to force a rebuild
+STORE_VERSION = 2
+
+UNKNOWN_PARTITION = 'unknown'
+
+
+@contextmanager
+def store_lock(shared: bool = False):
+    """
+    Hold the store lock: exclusive while building, shared while reading.
+
+    The lock file sits beside the store so a rebuild can remove the store
+    directory while holding it.
+    """
+    LOCK_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_FILE, 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def normalize_relay_event_code(event: str) -> str | None:
+    """Convert a relay event name to its event code"""
+    if not isinstance(event, str):
+        return None
+    event_lower = event.lower()
+    if "200" in event_lower and "medley" in event_lower:
+        return "200-medley-relay"
+    if "200" in event_lower and ("free" in event_lower or "fr" in event_lower):
+        return "200-free-relay"
+    if "400" in event_lower and ("free" in event_lower or "fr" in event_lower):
+        return "400-free-relay"
+    return None
+
+
+def season_labels(dates: pd.Series) -> pd.Series:
+    """Map swim dates to season labels (Aug 1 cutoff, e.g. '2024-25')"""
+    start_year = dates.dt.year.astype('Int64') - (dates.dt.month < 8).astype(int)
+    labels = start_year.astype(str) + '-' + ((start_year + 1) % 100).astype(str).str.zfill(2)
+    return labels.where(dates.notna(), UNKNOWN_PARTITION)
+
+
+def _file_hash(path: Path) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load_manifest() -> dict:
+    """Load the store manifest, or an empty one if missing or outdated"""
+    if not MANIFEST_FILE.exists():
+        return {'version': STORE_VERSION, 'sources': {}}
+    with open(MANIFEST_FILE) as f:
+        manifest = json.load(f)
+    if manifest.get('version') != STORE_VERSION:
+        return {'version': STORE_VERSION, 'sources': {}}
+    return manifest
+
+
+def _save_manifest(manifest: dict):
+    """Write the store manifest (atomically)"""
+    MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = MANIFEST_FILE.with_suffix('.json.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    tmp.replace(MANIFEST_FILE)
+
+
+def _scan_sources(manifest: dict) -> tuple[dict, set[str]]:
+    """
+    Compare swimmer CSVs against the manifest.
+
+    Returns the updated source entries and the names of CSVs whose content
+    changed (new, modified or deleted). A CSV whose mtime changed but whose
+    hash did not is treated as unchanged.
+    """
+    known = manifest.get('sources', {})
+    sources = {}
+    changed = set()
+
+    for csv_file in sorted(SWIMMERS_DIR.glob('*.csv')):
+        stat = csv_file.stat()
+        entry = known.get(csv_file.name)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            sources[csv_file.name] = entry
+            continue
+
+        digest = _file_hash(csv_file)
+        if not entry or entry['sha256'] != digest:
+            changed.add(csv_file.name)
+        sources[csv_file.name] = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': digest,
+            'partitions': entry['partitions'] if entry else [],
+        }
+
+    changed |= set(known) - set(sources)
+    return sources, changed
+
+
+def _read_sources(names: set[str]) -> pd.DataFrame:
+    """Read and normalize a set of swimmer CSVs into store rows"""
+    frames = []
+    for name in sorted(names):
+        csv_file = SWIMMERS_DIR / name
+        if not csv_file.exists():
+            continue
+        try:
+            df = pd.read_csv(csv_file)
+        except Exception as e:
+            print(f"Warning: Could not read {csv_file}: {e}")
+            continue
+        df['source_file'] = name
+        frames.append(df)
+
+    if not frames:
+        return pd.DataFrame()
+
+    return normalize_swims(pd.concat(frames, ignore_index=True))
+
+
+def normalize_swims(df: pd.DataFrame) -> pd.DataFrame:
+    """Add typed columns (SwimDate, event_code, time_hundredths, season) to raw swims"""
+    from swim_data_tool.services.record_generator import RecordGenerator
+
+    is_relay = df['Event'].str.contains('RELAY', case=False, na=False)
+
+    individual = df[~is_relay]
+    if not individual.empty:
+        individual = RecordGenerator(PROJECT_ROOT / 'data').parse_and_normalize_events(individual)
+
+    relay = df[is_relay].copy()
+    if not relay.empty:
+        relay['event_code'] = relay['Event'].map(normalize_relay_event_code)
+        relay['time_seconds'] = parse_times(relay['SwimTime'])
+
+    df = pd.concat([individual.assign(is_relay=False), relay.assign(is_relay=True)], ignore_index=True)
+    df['SwimDate'] = pd.to_datetime(df['SwimDate'], errors='coerce')
+    df['time_seconds'] = pd.to_numeric(df['time_seconds'], errors='coerce')
+    df['time_hundredths'] = parse_times(df['SwimTime'], unit='hundredths')
+    df['season'] = season_labels(df['SwimDate'])
+    df['Gender'] = df['Gender'].fillna(UNKNOWN_PARTITION) if 'Gender' in df.columns else UNKNOWN_PARTITION
+    return df
+
+
+def _partition_dir(gender: str, season: str) -> Path:
+    """Directory holding one gender/season partition"""
+    return STORE_DIR / f'gender={gender}' / f'season={season}'
+
+
+def _partition_keys(df: pd.DataFrame) -> set[tuple[str, str]]:
+    """Distinct (gender, season) partitions present in a frame"""
+    if df.empty:
+        return set()
+    return set(df[['Gender', 'season']].drop_duplicates().itertuples(index=False, name=None))
+
+
+def _list_partitions() -> list[tuple[str, str]]:
+    """All (gender, season) partitions currently in the store"""
+    keys = []
+    for part in sorted(STORE_DIR.glob('gender=*/season=*/part.parquet')):
+        gender = part.parent.parent.name.split('=', 1)[1]
+        season = part.parent.name.split('=', 1)[1]
+        keys.append((gender, season))
+    return keys
+
+
+def _read_partitions(keys) -> pd.DataFrame:
+    """Read a set of partitions into one frame"""
+    frames = [
+        pd.read_parquet(_partition_dir(gender, season) / 'part.parquet')
+        for gender, season in keys
+        if (_partition_dir(gender, season) / 'part.parquet').exists()
+    ]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def _write_partitions(df: pd.DataFrame, keys: set[tuple[str, str]]):
+    """Rewrite the given partitions from df (partitions with no rows are removed)"""
+    groups = dict(tuple(df.groupby(['Gender', 'season'], sort=False))) if not df.empty else {}
+    for key in keys:
+        part_dir = _partition_dir(*key)
+        rows = groups.get(key)
+        if rows is None or rows.empty:
+            shutil.rmtree(part_dir, ignore_errors=True)
+            if part_dir.parent.exists() and not any(part_dir.parent.iterdir()):
+                part_dir.parent.rmdir()
+            continue
+        part_dir.mkdir(parents=True, exist_ok=True)
+        tmp = part_dir / 'part.parquet.tmp'
+        rows.to_parquet(tmp, index=False)
+        tmp.replace(part_dir / 'part.parquet')
+
+
+def build_store(rebuild: bool = False, verbose: bool = True) -> dict:
+    """
+    Bring the swim store up to date with data/raw/swimmers.
+
+    Only CSVs whose content hash changed are re-read, and only the
+    gender/season partitions containing their old or new rows are rewritten.
+    Returns a summary dict with counts of changed sources and partitions.
+    """
+    with store_lock():
+        summary = _build_store(rebuild)
+
+    if verbose:
+        print(f"🗄️  Swim store: {summary['sources']} sources, "
+              f"{summary['changed']} changed, {summary['partitions']} partitions rewritten")
+    return summary
+
+
+def _build_store(rebuild: bool) -> dict:
+    """build_store's work, run under the exclusive store lock"""
+    if rebuild:
+        shutil.rmtree(STORE_DIR, ignore_errors=True)
+
+    manifest = _load_manifest()
+    if not manifest['sources']:
+        # Fresh or outdated store: drop any stale partitions
+        shutil.rmtree(STORE_DIR, ignore_errors=True)
+
+    sources, changed = _scan_sources(manifest)
+    summary = {'sources': len(sources), 'changed': len(changed), 'partitions': 0}
+
+    if changed:
+        new_rows = _read_sources(changed)
+
+        # Partitions that held the old rows of changed sources, or receive new ones
+        known = manifest['sources']
+        affected = _partition_keys(new_rows)
+        for name in changed:
+            affected |= {tuple(key) for key in known.get(name, {}).get('partitions', [])}
+
+        existing = _read_partitions(affected)
+        if not existing.empty:
+            existing = existing[~existing['source_file'].isin(changed)]
+        combined = pd.concat([existing, new_rows], ignore_index=True) if not existing.empty else new_rows
+        _write_partitions(combined, affected)
+        summary['partitions'] = len(affected)
+
+        for name in changed & set(sources):
+            rows = new_rows[new_rows['source_file'] == name] if not new_rows.empty else new_rows
+            sources[name]['partitions'] = sorted(list(key) for key in _partition_keys(rows))
+
+    # Only touch the manifest when a source was added, changed or re-stat'ed
+    if sources != manifest['sources'] or not MANIFEST_FILE.exists():
+        manifest['sources'] = sources
+        _save_manifest(manifest)
+    return summary
+
+
+def load_swims(kind: str | None = None, genders=None, seasons=None,
+               refresh: bool = True) -> pd.DataFrame:
+    """
+    Load swims from the columnar store.
+
+    Args:
+        kind: 'individual', 'relay', or None for all swims
+        genders: Optional list of genders ('M', 'F') to load
+        seasons: Optional list of season labels ('2024-25') to load
+        refresh: Bring the store up to date with the source CSVs first
+
+    Only the matching gender/season partitions are read from disk.
+    """
+    if refresh:
+        build_store(verbose=False)
+
+    with store_lock(shared=True):
+        keys = [
+            (gender, season) for gender, season in _list_partitions()
+            if (genders is None or gender in genders) and (seasons is None or season in seasons)
+        ]
+        df = _read_partitions(keys)
+    if df.empty:
+        return df
+
+    if kind == 'individual':
+        df = df[~df['is_relay']]
+    elif kind == 'relay':
+        df = df[df['is_relay']]
+    return df.reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the consolidated swim store')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild the store from scratch')
+    args = parser.parse_args()
+
+    print("\n🏊 Building Swim Store\n")
+    build_store(rebuild=args.rebuild)
+    print("\n✓ Swim Store Complete!\n")
+
+
+if __name__ == '__main__':
+    main()
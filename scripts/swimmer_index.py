@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Persistent name index over data/raw/swimmers.
+
+Maps swimmer names (exact and normalized) to their CSV file and swimmer_id
+so lookups by name don't have to open every CSV in the directory. The index
+is saved to data/cache/swimmer_index.json and rebuilt only when the
+swimmers directory's mtime changes (files added, removed or renamed).
+
+Usage:
+    from swimmer_index import SwimmerIndex
+    index = SwimmerIndex.load()
+    index.find_file('Zachary Duerkop')
+"""
+
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from name_resolver import normalize_name
+
+SWIMMERS_DIR = Path(__file__).parent.parent / 'data' / 'raw' / 'swimmers'
+
+INDEX_VERSION = 1
+
+# Indexes already loaded in this process, keyed by directory
+_loaded: dict[str, tuple[int, 'SwimmerIndex']] = {}
+
+
+def index_path_for(swimmers_dir: Path) -> Path:
+    """Cache file for a swimmers directory (data/raw/swimmers -> data/cache/)"""
+    return swimmers_dir.parent.parent / 'cache' / 'swimmer_index.json'
+
+
+class SwimmerIndex:
+    """Name → swimmer CSV lookup, built once per swimmers directory mtime"""
+
+    def __init__(self, swimmers_dir: Path, entries: list[dict]):
+        self.swimmers_dir = swimmers_dir
+        self.entries = entries
+
+        self.by_name: dict[str, dict] = {}
+        self.by_normalized: dict[str, dict] = {}
+        for entry in entries:
+            if entry['name']:
+                self.by_name.setdefault(entry['name'], entry)
+                self.by_normalized.setdefault(normalize_name(entry['name']), entry)
+
+    @classmethod
+    def build(cls, swimmers_dir: Path = SWIMMERS_DIR) -> 'SwimmerIndex':
+        """Scan every CSV once, reading only its first row"""
+        entries = []
+        for csv_file in sorted(swimmers_dir.glob('*.csv')):
+            name = ''
+            swimmer_id = ''
+            try:
+                df = pd.read_csv(csv_file, nrows=1)
+                if not df.empty and 'Name' in df.columns and pd.notna(df['Name'].iloc[0]):
+                    name = str(df['Name'].iloc[0])
+                if not df.empty and 'swimmer_id' in df.columns and pd.notna(df['swimmer_id'].iloc[0]):
+                    swimmer_id = str(df['swimmer_id'].iloc[0])
+            except Exception:
+                pass
+            entries.append({'file': csv_file.name, 'name': name, 'swimmer_id': swimmer_id})
+        return cls(swimmers_dir, entries)
+
+    @classmethod
+    def load(cls, swimmers_dir: Path = SWIMMERS_DIR) -> 'SwimmerIndex':
+        """Load the cached index, rebuilding it if the directory changed"""
+        index_file = index_path_for(swimmers_dir)
+        dir_mtime = swimmers_dir.stat().st_mtime_ns if swimmers_dir.exists() else 0
+
+        loaded = _loaded.get(str(swimmers_dir))
+        if loaded and loaded[0] == dir_mtime:
+            return loaded[1]
+
+        if index_file.exists():
+            with open(index_file) as f:
+                cached = json.load(f)
+            if cached.get('version') == INDEX_VERSION and cached.get('dir_mtime_ns') == dir_mtime:
+                index = cls(swimmers_dir, cached['entries'])
+                _loaded[str(swimmers_dir)] = (dir_mtime, index)
+                return index
+
+        index = cls.build(swimmers_dir)
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(index_file, 'w') as f:
+            json.dump({
+                'version': INDEX_VERSION,
+                'dir_mtime_ns': dir_mtime,
+                'entries': index.entries,
+            }, f, indent=2)
+        _loaded[str(swimmers_dir)] = (dir_mtime, index)
+        return index
+
+    def find_file(self, name: str) -> Path | None:
+        """CSV file whose swimmer Name matches exactly"""
+        entry = self.by_name.get(name)
+        return self.swimmers_dir / entry['file'] if entry else None
+
+    def find_file_normalized(self, name: str) -> Path | None:
+        """
+        CSV file for a name, ignoring case, spacing and punctuation.
+
+        Falls back to matching the normalized name inside the file name,
+        as the swimmer files are named after the swimmer.
+        """
+        normalized = normalize_name(name)
+        entry = self.by_normalized.get(normalized)
+        if entry:
+            return self.swimmers_dir / entry['file']
+
+        for entry in self.entries:
+            if normalized in normalize_name(Path(entry['file']).stem):
+                return self.swimmers_dir / entry['file']
+        return None
+
+    def find_file_by_slug(self, name: str) -> Path | None:
+        """CSV file whose name contains the swimmer's slug ('first-last')"""
+        slug = name.lower().replace(' ', '-')
+        for entry in self.entries:
+            if slug in Path(entry['file']).stem.lower():
+                return self.swimmers_dir / entry['file']
+        return None
+
+    def swimmer_id(self, name: str) -> str | None:
+        """swimmer_id for a name, matched on the normalized name"""
+        entry = self.by_normalized.get(normalize_name(name))
+        return (entry['swimmer_id'] or None) if entry else None
+
+
+if __name__ == '__main__':
+    index = SwimmerIndex.load()
+    print(f"✓ Indexed {len(index.entries)} swimmer files → {index_path_for(SWIMMERS_DIR)}")
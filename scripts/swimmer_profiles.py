@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Materialized per-swimmer profiles for the senior and class reports.
+
+For every swimmer in the swim database (swim_db.py), keyed by the
+preferred name from name_resolver.py and gender, the profile holds
+the swimmer's individual-swim summary (swim counts, years active, source
+file), personal bests per event with their all-time team rank, a season
+best progression per event, and state meet history by year. Bests, ranks
+and progression cover only Tanque Verde short course yards swims, the ones
+the team's record and top 10 lists are made of; club and long course swims
+count toward the summary only. Profiles live in the same SQLite file:
+
+    profiles         one JSON profile per swimmer
+    personal_bests   one row per swimmer and event, ranked within
+                     (Gender, Event) by time, then date
+    profile_members  which swimmers each swim store partition contributed
+
+Profiles are built in one grouped pass over the swims table. After that,
+update() compares the swims sources against the ones profiles were last
+built from and rebuilds only the swimmers in changed partitions (the ones
+the partition used to hold and the ones it holds now), then re-ranks only
+the events those swimmers' bests are in. Names are resolved before grouping
+and ranking, so a swimmer's aliases share one profile and one all-time rank;
+an edit to the aliases file rebuilds every profile. Reports become lookups:
+
+    from swimmer_profiles import SwimmerProfiles
+    profiles = SwimmerProfiles.open()
+    profile = profiles.get('Zachary Duerkop')    # aliases resolve too
+    profile['bests']['100 FL SCY']['alltime_rank']
+    profile['progression']['100 FL SCY']     # season bests, oldest first
+
+    python3 scripts/swimmer_profiles.py            # bring profiles up to date
+    python3 scripts/swimmer_profiles.py --rebuild
+"""
+
+import argparse
+import hashlib
+import json
+
+import pandas as pd
+
+from best_times import best_per_group
+from name_resolver import NameResolver
+from swim_db import DB_FILE, SWIM_COLUMNS, SwimDB
+from swim_store import UNKNOWN_PARTITION
+from time_parser import NO_TIME_HUNDREDTHS
+
+# Bump when the profile contents change to force a rebuild
+PROFILE_VERSION = 3
+
+# Swims that count toward bests, all-time ranks and progression
+TEAM = 'Tanque Verde'
+COURSE = 'scy'
+
+# Meet name substrings that identify state meets
+STATE_MEETS = ('State', 'AIA')
+
+PB_COLUMNS = ['Name', 'Gender', 'Event', 'event_code', 'event_course', 'SwimTime',
+              'time_hundredths', 'SwimDate', 'season', 'grade', 'MeetName', 'swims']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profile_sources (
+    source TEXT PRIMARY KEY, sha256 TEXT
+);
+CREATE TABLE IF NOT EXISTS profile_members (
+    source TEXT, Name TEXT, Gender TEXT
+);
+CREATE INDEX IF NOT EXISTS profile_members_source ON profile_members (source);
+CREATE TABLE IF NOT EXISTS profiles (
+    Name TEXT, Gender TEXT, profile TEXT,
+    PRIMARY KEY (Name, Gender)
+);
+CREATE TABLE IF NOT EXISTS personal_bests (
+    Name TEXT, Gender TEXT, Event TEXT, event_code TEXT, event_course TEXT,
+    SwimTime TEXT, time_hundredths INTEGER, SwimDate TEXT, season TEXT, grade INTEGER,
+    MeetName TEXT, swims INTEGER, alltime_rank INTEGER
+);
+CREATE INDEX IF NOT EXISTS personal_bests_swimmer ON personal_bests (Name, Gender);
+CREATE INDEX IF NOT EXISTS personal_bests_event_time ON personal_bests (Gender, Event, time_hundredths)
+"""
+
+PROFILE_TABLES = ('profile_sources', 'profile_members', 'profiles', 'personal_bests')
+
+# Profile stores already opened in this process, keyed by database path
+_opened: dict[str, 'SwimmerProfiles'] = {}
+
+
+def _value(value):
+    """JSON-safe scalar (NaN/NA -> None, numpy -> Python)"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return value.item() if hasattr(value, 'item') else value
+
+
+def _swim(row: dict, *columns: str) -> dict:
+    swim = {column: _value(row[column]) for column in columns}
+    # grade is read as float when some swims have none
+    if swim.get('grade') is not None:
+        swim['grade'] = int(swim['grade'])
+    return swim
+
+
+def build_profiles(swims: pd.DataFrame, resolver: NameResolver) -> tuple[dict, pd.DataFrame]:
+    """
+    Profiles for every swimmer in a frame of individual swims, in one
+    grouped pass per statistic. Names are resolved to preferred names first.
+
+    Returns ({(Name, Gender): profile}, personal bests frame).
+    """
+    if swims.empty:
+        return {}, pd.DataFrame(columns=PB_COLUMNS)
+
+    swimmer = ['Name', 'Gender']
+    swims = swims.dropna(subset=swimmer).reset_index(drop=True)
+    swims['Name'] = resolver.resolve_series(swims['Name'])
+
+    team = swims[(swims['Team'] == TEAM) & (swims['event_course'] == COURSE)]
+    bests = best_per_group(team, swimmer + ['Event'])
+    counts = team.groupby(swimmer + ['Event']).size().rename('swims').reset_index()
+    bests = bests.merge(counts, on=swimmer + ['Event'], how='left')[PB_COLUMNS]
+
+    dated = team[team['season'] != UNKNOWN_PARTITION]
+    season_bests = best_per_group(dated, swimmer + ['Event', 'season']).sort_values(
+        swimmer + ['Event', 'season'], kind='stable')
+
+    is_state = swims['MeetName'].str.contains('|'.join(STATE_MEETS), case=False, na=False)
+    state = swims[is_state & swims['year'].notna()]
+
+    summary = swims.groupby(swimmer, sort=False).agg(
+        swims=('Event', 'size'),
+        source_file=('source_file', 'first'),
+        years_active=('year', lambda years: sorted(int(y) for y in years.dropna().unique())),
+    )
+    state_counts = state.groupby(swimmer).size()
+
+    profiles = {}
+    for key, row in summary.iterrows():
+        profiles[key] = {
+            'name': key[0],
+            'gender': key[1],
+            'source_file': _value(row['source_file']),
+            'swims': int(row['swims']),
+            'state_swims': int(state_counts.get(key, 0)),
+            'years_active': row['years_active'],
+            'progression': {},
+            'state_history': [],
+        }
+
+    for row in season_bests.to_dict('records'):
+        profiles[(row['Name'], row['Gender'])]['progression'].setdefault(row['Event'], []).append(
+            _swim(row, 'season', 'SwimTime', 'time_hundredths', 'SwimDate', 'grade',
+                  'MeetName', 'event_code', 'event_course'))
+
+    for (name, gender, year), year_df in state.groupby(swimmer + ['year'], sort=True):
+        profiles[(name, gender)]['state_history'].append({
+            'year': int(year),
+            'events': [_swim(row, 'Event', 'SwimTime', 'MeetName') for row in year_df.to_dict('records')],
+        })
+
+    return profiles, bests
+
+
+class SwimmerProfiles:
+    """Per-swimmer profiles kept in the swim database, updated incrementally"""
+
+    def __init__(self, db: SwimDB, resolver: NameResolver | None = None):
+        self.db = db
+        self.conn = db.conn
+        self.resolver = resolver or NameResolver.load()
+        self._create()
+
+    @classmethod
+    def open(cls, path=DB_FILE, refresh: bool = True) -> 'SwimmerProfiles':
+        """Profiles for the database at path, brought up to date once per process"""
+        profiles = _opened.get(str(path))
+        if profiles is None:
+            profiles = _opened[str(path)] = cls(SwimDB.open(path, refresh=refresh))
+            if refresh:
+                profiles.update(verbose=False)
+        return profiles
+
+    def _create(self):
+        """Create the profile tables, dropping them if built by another version"""
+        self.conn.execute('BEGIN IMMEDIATE')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS profile_state (key TEXT PRIMARY KEY, value TEXT)')
+        version = self.conn.execute("SELECT value FROM profile_state WHERE key = 'version'").fetchone()
+        if version is None or int(version[0]) != PROFILE_VERSION:
+            for table in PROFILE_TABLES:
+                self.conn.execute(f'DROP TABLE IF EXISTS {table}')
+            self.conn.execute("INSERT OR REPLACE INTO profile_state VALUES ('version', ?)",
+                              (str(PROFILE_VERSION),))
+        for statement in SCHEMA.split(';'):
+            if statement.strip():
+                self.conn.execute(statement)
+        self.conn.execute('COMMIT')
+
+    def _aliases_hash(self) -> str:
+        return hashlib.sha256(json.dumps(self.resolver.aliases, sort_keys=True).encode()).hexdigest()
+
+    def _members(self, source: str) -> set:
+        """(preferred name, gender) of every swimmer with individual swims in a source"""
+        rows = self.conn.execute(
+            'SELECT DISTINCT Name, Gender FROM swims WHERE source = ? AND is_relay = 0 '
+            'AND Name IS NOT NULL AND Gender IS NOT NULL', (source,))
+        return {(self.resolver.canonical(name), gender) for name, gender in rows}
+
+    def update(self, verbose: bool = True) -> dict:
+        """Rebuild the profiles of swimmers whose swims changed since the last update"""
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            # Profiles group swims by preferred name, so new aliases rebuild them all
+            aliases_hash = self._aliases_hash()
+            built_aliases = self.conn.execute("SELECT value FROM profile_state WHERE key = 'aliases'").fetchone()
+            if built_aliases is None or built_aliases[0] != aliases_hash:
+                for table in PROFILE_TABLES:
+                    self.conn.execute(f'DELETE FROM {table}')
+                self.conn.execute("INSERT OR REPLACE INTO profile_state VALUES ('aliases', ?)", (aliases_hash,))
+
+            current = dict(self.conn.execute(
+                "SELECT source, sha256 FROM sources WHERE source LIKE 'swims/%'"))
+            built = dict(self.conn.execute('SELECT source, sha256 FROM profile_sources'))
+            changed = {source for source in set(current) | set(built)
+                       if current.get(source) != built.get(source)}
+
+            swimmers = set()
+            for source in changed:
+                swimmers.update(self.conn.execute(
+                    'SELECT Name, Gender FROM profile_members WHERE source = ?', (source,)))
+                swimmers.update(self._members(source))
+
+            if swimmers:
+                self._rebuild(swimmers, full=not built)
+
+            for source in changed:
+                self.conn.execute('DELETE FROM profile_members WHERE source = ?', (source,))
+                self.conn.execute('DELETE FROM profile_sources WHERE source = ?', (source,))
+                if source in current:
+                    self.conn.executemany('INSERT INTO profile_members VALUES (?, ?, ?)',
+                                          [(source, name, gender) for name, gender in self._members(source)])
+                    self.conn.execute('INSERT INTO profile_sources VALUES (?, ?)', (source, current[source]))
+            self.conn.execute('COMMIT')
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            raise
+
+        summary = {'sources_changed': len(changed), 'swimmers': len(swimmers)}
+        if verbose:
+            print(f"👤 Swimmer profiles: {len(changed)} changed partitions, "
+                  f"{len(swimmers)} profiles rebuilt")
+        return summary
+
+    def _swims_for(self, swimmers: set, full: bool) -> pd.DataFrame:
+        """Individual swims of a set of swimmers, under any of their names (every swim for a full build)"""
+        if full:
+            return self.db.swims(kind='individual')
+        names = self.conn.execute(
+            'SELECT DISTINCT Name, Gender FROM swims WHERE is_relay = 0 '
+            'AND Name IS NOT NULL AND Gender IS NOT NULL')
+        frames = [self.db.query(f'SELECT rowid, {", ".join(SWIM_COLUMNS)} FROM swims '
+                                'WHERE Name = ? AND Gender = ? AND is_relay = 0', [name, gender])
+                  for name, gender in names if (self.resolver.canonical(name), gender) in swimmers]
+        if not frames:
+            return pd.DataFrame()
+        # Load order across a swimmer's names, as in a full build
+        swims = pd.concat(frames, ignore_index=True).sort_values('rowid', kind='stable')
+        return swims.drop(columns='rowid').reset_index(drop=True)
+
+    def _rebuild(self, swimmers: set, full: bool):
+        profiles, bests = build_profiles(self._swims_for(swimmers, full), self.resolver)
+
+        # Events whose ranking changes: the swimmers' old and new bests
+        events = set(bests[['Gender', 'Event']].itertuples(index=False, name=None))
+        for name, gender in swimmers:
+            events.update(self.conn.execute(
+                'SELECT Gender, Event FROM personal_bests WHERE Name = ? AND Gender = ?', (name, gender)))
+            self.conn.execute('DELETE FROM profiles WHERE Name = ? AND Gender = ?', (name, gender))
+            self.conn.execute('DELETE FROM personal_bests WHERE Name = ? AND Gender = ?', (name, gender))
+        self.conn.executemany('INSERT INTO profiles VALUES (?, ?, ?)',
+                              [(name, gender, json.dumps(profile))
+                               for (name, gender), profile in profiles.items()])
+        rows = [tuple(_value(v) for v in row) + (None,)
+                for row in bests[PB_COLUMNS].itertuples(index=False, name=None)]
+        self.conn.executemany(
+            f'INSERT INTO personal_bests VALUES ({", ".join("?" * (len(PB_COLUMNS) + 1))})', rows)
+
+        # All-time ranks shift only in the events whose bests changed
+        for gender, event in events:
+            self.conn.execute("""
+                UPDATE personal_bests SET alltime_rank = (
+                    SELECT position FROM (
+                        SELECT rowid AS id, ROW_NUMBER() OVER (
+                            ORDER BY time_hundredths, SwimDate IS NULL, SwimDate, rowid) AS position
+                        FROM personal_bests
+                        WHERE Gender = ? AND Event = ? AND time_hundredths < ?)
+                    WHERE id = personal_bests.rowid)
+                WHERE Gender = ? AND Event = ?""",
+                (gender, event, NO_TIME_HUNDREDTHS, gender, event))
+
+    def get(self, name: str, gender: str | None = None) -> dict | None:
+        """A swimmer's profile (by any of their names), with 'bests' by event; None if no swims"""
+        sql = 'SELECT Name, Gender, profile FROM profiles WHERE Name = ?'
+        params = [self.resolver.canonical(name)]
+        if gender is not None:
+            sql += ' AND Gender = ?'
+            params.append(gender)
+        row = self.conn.execute(sql + ' ORDER BY Gender LIMIT 1', params).fetchone()
+        if row is None:
+            return None
+        profile = json.loads(row[2])
+        bests = self.db.query('SELECT * FROM personal_bests WHERE Name = ? AND Gender = ? ORDER BY Event',
+                              [row[0], row[1]])
+        profile['bests'] = {
+            best['Event']: {column: _value(value) for column, value in best.items()}
+            for best in bests.to_dict('records')
+        }
+        return profile
+
+    def rebuild(self):
+        """Drop every profile and build them all again"""
+        self.conn.execute('BEGIN IMMEDIATE')
+        for table in PROFILE_TABLES:
+            self.conn.execute(f'DELETE FROM {table}')
+        self.conn.execute('COMMIT')
+        return self.update()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the per-swimmer profile store')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild every profile')
+    args = parser.parse_args()
+
+    print("\n🏊 Building Swimmer Profiles\n")
+    db = SwimDB.open(refresh=False)
+    db.refresh()
+    profiles = SwimmerProfiles(db)
+    if args.rebuild:
+        profiles.rebuild()
+    else:
+        profiles.update()
+    count = profiles.conn.execute('SELECT COUNT(*) FROM profiles').fetchone()[0]
+    print(f"  {count:,} profiles")
+    print("\n✓ Swimmer Profiles Complete!\n")
+
+
+if __name__ == '__main__':
+    main()
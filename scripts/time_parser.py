@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Shared swim time parsing, the counterpart to time_formatter.py.
+
+Accepts "SS.ss", "M:SS.ss" and "H:MM:SS.ss" strings, with markdown bold
+markers and trailing qualifier letters (e.g. "52.48q") tolerated. Anything
+that is not a time - DQ, DNF, DNS, SCR, NT, blanks or garbage - parses to an
+explicit sentinel that sorts after every real time:
+
+    NO_TIME             float('inf')   for seconds
+    NO_TIME_HUNDREDTHS  2**31 - 1      for integer hundredths (int32 max)
+
+Fractions beyond hundredths are truncated, as in official timing.
+
+The Series/array functions (parse_times, format_times, time_statuses) parse
+a whole column in one vectorized pass and import pandas on first use; the
+scalar helpers (parse_time, parse_hundredths, format_time, time_status) are
+stdlib-only so the markdown and JSON scripts stay pandas-free.
+"""
+
+import re
+
+NO_TIME = float('inf')
+NO_TIME_HUNDREDTHS = 2**31 - 1
+
+STATUS_CODES = ('DQ', 'DNF', 'DNS', 'DFS', 'SCR', 'NT', 'NS')
+
+# [hours:][minutes:]seconds[.fraction]
+TIME_PATTERN = r'^(?:(\d+):)?(?:(\d+):)?(\d+)(?:\.(\d*))?$'
+_TIME_RE = re.compile(TIME_PATTERN)
+_QUALIFIER_RE = re.compile(r'[A-Za-z]+$')
+
+
+def _clean(value) -> str:
+    """Strip whitespace and markdown bold markers"""
+    if value is None or value != value:  # None or NaN
+        return ''
+    return str(value).replace('*', '').strip()
+
+
+def time_status(value) -> str | None:
+    """Status code (DQ, NT, ...) for a non-time result, or None"""
+    text = _clean(value).upper()
+    return text if text in STATUS_CODES else None
+
+
+def parse_hundredths(value) -> int:
+    """Convert one swim time to integer hundredths (NO_TIME_HUNDREDTHS if none)"""
+    text = _QUALIFIER_RE.sub('', _clean(value))
+    match = _TIME_RE.match(text)
+    if not match:
+        return NO_TIME_HUNDREDTHS
+
+    first, second, whole, fraction = match.groups()
+    if second is not None:
+        hours, minutes = int(first), int(second)
+    else:
+        hours, minutes = 0, int(first or 0)
+    fraction = (fraction or '').ljust(2, '0')[:2]
+    return ((hours * 3600 + minutes * 60 + int(whole)) * 100) + int(fraction)
+
+
+def parse_time(value) -> float:
+    """Convert one swim time to seconds (NO_TIME if none)"""
+    hundredths = parse_hundredths(value)
+    if hundredths == NO_TIME_HUNDREDTHS:
+        return NO_TIME
+    return hundredths / 100
+
+
+def format_time(value, unit: str = 'seconds') -> str:
+    """Format seconds or hundredths as 'M:SS.ss' / 'SS.ss' ('—' for no time)"""
+    if value is None or value != value:
+        return '—'
+    if unit == 'hundredths':
+        if value == NO_TIME_HUNDREDTHS:
+            return '—'
+        hundredths = int(value)
+    else:
+        if value == NO_TIME:
+            return '—'
+        hundredths = int(round(value * 100))
+
+    minutes, rem = divmod(hundredths, 6000)
+    seconds, fraction = divmod(rem, 100)
+    if minutes:
+        return f"{minutes}:{seconds:02d}.{fraction:02d}"
+    return f"{seconds}.{fraction:02d}"
+
+
+def format_hundredths_as_seconds(hundredths: int) -> str:
+    """Format hundredths as plain seconds ('61.23'), as used for relay splits"""
+    return f"{hundredths // 100}.{hundredths % 100:02d}"
+
+
+def parse_times(values, unit: str = 'seconds'):
+    """
+    Parse a Series or array of swim time strings in one vectorized pass.
+
+    Args:
+        values: Series, array or list of time strings
+        unit: 'seconds' (float64) or 'hundredths' (int32)
+
+    Returns a Series aligned with the input (same index for a Series).
+    Non-times get NO_TIME / NO_TIME_HUNDREDTHS.
+    """
+    import pandas as pd
+
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    text = (
+        series.astype('string')
+        .str.replace('*', '', regex=False)
+        .str.strip()
+        .str.replace(r'[A-Za-z]+$', '', regex=True)
+    )
+    parts = text.str.extract(TIME_PATTERN)
+    parts.columns = ['first', 'second', 'whole', 'fraction']
+
+    has_hours = parts['second'].notna()
+    hours = pd.to_numeric(parts['first'].where(has_hours), errors='coerce').fillna(0)
+    minutes = pd.to_numeric(parts['second'].where(has_hours, parts['first']), errors='coerce').fillna(0)
+    whole = pd.to_numeric(parts['whole'], errors='coerce')
+    fraction = pd.to_numeric(
+        parts['fraction'].fillna('').str.ljust(2, '0').str[:2], errors='coerce'
+    ).fillna(0)
+
+    hundredths = ((hours * 3600 + minutes * 60 + whole) * 100 + fraction).astype('float64')
+
+    if unit == 'hundredths':
+        return hundredths.fillna(NO_TIME_HUNDREDTHS).astype('int32')
+    return (hundredths / 100).fillna(NO_TIME)
+
+
+def format_times(values, unit: str = 'seconds'):
+    """
+    Format a Series or array of seconds/hundredths as display strings.
+
+    Vectorized counterpart of format_time: 'M:SS.ss' at a minute or more,
+    'SS.ss' below, and '—' for NO_TIME, NO_TIME_HUNDREDTHS or missing values.
+    """
+    import pandas as pd
+
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    numeric = pd.to_numeric(series, errors='coerce').astype('float64')
+    if unit == 'hundredths':
+        missing = numeric.isna() | (numeric == NO_TIME_HUNDREDTHS)
+        hundredths = numeric
+    else:
+        missing = numeric.isna() | (numeric == NO_TIME)
+        hundredths = (numeric * 100).round()
+    hundredths = hundredths.where(~missing, 0).astype('int64')
+
+    minutes = hundredths // 6000
+    seconds = (hundredths % 6000) // 100
+    fraction = (hundredths % 100).astype(str).str.zfill(2)
+
+    short = seconds.astype(str) + '.' + fraction
+    long = minutes.astype(str) + ':' + seconds.astype(str).str.zfill(2) + '.' + fraction
+    formatted = short.where(minutes == 0, long)
+    return formatted.where(~missing, '—')
+
+
+def time_statuses(values):
+    """Vectorized time_status: status code per value, or <NA> for times"""
+    import pandas as pd
+
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    text = series.astype('string').str.replace('*', '', regex=False).str.strip().str.upper()
+    return text.where(text.isin(STATUS_CODES))
@@ -3,11 +3,26 @@
 Update the Class of 2026 senior cards in index.html with:
 1. Record badges for all records they hold (not just 2026)
 2. Complete swim history with first/last times and improvement badges
+
+All-time bests come from the swimmers' precomputed profiles
+(swimmer_profiles.py), which carry each short course personal best's
+all-time team rank.
 """
 
 import json
 import re
-from pathlib import Path
+
+from ranked_entries import EVENT_CODES
+from swimmer_profiles import SwimmerProfiles
+from time_formatter import format_date_display, format_time_display
+
+# High school events are short course yards
+EVENT_NAMES = {(event_code, 'scy'): event for event, event_code in EVENT_CODES.items()}
+GRADE_LABELS = {9: "FR", 10: "SO", 11: "JR", 12: "SR"}
+GENDER_CODES = {"boys": "M", "girls": "F"}
+
+# Personal bests ranked this high appear on the all-time Top 10 lists
+ALLTIME_TOP_N = 10
 
 def calculate_pb_badge_class(time_drop, distance):
     """Calculate PB badge color based on time drop per 50y distance"""
@@ -42,64 +57,27 @@ def calculate_pb_badge_class(time_drop, distance):
     else:
         return None
 
-def parse_time(time_str):
-    """Convert time string to seconds for comparison"""
-    if not time_str:
-        return None
-    
-    # Remove any whitespace
-    time_str = time_str.strip()
-    
-    # Handle formats: 1:23.45 or 23.45
-    if ':' in time_str:
-        parts = time_str.split(':')
-        minutes = int(parts[0])
-        seconds = float(parts[1])
-        return minutes * 60 + seconds
-    else:
-        return float(time_str)
-
 def get_alltime_bests(swimmer_name, gender):
-    """Get best times from all-time Top 10 file"""
+    """Get the swimmer's best times that rank in the all-time Top 10"""
     bests = {}
     
-    alltime_file = Path(f"records/top10-{gender}-alltime.md")
-    if not alltime_file.exists():
+    profile = SwimmerProfiles.open().get(swimmer_name, GENDER_CODES[gender])
+    if not profile:
         return bests
     
-    with open(alltime_file, 'r') as f:
-        content = f.read()
-    
-    # Find lines with this swimmer
-    pattern = rf"\|\s*\d+\s*\|\s*([\d:\.]+)\s*\|\s*{re.escape(swimmer_name)}\s*\|([^|]*)\|([^|]*)\|([^|]*)\|"
-    
-    current_event = None
-    for line in content.split('\n'):
-        # Check if this is an event header (## or ###)
-        if line.startswith('###'):
-            current_event = line.replace('###', '').strip()
-        elif line.startswith('##'):
-            current_event = line.replace('##', '').strip()
-        
-        # Check if this line has the swimmer
-        if swimmer_name in line and '|' in line:
-            match = re.search(pattern, line)
-            if match and current_event:
-                time_str = match.group(1).strip()
-                year = match.group(2).strip()
-                date_str = match.group(3).strip()
-                meet = match.group(4).strip()
-                
-                # If we don't have this event yet, or if this is a better time
-                if current_event not in bests:
-                    bests[current_event] = {
-                        'time': time_str,
-                        'time_seconds': parse_time(time_str),
-                        'year': year,
-                        'date': date_str,
-                        'meet': meet,
-                        'season': 'alltime'
-                    }
+    for best in profile['bests'].values():
+        event = EVENT_NAMES.get((best['event_code'], best['event_course']))
+        rank = best['alltime_rank']
+        if not event or rank is None or rank > ALLTIME_TOP_N:
+            continue
+        bests[event] = {
+            'time': format_time_display(best['SwimTime']),
+            'time_hundredths': best['time_hundredths'],
+            'year': GRADE_LABELS.get(best['grade'], ""),
+            'date': format_date_display(best['SwimDate']) if best['SwimDate'] else "",
+            'meet': best['MeetName'],
+            'season': 'alltime'
+        }
     
     return bests
 
@@ -120,9 +98,9 @@ def generate_senior_card(name, data):
     for event, best_time in alltime_bests.items():
         if event in history:
             # Compare times
-            if best_time['time_seconds'] < history[event]['last_swim']['time_seconds']:
+            if best_time['time_hundredths'] < history[event]['last_swim']['time_hundredths']:
                 # Update last swim
-                old_last = history[event]['last_swim']['time_seconds']
+                old_last = history[event]['last_swim']['time_hundredths']
                 history[event]['last_swim'] = best_time
                 # Don't recalculate time drop - keep the original from first swim
         else: